@@ -0,0 +1,684 @@
+from pygame import *
+import numpy as np
+import os
+import contextlib
+import hashlib
+import heapq
+import json
+import mmap
+import struct
+import time as tm
+from collections import defaultdict
+from profiling import startup_profiler
+from tracing import tracer
+
+
+def tint(rgb: np.ndarray, factors: tuple[float] = (1.5, 0.5, 0.5)) -> np.ndarray:
+  return rgb*np.array(factors, dtype=np.float32)
+
+def flash(rgb: np.ndarray, amount: float = 0.6, c: tuple[int] = (255, 255, 255)) -> np.ndarray:
+  return rgb + (np.array(c, dtype=np.float32) - rgb)*amount
+
+def brightness(rgb: np.ndarray, factor: float = 1.3) -> np.ndarray:
+  return rgb*factor
+
+def desaturate(rgb: np.ndarray, amount: float = 1.0) -> np.ndarray:
+  luma = (rgb @ np.array((0.299, 0.587, 0.114), dtype=np.float32))[..., None]
+  return rgb + (luma - rgb)*amount
+
+EFFECTS = {
+  'tint': tint,
+  'flash': flash,
+  'brightness': brightness,
+  'desaturate': desaturate,
+}
+
+def apply_effect(original: Surface, name: str, threshold: int = 0, **params) -> Surface:
+  sprite = original.copy()
+  pixel_array = surfarray.pixels3d(sprite)
+  rgb = pixel_array.astype(np.float32)
+  mask = rgb.sum(axis=2)/3 > threshold
+  pixel_array[mask] = np.clip(EFFECTS[name](rgb[mask], **params), 0, 255).astype(np.uint8)
+  del pixel_array
+  return sprite
+
+
+class RotationSheet:
+  def __init__(self, sprite: Surface, step: int) -> None:
+    self.__sprite = sprite
+    self.step = step
+    self.__frames = {0: sprite}
+    angle = step
+    while angle < 360 + step:
+      self.__frames[angle] = transform.rotate(sprite, angle)
+      angle += step
+
+  def __getitem__(self, angle: int) -> Surface:
+    frame = self.__frames.get(angle)
+    if frame is None:
+      frame = transform.rotate(self.__sprite, angle)
+      self.__frames[angle] = frame
+    return frame
+
+  def __len__(self) -> int:
+    return len(self.__frames)
+
+  def __iter__(self):
+    return iter(self.__frames.values())
+
+  def resident_bytes(self) -> int:
+    return sum(i.get_bytesize()*i.get_width()*i.get_height() for i in self.__frames.values())
+
+
+class AssetBundle:
+  MAGIC = b'AXB1'
+
+  def __init__(self, path: str, resolution: tuple[int]) -> None:
+    self.path = path
+    self.resolution = [int(resolution[0]), int(resolution[1])]
+    screen = display.get_surface()
+    self.pixel_format = [screen.get_bitsize(), *screen.get_masks()] if screen is not None else None
+    self.__index = {}
+    self.__map = None
+    self.__view = None
+    self.__base = 0
+    self.hits = 0
+    self.stale = 0
+    self.__open()
+
+  def __open(self) -> None:
+    try:
+      f = open(self.path, 'rb')
+    except OSError:
+      return
+    with f:
+      if f.read(4) != self.MAGIC:
+        return
+      header_len = struct.unpack('<I', f.read(4))[0]
+      header = json.loads(f.read(header_len))
+      if header['resolution'] != self.resolution or header['pixel_format'] != self.pixel_format:
+        return
+      self.__map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    self.__view = memoryview(self.__map)
+    self.__base = 8 + header_len
+    for entry in header['entries']:
+      path, size, alpha, colorkey = entry['key']
+      key = (path, tuple(size) if size is not None else None, alpha, tuple(colorkey) if colorkey is not None else None)
+      self.__index[key] = entry
+
+  def close(self) -> None:
+    self.__index = {}
+    if self.__view is not None:
+      self.__view.release()
+      self.__view = None
+    if self.__map is not None:
+      self.__map.close()
+      self.__map = None
+
+  def __len__(self) -> int:
+    return len(self.__index)
+
+  def keys_for(self, owner: str|None) -> list[tuple]:
+    return [key for key, entry in self.__index.items() if owner in entry.get('owners', ())]
+
+  def load(self, key: tuple) -> Surface|None:
+    entry = self.__index.get(key)
+    if entry is None:
+      return None
+    try:
+      stat = os.stat(key[0])
+    except OSError:
+      return None
+    if stat.st_mtime_ns != entry['mtime_ns'] or stat.st_size != entry['source_bytes']:
+      self.stale += 1
+      return None
+    start = self.__base + entry['offset']
+    sprite = Surface(entry['size'], SRCALPHA if key[2] else 0, entry['depth'], entry['masks'])
+    if sprite.get_pitch() != entry['pitch']:
+      return None
+    memoryview(sprite.get_view('0')).cast('B')[:] = self.__view[start:start + entry['length']]
+    self.hits += 1
+    return sprite
+
+  def save(self, surfaces: dict, owners: dict) -> None:
+    entries = []
+    blobs = []
+    offset = 0
+    for key, sprite in surfaces.items():
+      try:
+        stat = os.stat(key[0])
+      except OSError:
+        continue
+      data = sprite.get_buffer().raw
+      previous = self.__index.get(key, {}).get('owners', [])
+      entries.append({
+        'key': list(key),
+        'owners': sorted(set(previous) | owners.get(key, set()), key=str),
+        'mtime_ns': stat.st_mtime_ns,
+        'source_bytes': stat.st_size,
+        'offset': offset,
+        'length': len(data),
+        'size': list(sprite.get_size()),
+        'depth': sprite.get_bitsize(),
+        'masks': list(sprite.get_masks()),
+        'pitch': sprite.get_pitch(),
+      })
+      blobs.append(data)
+      offset += len(data)
+    for key, entry in self.__index.items():
+      if key in surfaces:
+        continue
+      try:
+        stat = os.stat(key[0])
+      except OSError:
+        continue
+      if stat.st_mtime_ns != entry['mtime_ns'] or stat.st_size != entry['source_bytes']:
+        continue
+      start = self.__base + entry['offset']
+      blobs.append(self.__view[start:start + entry['length']].tobytes())
+      entries.append(dict(entry, offset=offset))
+      offset += entry['length']
+    header = json.dumps({'resolution': self.resolution, 'pixel_format': self.pixel_format, 'entries': entries}).encode()
+    os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+    tmp = self.path + '.tmp'
+    with open(tmp, 'wb') as f:
+      f.write(self.MAGIC)
+      f.write(struct.pack('<I', len(header)))
+      f.write(header)
+      for i in blobs:
+        f.write(i)
+    self.close()
+    os.replace(tmp, self.path)
+    self.__open()
+
+
+class SpriteCache:
+  def __init__(self) -> None:
+    self.__surfaces = {}
+    self.__keys = {}
+    self.__sheets = {}
+    self.__effects = {}
+    self.__masks = {}
+    self.__bundle = None
+    self.__bundle_dirty = False
+    self.__owners = {}
+    self.__scope = None
+    self.hits = 0
+    self.misses = 0
+
+  def __make_key(self, path: str, size: tuple[int]|None, alpha: bool, colorkey: tuple[int]|None) -> tuple:
+    if size is not None:
+      size = (int(size[0]), int(size[1]))
+    if colorkey is not None:
+      colorkey = tuple(colorkey)
+    return (os.path.normpath(path), size, alpha, colorkey)
+
+  def __load(self, key: tuple) -> Surface:
+    path, size, alpha, colorkey = key
+    start = tm.perf_counter()
+    sprite = None
+    if self.__bundle is not None:
+      sprite = self.__bundle.load(key)
+    if sprite is None:
+      sprite = image.load(path)
+      if alpha:
+        sprite = sprite.convert_alpha()
+      else:
+        sprite = sprite.convert()
+      if size is not None:
+        sprite = transform.scale(sprite, size)
+      self.__bundle_dirty = True
+    if colorkey is not None:
+      sprite.set_colorkey(colorkey)
+    end = tm.perf_counter()
+    startup_profiler.record('assets', os.path.dirname(path) or '.', end - start)
+    tracer.complete('load sprite', 'assets', start, end, {'path': path})
+    return sprite
+
+  def get(self, path: str, size: tuple[int]|None = None, alpha: bool = False, colorkey: tuple[int]|None = None) -> Surface:
+    key = self.__make_key(path, size, alpha, colorkey)
+    self.__owners.setdefault(key, set()).add(self.__scope)
+    sprite = self.__surfaces.get(key)
+    if sprite is not None:
+      self.hits += 1
+      return sprite
+    self.misses += 1
+    sprite = self.__load(key)
+    self.__surfaces[key] = sprite
+    self.__keys[id(sprite)] = key
+    return sprite
+
+  @contextlib.contextmanager
+  def scope(self, owner: str):
+    previous = self.__scope
+    self.__scope = owner
+    try:
+      yield
+    finally:
+      self.__scope = previous
+
+  def release(self, owner: str) -> int:
+    freed = self.resident_bytes()
+    for key, owners in list(self.__owners.items()):
+      owners.discard(owner)
+      if owners:
+        continue
+      del self.__owners[key]
+      sprite = self.__surfaces.pop(key, None)
+      if sprite is not None:
+        self.__keys.pop(id(sprite), None)
+      for i in [i for i in self.__sheets if i[0] == key]:
+        del self.__sheets[i]
+      for i in [i for i in self.__effects if i[0] == key]:
+        del self.__effects[i]
+    live = {id(i) for i in self.__surfaces.values()} | {id(i[1]) for i in self.__effects.values()}
+    live |= {id(frame) for i in self.__sheets.values() for frame in i[1]}
+    for i in [i for i in self.__masks if i not in live]:
+      del self.__masks[i]
+    return freed - self.resident_bytes()
+
+  def attach_bundle(self, bundle: AssetBundle) -> None:
+    self.__bundle = bundle
+
+  def manifest(self, owner: str|None) -> list[tuple]:
+    if self.__bundle is None:
+      return []
+    return self.__bundle.keys_for(owner)
+
+  def is_loaded(self, key: tuple) -> bool:
+    return key in self.__surfaces
+
+  def save_bundle(self) -> None:
+    if self.__bundle is not None and self.__bundle_dirty:
+      self.__bundle.save(self.__surfaces, self.__owners)
+      self.__bundle_dirty = False
+
+  def key_of(self, sprite: Surface) -> tuple|None:
+    return self.__keys.get(id(sprite))
+
+  def rotations(self, sprite: Surface, step: int) -> RotationSheet:
+    key = (self.key_of(sprite) or id(sprite), step)
+    entry = self.__sheets.get(key)
+    if entry is not None:
+      self.hits += 1
+      return entry[1]
+    self.misses += 1
+    sheet = RotationSheet(sprite, step)
+    self.__sheets[key] = (sprite, sheet)
+    return sheet
+
+  def effect(self, sprite: Surface, name: str, threshold: int = 0, **params) -> Surface:
+    key = (self.key_of(sprite) or id(sprite), name, threshold, tuple(sorted(params.items())))
+    entry = self.__effects.get(key)
+    if entry is not None:
+      self.hits += 1
+      return entry[1]
+    self.misses += 1
+    variant = apply_effect(sprite, name, threshold, **params)
+    self.__effects[key] = (sprite, variant)
+    return variant
+
+  def mask(self, sprite: Surface) -> mask.Mask:
+    entry = self.__masks.get(id(sprite))
+    if entry is not None:
+      return entry[1]
+    source = sprite
+    if sprite.get_flags() & SRCALPHA and sprite.get_colorkey() is not None:
+      source = sprite.copy()
+      source.set_colorkey(None)
+    collision_mask = mask.from_surface(source)
+    self.__masks[id(sprite)] = (sprite, collision_mask)
+    return collision_mask
+
+  def resident_bytes(self) -> int:
+    surfaces = [i for i in self.__surfaces.values()] + [i[1] for i in self.__effects.values()]
+    surfaces = sum(i.get_bytesize()*i.get_width()*i.get_height() for i in surfaces)
+    masks = sum(i[1].get_size()[0]*i[1].get_size()[1]//8 for i in self.__masks.values())
+    return surfaces + masks + sum(i[1].resident_bytes() for i in self.__sheets.values())
+
+  def report(self) -> dict:
+    return {
+      'entries': len(self.__surfaces),
+      'rotation_sheets': len(self.__sheets),
+      'effect_variants': len(self.__effects),
+      'masks': len(self.__masks),
+      'bundle_hits': self.__bundle.hits if self.__bundle is not None else 0,
+      'hits': self.hits,
+      'misses': self.misses,
+      'resident_bytes': self.resident_bytes(),
+    }
+
+  def clear(self) -> None:
+    self.__surfaces.clear()
+    self.__keys.clear()
+    self.__sheets.clear()
+    self.__effects.clear()
+    self.__masks.clear()
+    self.__owners.clear()
+
+
+class IncrementalLoader:
+  def __init__(self, cache: SpriteCache, budget_ms: float = 4.0) -> None:
+    self.budget_ms = budget_ms
+    self.__cache = cache
+    self.__pending = []
+    self.__queued = 0
+    self.__total = defaultdict(int)
+    self.__done = defaultdict(int)
+
+  def queue(self, owner: str, priority: int) -> int:
+    count = 0
+    for key in self.__cache.manifest(owner):
+      if self.__cache.is_loaded(key):
+        continue
+      heapq.heappush(self.__pending, (priority, self.__queued, owner, key))
+      self.__queued += 1
+      count += 1
+    self.__total[owner] += count
+    return count
+
+  def __load(self, owner: str, key: tuple) -> None:
+    with self.__cache.scope(owner):
+      self.__cache.get(*key)
+    self.__done[owner] += 1
+
+  def step(self, budget_ms: float|None = None) -> int:
+    budget = (self.budget_ms if budget_ms is None else budget_ms)/1000
+    start = tm.perf_counter()
+    loaded = 0
+    while self.__pending and tm.perf_counter() - start < budget:
+      _, _, owner, key = heapq.heappop(self.__pending)
+      self.__load(owner, key)
+      loaded += 1
+    return loaded
+
+  def flush(self, owner: str|None = None) -> int:
+    keep = []
+    loaded = 0
+    for item in sorted(self.__pending):
+      if owner is None or item[2] == owner:
+        self.__load(item[2], item[3])
+        loaded += 1
+      else:
+        keep.append(item)
+    self.__pending = keep
+    return loaded
+
+  def pending(self, owner: str|None = None) -> int:
+    return sum(1 for i in self.__pending if owner is None or i[2] == owner)
+
+  def progress(self, owner: str|None = None) -> float:
+    if owner is None:
+      total, done = sum(self.__total.values()), sum(self.__done.values())
+    else:
+      total, done = self.__total[owner], self.__done[owner]
+    return done/total if total else 1.0
+
+
+class PcmCache:
+  MAGIC = b'AXP1'
+  HEADER = struct.Struct('<4sQ')
+
+  def __init__(self, directory: str) -> None:
+    self.directory = directory
+    self.hits = 0
+    self.misses = 0
+
+  def __path_of(self, path: str) -> str|None:
+    settings = mixer.get_init()
+    if not settings:
+      return None
+    try:
+      with open(path, 'rb') as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    except OSError:
+      return None
+    return os.path.join(self.directory, f'{digest}-{settings[0]}-{settings[1]}-{settings[2]}.pcm')
+
+  def load(self, path: str) -> mixer.Sound:
+    cached = self.__path_of(path)
+    if cached is not None:
+      try:
+        with open(cached, 'rb') as f:
+          data = f.read()
+      except OSError:
+        data = None
+      if data is not None:
+        if len(data) >= self.HEADER.size and self.HEADER.unpack_from(data) == (self.MAGIC, len(data) - self.HEADER.size):
+          sound = mixer.Sound(buffer=data[self.HEADER.size:])
+          self.hits += 1
+          return sound
+        with contextlib.suppress(OSError):
+          os.remove(cached)
+    self.misses += 1
+    sound = mixer.Sound(path)
+    if cached is not None:
+      raw = sound.get_raw()
+      try:
+        os.makedirs(self.directory, exist_ok=True)
+        with open(cached + '.tmp', 'wb') as f:
+          f.write(self.HEADER.pack(self.MAGIC, len(raw)))
+          f.write(raw)
+        os.replace(cached + '.tmp', cached)
+      except OSError:
+        with contextlib.suppress(OSError):
+          os.remove(cached + '.tmp')
+    return sound
+
+
+class SoundHandle:
+  def __init__(self, sound: mixer.Sound, volume: float) -> None:
+    self.__sound = sound
+    self.__volume = volume
+    self.__channels = []
+
+  def play(self, loops: int = 0) -> mixer.Channel|None:
+    channel = self.__sound.play(loops)
+    if channel is not None:
+      channel.set_volume(self.__volume)
+      self.__channels = [i for i in self.__channels if i.get_sound() is self.__sound]
+      self.__channels.append(channel)
+    return channel
+
+  def stop(self) -> None:
+    for i in self.__channels:
+      if i.get_sound() is self.__sound:
+        i.stop()
+    self.__channels = []
+
+  def set_playing_volume(self, volume: float) -> None:
+    for i in self.__channels:
+      if i.get_sound() is self.__sound:
+        i.set_volume(volume)
+
+  def get_volume(self) -> float:
+    return self.__volume
+
+  def get_sound(self) -> mixer.Sound:
+    return self.__sound
+
+
+class SilentHandle:
+  def __init__(self) -> None:
+    self.plays = 0
+
+  def play(self, loops: int = 0) -> None:
+    self.plays += 1
+    return None
+
+  def stop(self) -> None:
+    pass
+
+  def set_playing_volume(self, volume: float) -> None:
+    pass
+
+  def get_volume(self) -> float:
+    return 0.0
+
+  def get_sound(self) -> None:
+    return None
+
+
+class SoundBank:
+  def __init__(self, volumes: dict) -> None:
+    self.__volumes = {os.path.normpath(k): v for k, v in volumes.items()}
+    self.__sounds = {}
+    self.__handles = {}
+    self.__owners = {}
+    self.__scope = None
+    self.__pcm = None
+    self.__silent = None
+    self.hits = 0
+    self.misses = 0
+
+  def mute(self) -> SilentHandle:
+    self.__silent = SilentHandle()
+    return self.__silent
+
+  def attach_cache(self, pcm: PcmCache) -> None:
+    self.__pcm = pcm
+
+  def get(self, path: str, volume: float|None = None) -> SoundHandle|SilentHandle:
+    if self.__silent is not None:
+      return self.__silent
+    path = os.path.normpath(path)
+    if volume is None:
+      volume = self.__volumes.get(path, 1.0)
+    key = (path, volume)
+    self.__owners.setdefault(path, set()).add(self.__scope)
+    handle = self.__handles.get(key)
+    if handle is not None:
+      self.hits += 1
+      return handle
+    sound = self.__sounds.get(path)
+    if sound is None:
+      self.misses += 1
+      with startup_profiler.section('assets', os.path.dirname(path) or '.'), tracer.span('load sound', 'assets', {'path': path}):
+        sound = self.__pcm.load(path) if self.__pcm is not None else mixer.Sound(path)
+      self.__sounds[path] = sound
+    else:
+      self.hits += 1
+    handle = SoundHandle(sound, volume)
+    self.__handles[key] = handle
+    return handle
+
+  @contextlib.contextmanager
+  def scope(self, owner: str):
+    previous = self.__scope
+    self.__scope = owner
+    try:
+      yield
+    finally:
+      self.__scope = previous
+
+  def release(self, owner: str) -> int:
+    freed = self.resident_bytes()
+    for path, owners in list(self.__owners.items()):
+      owners.discard(owner)
+      if owners:
+        continue
+      del self.__owners[path]
+      self.__sounds.pop(path, None)
+      for i in [i for i in self.__handles if i[0] == path]:
+        del self.__handles[i]
+    return freed - self.resident_bytes()
+
+  def resident_bytes(self) -> int:
+    return sum(i.get_raw().__len__() for i in self.__sounds.values())
+
+  def report(self) -> dict:
+    return {
+      'entries': len(self.__sounds),
+      'handles': len(self.__handles),
+      'hits': self.hits,
+      'misses': self.misses,
+      'pcm_hits': self.__pcm.hits if self.__pcm is not None else 0,
+      'resident_bytes': self.resident_bytes(),
+    }
+
+  def clear(self) -> None:
+    self.__sounds.clear()
+    self.__handles.clear()
+    self.__owners.clear()
+
+
+class FontCache:
+  def __init__(self) -> None:
+    self.__fonts = {}
+    self.hits = 0
+    self.misses = 0
+
+  def get(self, file: str, size: int) -> font.Font:
+    key = (os.path.normpath(file), int(size))
+    cached = self.__fonts.get(key)
+    if cached is not None:
+      self.hits += 1
+      return cached
+    self.misses += 1
+    cached = font.Font(key[0], key[1])
+    self.__fonts[key] = cached
+    return cached
+
+  def report(self) -> dict:
+    return {
+      'entries': len(self.__fonts),
+      'hits': self.hits,
+      'misses': self.misses,
+    }
+
+  def clear(self) -> None:
+    self.__fonts.clear()
+
+
+SOUND_VOLUMES = {
+  './Soundeffects/Hover.mp3': 0.08,
+  './Soundeffects/Hover_Quit.mp3': 0.05,
+  './Soundeffects/Press.mp3': 0.1,
+  './Soundeffects/Their Fabricator.mp3': 0.2,
+  './Soundeffects/undertale-damage-taken.mp3': 0.08,
+  './Soundeffects/capper_shoot.mp3': 0.02,
+  './Soundeffects/undertale-ding.mp3': 0.04,
+  './Soundeffects/squeak.mp3': 0.08,
+  './Soundeffects/Mana_star.mp3': 0.01,
+  './Soundeffects/Shocker Breaker.mp3': 0.05,
+  './Soundeffects/asriels-star-blazing-summon.mp3': 0.05,
+  './Soundeffects/undertale-bomb-explosion.mp3': 0.1,
+  './Soundeffects/EidolonWyrmRoar.mp3': 0.2,
+  './Soundeffects/Terraria_boss_summon.mp3': 0.12,
+  './Soundeffects/wall-of-flesh-terraria.mp3': 0.12,
+  './Soundeffects/Normal_flowey_talking.mp3': 0.2,
+  './Soundeffects/Evil_flowey_talking.mp3': 0.2,
+  './Soundeffects/Flowey_one_letter.mp3': 0.5,
+  './Soundeffects/Omega_flowey_laugh.mp3': 0.1,
+  './Soundeffects./Sound_of_chaos.mp3': 0.7,
+  './Soundeffects/savepoint.mp3': 0.2,
+  './Soundeffects/asgorevoice.mp3': 0.2,
+  './Soundeffects/undertale-soul-shatter.mp3': 0.4,
+  './Soundeffects/FireBall.mp3': 0.5,
+  './Soundeffects/ExobladeBeamSlash.mp3': 0.4,
+  './Soundeffects/CryogenShieldBreak.mp3': 0.2,
+  './Soundeffects/CryogenDeath.mp3': 0.2,
+  './Soundeffects/BossRushTerminusDeactivate.mp3': 0.2,
+  './Soundeffects/BossRushVictory.mp3': 0.2,
+  './Soundeffects/Serenity.mp3': 0.4,
+}
+
+sprite_cache = SpriteCache()
+sound_bank = SoundBank(SOUND_VOLUMES)
+font_cache = FontCache()
+
+
+@contextlib.contextmanager
+def asset_scope(owner: str):
+  with sprite_cache.scope(owner), sound_bank.scope(owner):
+    yield
+
+def release_assets(owner: str) -> int:
+  return sprite_cache.release(owner) + sound_bank.release(owner)
+
+def memory_report() -> dict:
+  return {
+    'sprites': sprite_cache.report(),
+    'sounds': sound_bank.report(),
+    'fonts': font_cache.report(),
+  }
@@ -0,0 +1,196 @@
+import os
+import sys
+import time as tm
+from collections import defaultdict
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pygame import Rect
+import numpy as np
+from collisions import first_hits, rects_of, CollisionWorld, PLAYER, PLAYER_SHOT, STAR, BOSS
+
+
+class Probe:
+  def __init__(self, rect: Rect|list, aff: str, layer: int, mask: int) -> None:
+    self.rect = rect[0] if type(rect) == list else rect
+    self.__hitbox = rect
+    self.aff = aff
+    self.layer = layer
+    self.mask = mask
+    self.hits = []
+
+  def get_hitbox(self) -> Rect|list:
+    return self.__hitbox
+
+  def collision(self, other) -> None:
+    if type(other.get_hitbox()) != list:
+      if self.rect.colliderect(other.get_hitbox()):
+        self.hits.append(other)
+    else:
+      for i in other.get_hitbox():
+        if self.rect.colliderect(i):
+          self.hits.append(other)
+          break
+
+  def strike(self, other) -> None:
+    self.hits.append(other)
+
+
+def grid_narrowphase(good: list, evil: list, boss, player, cell_size: int = 100) -> None:
+  grid = defaultdict(list)
+  for obj in good + evil:
+    grid[(obj.rect.centerx // cell_size, obj.rect.centery // cell_size)].append(obj)
+  for (cell_x, cell_y), objects in grid.items():
+    nearby_good = []
+    nearby_evil = []
+    for dx in (-1, 0, 1):
+      for dy in (-1, 0, 1):
+        for obj in grid.get((cell_x + dx, cell_y + dy), []):
+          if obj.aff == 'good':
+            nearby_good.append(obj)
+          else:
+            nearby_evil.append(obj)
+    for obj in objects:
+      if obj.aff == 'good':
+        for enemy in nearby_evil:
+          obj.collision(enemy)
+        obj.collision(boss)
+      else:
+        obj.collision(player)
+
+
+def first_touch(rects: list[Rect], others: list[Rect]) -> int:
+  for rect in rects:
+    hit = rect.collidelist(others)
+    if hit != -1:
+      return hit
+  return -1
+
+def hitbox_table(entities: list) -> tuple[np.ndarray]:
+  boxes = []
+  owners = []
+  for i, entity in enumerate(entities):
+    for rect in rects_of(entity):
+      boxes.append((rect.left, rect.top, rect.right, rect.bottom))
+      owners.append(i)
+  return np.array(boxes, dtype=np.int32).reshape(-1, 4), np.array(owners, dtype=np.intp)
+
+def overlapping_pairs(a: np.ndarray, b: np.ndarray) -> tuple[np.ndarray]:
+  if not len(a) or not len(b):
+    return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+  order = np.argsort(b[:, 0], kind='stable')
+  lefts = b[order, 0]
+  widest = int((b[:, 2] - b[:, 0]).max())
+  lo = np.searchsorted(lefts, a[:, 0] - widest, 'right')
+  hi = np.searchsorted(lefts, a[:, 2], 'left')
+  counts = np.maximum(hi - lo, 0)
+  i = np.repeat(np.arange(len(a)), counts)
+  j = order[np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(lo, counts)]
+  hit = (a[i, 0] < b[j, 2]) & (a[i, 2] > b[j, 0]) & (a[i, 1] < b[j, 3]) & (a[i, 3] > b[j, 1])
+  i, j = i[hit], j[hit]
+  order = np.lexsort((j, i))
+  return i[order], j[order]
+
+def scalar_narrowphase(good: list, evil: list, boss, player) -> int:
+  dispatched = 0
+  evil_rects = []
+  evil_owners = []
+  for e, enemy in enumerate(evil):
+    rects = rects_of(enemy)
+    evil_rects.extend(rects)
+    evil_owners.extend([e]*len(rects))
+  boss_rects = rects_of(boss)
+  player_rects = rects_of(player)
+  for shot in good:
+    rects = rects_of(shot)
+    hit = first_touch(rects, evil_rects)
+    if hit != -1:
+      shot.strike(evil[evil_owners[hit]])
+      dispatched += 1
+    if first_touch(rects, boss_rects) != -1:
+      shot.strike(boss)
+      dispatched += 1
+  for enemy in evil:
+    if first_touch(rects_of(enemy), player_rects) != -1:
+      enemy.strike(player)
+      dispatched += 1
+  return dispatched
+
+def batch_narrowphase(good: list, evil: list, boss, player, scalar_below: int = 400) -> int:
+  if len(good)*len(evil) < scalar_below:
+    return scalar_narrowphase(good, evil, boss, player)
+  dispatched = 0
+  good_boxes, good_owners = hitbox_table(good)
+  evil_boxes, evil_owners = hitbox_table(evil)
+  for s, e in zip(*first_hits(good_owners, evil_owners, *overlapping_pairs(good_boxes, evil_boxes))):
+    good[s].strike(evil[e])
+    dispatched += 1
+  if good:
+    boss_boxes, _ = hitbox_table([boss])
+    for s in np.unique(good_owners[overlapping_pairs(good_boxes, boss_boxes)[0]]):
+      good[s].strike(boss)
+      dispatched += 1
+  if evil:
+    player_boxes, _ = hitbox_table([player])
+    for e in np.unique(evil_owners[overlapping_pairs(evil_boxes, player_boxes)[0]]):
+      evil[e].strike(player)
+      dispatched += 1
+  return dispatched
+
+def scene(n: int, seed: int = 0) -> tuple:
+  rng = np.random.default_rng(seed)
+  good = [Probe(Rect(x, y, 22, 47), 'good', PLAYER_SHOT, STAR | BOSS) for x, y in zip(rng.integers(0, 1900, n), rng.integers(0, 1040, n))]
+  evil = [Probe(Rect(x, y, 63, 63), 'evil', STAR, PLAYER) for x, y in zip(rng.integers(0, 1860, n), rng.integers(0, 1020, n))]
+  boss = Probe([Rect(700, 0, 500, 300), Rect(760, 300, 400, 40), Rect(940, 340, 38, 190)], 'evil', BOSS, 0)
+  player = Probe(Rect(930, 960, 60, 110), 'good', PLAYER, 0)
+  return good, evil, boss, player
+
+def world_narrowphase(good: list, evil: list, boss, player):
+  world = CollisionWorld()
+  for i in good + evil + [boss, player]:
+    world.add(i)
+  def tick(*scene) -> None:
+    for i in good + evil:
+      world.moved(i)
+    world.collide()
+  return tick
+
+def tunneling(interval: int, n: int = 200, speed: int = 10) -> tuple[int]:
+  rng = np.random.default_rng(1)
+  static = swept = 0
+  for x, phase in zip(rng.integers(760, 1140, n), rng.integers(0, interval, n)):
+    world = CollisionWorld()
+    target = Probe(Rect(760, 300, 400, 40), 'evil', BOSS, 0)
+    shot = Probe(Rect(x, 600, 22, 47), 'good', PLAYER_SHOT, BOSS)
+    world.add(target)
+    world.add(shot)
+    seen = False
+    for frame in range(600//speed):
+      shot.rect.move_ip(0, -speed)
+      world.moved(shot)
+      if (frame + phase)%interval == 0:
+        seen = seen or bool(world.query([shot.rect], BOSS, shot))
+        world.collide()
+    static += seen
+    swept += bool(shot.hits)
+  return static, swept
+
+def measure(setup, n: int, repeats: int) -> tuple[float, set]:
+  good, evil, boss, player = scene(n)
+  narrowphase = setup(good, evil, boss, player)
+  narrowphase(good, evil, boss, player)
+  hits = {(id(i), id(j)) for i in good + evil for j in i.hits}
+  start = tm.perf_counter()
+  for i in range(repeats):
+    narrowphase(good, evil, boss, player)
+  return (tm.perf_counter() - start)/repeats, hits
+
+
+if __name__ == '__main__':
+  for n in (10, 100, 1000):
+    repeats = max(3, 2000//n)
+    grid, grid_hits = measure(lambda *scene: grid_narrowphase, n, repeats)
+    batch, batch_hits = measure(lambda *scene: batch_narrowphase, n, repeats)
+    world, world_hits = measure(world_narrowphase, n, repeats)
+    print(f'{n:>5} per side   grid {grid*1000:8.3f} ms   batch {batch*1000:8.3f} ms   world {world*1000:8.3f} ms   hits {len(grid_hits)}/{len(batch_hits)}/{len(world_hits)}')
+  for interval in (6, 12, 24):
+    static, swept = tunneling(interval)
+    print(f'check every {interval:>2} frames   static hits {static}/200   swept hits {swept}/200')
@@ -0,0 +1,79 @@
+import os
+import sys
+import time as tm
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, root)
+os.chdir(root)
+from pygame import *
+import numpy as np
+from assets import sprite_cache, RotationSheet
+from collisions import CollisionWorld, PLAYER_SHOT, STAR
+
+
+class Body:
+  def __init__(self, sprite: Surface, center: tuple[int], hitbox: Rect, layer: int, mask: int) -> None:
+    self.rect = sprite.get_rect(center=center)
+    self.__sprite = sprite
+    self.__hitbox = hitbox
+    self.__hitbox.center = center
+    self.layer = layer
+    self.mask = mask
+    self.hits = 0
+
+  def get_hitbox(self) -> Rect:
+    return self.__hitbox
+
+  def get_mask(self) -> tuple:
+    return sprite_cache.mask(self.__sprite), self.rect
+
+  def strike(self, other) -> None:
+    self.hits += 1
+
+
+def sprite(path: str, size: tuple[int]) -> Surface:
+  loaded = transform.scale(image.load(path), size)
+  loaded.set_colorkey((0, 0, 0))
+  return loaded
+
+def scene(n: int, seed: int = 0) -> tuple[list]:
+  rng = np.random.default_rng(seed)
+  shot = sprite('./Sprites/Shot.png', (64, 54))
+  stars = RotationSheet(sprite('./Sprites/StarProjectile.png', (87, 90)), 12)
+  shots = [Body(shot, (x, y), Rect(0, 0, 22, 47), PLAYER_SHOT, STAR) for x, y in zip(rng.integers(0, 1920, n), rng.integers(0, 1080, n))]
+  falling = [Body(stars[int(a)], (x, y), Rect(0, 0, 63, 63), STAR, 0) for x, y, a in zip(rng.integers(0, 1920, n), rng.integers(0, 1080, n), rng.integers(0, 30, n)*12)]
+  return shots, falling
+
+def measure(n: int, pixel: bool, repeats: int) -> tuple[float, int, int]:
+  shots, falling = scene(n)
+  world = CollisionWorld(pixel=pixel)
+  for i in shots + falling:
+    world.add(i)
+  world.collide()
+  world.mask_tests = 0
+  start = tm.perf_counter()
+  for i in range(repeats):
+    for body in shots:
+      world.moved(body)
+    world.collide()
+  elapsed = (tm.perf_counter() - start)/repeats
+  return elapsed, sum(i.hits for i in shots)//(repeats + 1), world.mask_tests//repeats
+
+
+def check_alpha_masks() -> None:
+  for path in ('./Boss/Xeroc_mid.png', './Boss/Xeroc_bottomleft.png'):
+    shape = sprite_cache.mask(sprite_cache.get(path, (480, 480), alpha=True, colorkey=(0, 0, 0)))
+    w, h = shape.get_size()
+    assert shape.count() < w*h, f'{path} mask is solid'
+    print(f'{path}: {shape.count()/(w*h):.1%} of {w}x{h} set')
+
+
+if __name__ == '__main__':
+  init()
+  display.set_mode((1920, 1080))
+  check_alpha_masks()
+  for n in (10, 50, 200, 1000):
+    repeats = max(5, 2000//n)
+    rect, rect_hits, _ = measure(n, False, repeats)
+    pixel, pixel_hits, tests = measure(n, True, repeats)
+    print(f'{n:>5} per side   rect {rect*1000:8.3f} ms ({rect_hits} hits)   rect+mask {pixel*1000:8.3f} ms ({pixel_hits} hits, {tests} mask tests)')
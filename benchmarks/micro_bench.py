@@ -0,0 +1,141 @@
+import os
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+import sys
+sys.path.insert(0, root)
+os.chdir(root)
+import argparse
+import json
+import time as tm
+import tracemalloc
+from pygame import *
+from assets import sprite_cache, sound_bank
+from entities import Shot, FallingStar, ShootingStar, Boss
+from widgets import HealthBar, linear_coefficients
+from collisions import CollisionWorld
+from collision_bench import scene
+from rng import rng
+
+
+class Parent:
+  def __init__(self, w: int, h: int) -> None:
+    self.fps = 60
+    self.timer = 0
+    self.bombspawned = False
+    self.rect = Rect(w//2, h - 150, 60, 110)
+
+  def get_timer(self) -> int:
+    return self.timer
+
+  def get_player_coords(self) -> tuple[int]:
+    return self.rect.topleft
+
+  def update_stage(self, *args) -> None:
+    pass
+
+
+def ticking(parent: Parent, *calls):
+  def tick() -> None:
+    parent.timer += 1
+    for call in calls:
+      call()
+  return tick
+
+def world_collide(n: int = 100):
+  good, evil, boss, player = scene(n)
+  world = CollisionWorld()
+  for i in good + evil + [boss, player]:
+    world.add(i)
+  def tick() -> None:
+    for i in good + evil:
+      world.moved(i)
+    world.collide()
+  return tick
+
+def cases(screen: Surface) -> dict:
+  w, h = screen.get_size()
+  parent = Parent(w, h)
+  shot = Shot(w, h, parent, screen)
+  boss = Boss(w, h, parent, screen)
+  falling = FallingStar(w, h, parent, screen)
+  shooting = ShootingStar(w, h, parent, screen)
+  final = Boss(w, h, parent, screen)
+  final.set_hp(100)
+  health = HealthBar(w//6, 80, screen, './Boss/Xeroc_mid.png', 40, 80)
+  health.update(0.5)
+  return {
+    'Shot.collision(Boss)': lambda: shot.collision(boss),
+    'FallingStar.logic+move': ticking(parent, falling.logic, falling.move),
+    'ShootingStar.draw': shooting.draw,
+    'Boss.logic phase 1': ticking(parent, boss.logic),
+    'Boss.logic phase 4': ticking(parent, final.logic),
+    'CollisionWorld.collide 100': world_collide(100),
+    'linear_coefficients': lambda: linear_coefficients((960, 930), (-120, 310)),
+    'HealthBar.draw': lambda: health.draw(0, 100),
+  }
+
+def timing(call, budget: float, repeats: int) -> float:
+  n = 1
+  while True:
+    start = tm.perf_counter_ns()
+    for i in range(n):
+      call()
+    elapsed = tm.perf_counter_ns() - start
+    if elapsed > budget*1e9/repeats:
+      break
+    n *= 2
+  best = elapsed/n
+  for r in range(repeats - 1):
+    start = tm.perf_counter_ns()
+    for i in range(n):
+      call()
+    best = min(best, (tm.perf_counter_ns() - start)/n)
+  return best
+
+def allocations(call, calls: int) -> tuple[float]:
+  tracemalloc.start()
+  before = tracemalloc.get_traced_memory()[0]
+  blocks = sys.getallocatedblocks()
+  peak = 0
+  for i in range(calls):
+    tracemalloc.reset_peak()
+    current = tracemalloc.get_traced_memory()[0]
+    call()
+    peak += tracemalloc.get_traced_memory()[1] - current
+  retained = tracemalloc.get_traced_memory()[0] - before
+  blocks = sys.getallocatedblocks() - blocks
+  tracemalloc.stop()
+  return peak/calls, retained/calls, blocks/calls
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description='Time entity hot paths in isolation.')
+  parser.add_argument('names', nargs='*', help='substrings of the cases to run (default: all)')
+  parser.add_argument('--budget', type=float, default=0.5, help='seconds of timing per case')
+  parser.add_argument('--repeats', type=int, default=5)
+  parser.add_argument('--calls', type=int, default=200, help='calls traced for allocations')
+  parser.add_argument('--json', action='store_true')
+  args = parser.parse_args()
+
+  init()
+  screen = display.set_mode((1920, 1080))
+  sound_bank.mute()
+  rng.seed(0)
+  results = {}
+  for name, call in cases(screen).items():
+    if args.names and not any(i in name for i in args.names):
+      continue
+    call()
+    ns = timing(call, args.budget, args.repeats)
+    peak, retained, blocks = allocations(call, args.calls)
+    results[name] = {'ns_per_call': round(ns, 1), 'peak_bytes_per_call': round(peak, 1), 'retained_bytes_per_call': round(retained, 1), 'blocks_per_call': round(blocks, 2)}
+  if args.json:
+    print(json.dumps(results))
+  else:
+    print(f'{"case":<28}{"ns/call":>12}{"peak B":>10}{"kept B":>10}{"blocks":>8}')
+    for name, r in results.items():
+      print(f'{name:<28}{r["ns_per_call"]:>12.1f}{r["peak_bytes_per_call"]:>10.1f}{r["retained_bytes_per_call"]:>10.1f}{r["blocks_per_call"]:>8.2f}')
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,109 @@
+import argparse
+import json
+import math
+import sys
+import numpy as np
+import scipy.stats as sc
+
+USAGE = '''Frame times from one process drift together with machine load, so
+frames are not independent samples and a test over them reports slowdowns
+that are not there. The gate instead reduces every scenario_bench.py --save
+run to one median per phase and compares those run medians.
+
+Record baseline and candidate runs interleaved (base, new, base, new, ...)
+so both sides see the same drift. With --alpha 0.01 the one-sided
+Mann-Whitney test cannot reach significance with fewer than 5 runs per side
+(4 + 4 runs give p >= 0.014 at best); 8-10 per side keep the verdict stable
+on a noisy machine.'''
+
+
+def load(path: str) -> dict:
+  with open(path) as f:
+    return json.load(f)
+
+def run_medians(runs: list, name: str, phase: str) -> np.ndarray:
+  medians = []
+  for run in runs:
+    samples = run['scenarios'].get(name, {}).get(phase)
+    if samples:
+      medians.append(np.median(samples))
+  return np.asarray(medians)
+
+def min_runs(alpha: float) -> int:
+  n = 1
+  while 1/math.comb(2*n, n) >= alpha:
+    n += 1
+  return n
+
+def compare(baseline: np.ndarray, candidate: np.ndarray) -> dict:
+  u, p_slower = sc.mannwhitneyu(candidate, baseline, alternative='greater')
+  _, p_faster = sc.mannwhitneyu(candidate, baseline, alternative='less')
+  base_ms = float(np.median(baseline))
+  candidate_ms = float(np.median(candidate))
+  return {
+    'baseline_ms': base_ms,
+    'candidate_ms': candidate_ms,
+    'runs': [len(baseline), len(candidate)],
+    'shift': candidate_ms/base_ms - 1 if base_ms else 0.0,
+    'delta': float(2*u/(len(candidate)*len(baseline)) - 1),
+    'p_slower': float(p_slower),
+    'p_faster': float(p_faster),
+  }
+
+def verdict(result: dict, alpha: float, min_shift: float, min_delta: float, min_ms: float = 0.0) -> str:
+  change = result['candidate_ms'] - result['baseline_ms']
+  if result['p_slower'] < alpha and result['shift'] >= min_shift and result['delta'] >= min_delta and change >= min_ms:
+    return 'SLOWER'
+  if result['p_faster'] < alpha and result['shift'] <= -min_shift and result['delta'] <= -min_delta and -change >= min_ms:
+    return 'faster'
+  return 'ok'
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description='Compare scenario_bench.py --save runs and fail on real slowdowns.', epilog=USAGE, formatter_class=argparse.RawDescriptionHelpFormatter)
+  parser.add_argument('--baseline', nargs='+', required=True, metavar='PATH', help='saved runs of the baseline build')
+  parser.add_argument('--candidate', nargs='+', required=True, metavar='PATH', help='saved runs of the candidate build')
+  parser.add_argument('--alpha', type=float, default=0.01, help='one-sided Mann-Whitney significance level over run medians')
+  parser.add_argument('--min-shift', type=float, default=0.05, help='smallest relative change in median frame time to report')
+  parser.add_argument('--min-delta', type=float, default=0.147, help="smallest Cliff's delta to report (0.147 is a small effect)")
+  parser.add_argument('--min-ms', type=float, default=0.05, help='smallest absolute change in median time (ms) to report; keeps tiny phases from failing on jitter')
+  parser.add_argument('--json', action='store_true')
+  args = parser.parse_args()
+
+  baseline, candidate = [load(i) for i in args.baseline], [load(i) for i in args.candidate]
+  if len({i.get('batched') for i in baseline + candidate}) > 1:
+    print('warning: runs differ in --batched', file=sys.stderr)
+  needed = min_runs(args.alpha)
+  if min(len(baseline), len(candidate)) < needed:
+    print(f'warning: {len(baseline)} baseline and {len(candidate)} candidate runs cannot reach alpha={args.alpha}; record at least {needed} of each', file=sys.stderr)
+  report = {}
+  skipped = []
+  names = dict.fromkeys(name for run in candidate for name in run['scenarios'])
+  for name in names:
+    phases = dict.fromkeys(phase for run in candidate for phase in run['scenarios'].get(name, {}))
+    for phase in phases:
+      base, new = run_medians(baseline, name, phase), run_medians(candidate, name, phase)
+      if not len(base) or not len(new):
+        skipped.append(f'{name}/{phase}')
+        continue
+      result = compare(base, new)
+      result['verdict'] = verdict(result, args.alpha, args.min_shift, args.min_delta, args.min_ms)
+      report.setdefault(name, {})[phase] = result
+  if skipped:
+    print('skipped (missing or empty on one side): ' + ', '.join(skipped), file=sys.stderr)
+  slower = [(name, phase) for name, phases in report.items() for phase, r in phases.items() if r['verdict'] == 'SLOWER']
+
+  if args.json:
+    print(json.dumps(report))
+  else:
+    print(f'{"scenario":<12}{"phase":<9}{"base ms":>9}{"new ms":>9}{"shift":>8}{"delta":>7}{"p":>10}{"runs":>7}  verdict')
+    for name, phases in report.items():
+      for phase, r in phases.items():
+        p = r['p_faster'] if r['shift'] < 0 else r['p_slower']
+        runs = '{}/{}'.format(*r['runs'])
+        print(f'{name:<12}{phase:<9}{r["baseline_ms"]:>9.3f}{r["candidate_ms"]:>9.3f}{r["shift"]:>+8.1%}{r["delta"]:>+7.2f}{p:>10.2g}{runs:>7}  {r["verdict"]}')
+    print(f'{len(slower)} regression(s)' + (': ' + ', '.join(f'{n}/{p}' for n, p in slower) if slower else ''))
+  sys.exit(1 if slower else 0)
+
+
+if __name__ == '__main__':
+  main()
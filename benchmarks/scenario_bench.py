@@ -0,0 +1,73 @@
+import os
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+import sys
+sys.path.insert(0, root)
+os.chdir(root)
+import argparse
+import json
+from pygame import *
+from assets import sprite_cache, sound_bank, AssetBundle
+from engines import GameEngine
+from entities import FallingStar, ShootingStar
+from profiling import startup_profiler
+from framestats import FrameSampler
+from rng import rng
+startup_profiler.stop_imports()
+
+SCENARIOS = {
+  'phase1': {'phase': 1},
+  'phase2': {'phase': 2},
+  'phase3': {'phase': 3},
+  'phase4': {'phase': 4},
+  'falling500': {'phase': 1, 'hold': {FallingStar: 500}},
+  'shooting50': {'phase': 1, 'hold': {ShootingStar: 50}},
+}
+
+
+def run(scenario: dict, screen: Surface, frames: int, warmup: int, batched: bool, seed: int) -> FrameSampler:
+  rng.seed(seed)
+  w, h = screen.get_size()
+  engine = GameEngine(w, h, (0, 0, 0), 60, screen, None, batched, display_fps=0)
+  engine.start_phase(scenario['phase'])
+  hold = scenario.get('hold', {})
+  sampler = FrameSampler()
+  for i in range(warmup + frames):
+    if i == warmup:
+      engine.sampler = sampler
+    for kind, n in hold.items():
+      engine.populate(kind, n)
+    engine.control(0, True)
+    engine.frame()
+  return sampler
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description='Time GameEngine frames per phase in fixed fight scenarios.')
+  parser.add_argument('scenarios', nargs='*', default=list(SCENARIOS))
+  parser.add_argument('--frames', type=int, default=600)
+  parser.add_argument('--warmup', type=int, default=60)
+  parser.add_argument('--seed', type=int, default=0)
+  parser.add_argument('--batched', action='store_true')
+  parser.add_argument('--save', metavar='PATH', help='write per-frame samples (ms) as JSON')
+  args = parser.parse_args()
+
+  init()
+  screen = display.set_mode((1920, 1080))
+  sprite_cache.attach_bundle(AssetBundle('./.cache/sprites.bundle', (1920, 1080)))
+  sound_bank.mute()
+  results = {}
+  print(f'{"scenario":<12}{"phase":<9}{"mean":>8}{"p50":>8}{"p95":>8}{"p99":>8}  ms')
+  for name in args.scenarios:
+    sampler = run(SCENARIOS[name], screen, args.frames, args.warmup, args.batched, args.seed)
+    for phase, stats in sampler.summary().items():
+      print(f'{name:<12}{phase:<9}{stats["mean"]:>8.3f}{stats["p50"]:>8.3f}{stats["p95"]:>8.3f}{stats["p99"]:>8.3f}')
+    results[name] = {phase: sampler.samples(phase).tolist() for phase in FrameSampler.PHASES + ('frame',)}
+  sprite_cache.save_bundle()
+  if args.save:
+    with open(args.save, 'w') as f:
+      json.dump({'frames': args.frames, 'batched': args.batched, 'seed': args.seed, 'scenarios': results}, f)
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,384 @@
+from pygame import *
+import numpy as np
+from itertools import chain
+
+
+PLAYER = 1
+PLAYER_SHOT = 2
+STAR = 4
+HAZARD = 8
+BOSS = 16
+
+
+def rects_of(entity) -> list[Rect]:
+  hitbox = entity.get_hitbox()
+  return hitbox if type(hitbox) == list else [hitbox]
+
+def swept_overlap(a0: Rect, a1: Rect, b0: Rect, b1: Rect) -> tuple[float]|None:
+  enter, leave = 0.0, 1.0
+  for start, size, other, other_size, v in (
+    (a0.x, a0.w, b0.x, b0.w, (a1.x - a0.x) - (b1.x - b0.x)),
+    (a0.y, a0.h, b0.y, b0.h, (a1.y - a0.y) - (b1.y - b0.y)),
+  ):
+    if v == 0:
+      if not (start < other + other_size and start + size > other):
+        return None
+    else:
+      t0 = (other - start - size)/v
+      t1 = (other + other_size - start)/v
+      enter = max(enter, min(t0, t1))
+      leave = min(leave, max(t0, t1))
+      if enter >= leave:
+        return None
+  return enter, leave
+
+def swept_windows(a0: np.ndarray, a1: np.ndarray, b0: np.ndarray, b1: np.ndarray) -> tuple[np.ndarray]:
+  enter = np.zeros(len(a0))
+  leave = np.ones(len(a0))
+  valid = np.ones(len(a0), dtype=np.bool_)
+  with np.errstate(divide='ignore', invalid='ignore'):
+    for axis in (0, 1):
+      start, size, other, other_size = a0[:, axis], a0[:, axis + 2], b0[:, axis], b0[:, axis + 2]
+      v = (a1[:, axis] - start) - (b1[:, axis] - other)
+      still = v == 0
+      valid &= ~still | ((start < other + other_size) & (start + size > other))
+      t0 = (other - start - size)/v
+      t1 = (other + other_size - start)/v
+      enter = np.where(still, enter, np.maximum(enter, np.minimum(t0, t1)))
+      leave = np.where(still, leave, np.minimum(leave, np.maximum(t0, t1)))
+  return enter, leave, valid & (enter < leave)
+
+def first_hits(owners_a: np.ndarray, owners_b: np.ndarray, i: np.ndarray, j: np.ndarray) -> tuple[np.ndarray]:
+  a, first = np.unique(owners_a[i], return_index=True)
+  return a, owners_b[j[first]]
+
+class CollisionWorld:
+  def __init__(self, cell_size: int = 64, pixel: bool = False, capacity: int = 256, scalar_below: int = 64) -> None:
+    self.__cell = cell_size
+    self.pixel = pixel
+    self.scalar_below = scalar_below
+    self.mask_tests = 0
+    self.reinserted = 0
+    self.__solid = {}
+    self.__grid = {}
+    self.__bodies = {}
+    self.__owners = []
+    self.__free = []
+    self.__layer = np.zeros(capacity, dtype=np.int64)
+    self.__wants = np.zeros(capacity, dtype=np.int64)
+    self.__head = np.zeros(capacity, dtype=np.int64)
+    self.__range = np.zeros((capacity, 4), dtype=np.int64)
+    self.__bounds = np.zeros((capacity, 4), dtype=np.int64)
+    self.__now = np.zeros((capacity, 4), dtype=np.int64)
+    self.__prev = np.zeros((capacity, 4), dtype=np.int64)
+    self.__dirty = {}
+    self.__moved = {}
+    self.__masks = {}
+    self.__target_layers = {}
+
+  def __cells_of(self, box) -> tuple[int]:
+    c = self.__cell
+    x, y, w, h = box
+    return int(x//c), int(y//c), int((x + w - 1)//c), int((y + h - 1)//c)
+
+  def __insert(self, slot: int, layer: int, cells) -> None:
+    x0, y0, x1, y1 = cells
+    grid = self.__grid.get(layer)
+    if grid is None:
+      grid = self.__grid[layer] = {}
+    for x in range(x0, x1 + 1):
+      for y in range(y0, y1 + 1):
+        bucket = grid.get((x, y))
+        if bucket is None:
+          bucket = grid[(x, y)] = {}
+        bucket[slot] = None
+
+  def __discard(self, slot: int, layer: int, cells) -> None:
+    x0, y0, x1, y1 = cells
+    grid = self.__grid[layer]
+    for x in range(x0, x1 + 1):
+      for y in range(y0, y1 + 1):
+        bucket = grid[(x, y)]
+        del bucket[slot]
+        if not bucket:
+          del grid[(x, y)]
+
+  def __allocate(self) -> int:
+    if self.__free:
+      return self.__free.pop()
+    slot = len(self.__owners)
+    if slot == len(self.__layer):
+      self.__layer = np.resize(self.__layer, 2*slot)
+      self.__wants = np.resize(self.__wants, 2*slot)
+      self.__head = np.resize(self.__head, 2*slot)
+      self.__range = np.resize(self.__range, (2*slot, 4))
+      self.__bounds = np.resize(self.__bounds, (2*slot, 4))
+      self.__now = np.resize(self.__now, (2*slot, 4))
+      self.__prev = np.resize(self.__prev, (2*slot, 4))
+    self.__owners.append(None)
+    return slot
+
+  def __rect(self, boxes: np.ndarray, slot: int) -> Rect:
+    return Rect(*boxes[slot].tolist())
+
+  def __shape(self, entity, rect: Rect) -> tuple:
+    get_mask = getattr(entity, 'get_mask', None)
+    if get_mask is not None:
+      shape, sprite_rect = get_mask()
+      return shape, (sprite_rect.centerx - rect.centerx, sprite_rect.centery - rect.centery)
+    solid = self.__solid.get(rect.size)
+    if solid is None:
+      solid = self.__solid[rect.size] = mask.Mask(rect.size, fill=True)
+    return solid, (0, 0)
+
+  def __pixels_touch(self, i: int, j: int, enter: float, leave: float) -> bool:
+    entity, other = self.__owners[i], self.__owners[j]
+    if not (hasattr(entity, 'get_mask') or hasattr(other, 'get_mask')):
+      return True
+    a0, a1 = self.__rect(self.__prev, i), self.__rect(self.__now, i)
+    b0, b1 = self.__rect(self.__prev, j), self.__rect(self.__now, j)
+    shape, (ox, oy) = self.__shape(entity, a1)
+    other_shape, (other_ox, other_oy) = self.__shape(other, b1)
+    (w, h), (other_w, other_h) = shape.get_size(), other_shape.get_size()
+    dx = (a1.centerx - a0.centerx) - (b1.centerx - b0.centerx)
+    dy = (a1.centery - a0.centery) - (b1.centery - b0.centery)
+    samples = min(8, 1 + int(max(abs(dx), abs(dy))*(leave - enter))//4)
+    self.mask_tests += 1
+    for k in range(samples):
+      t = leave - (leave - enter)*k/samples
+      x = a0.centerx + (a1.centerx - a0.centerx)*t + ox - w/2
+      y = a0.centery + (a1.centery - a0.centery)*t + oy - h/2
+      other_x = b0.centerx + (b1.centerx - b0.centerx)*t + other_ox - other_w/2
+      other_y = b0.centery + (b1.centery - b0.centery)*t + other_oy - other_h/2
+      if shape.overlap(other_shape, (round(other_x - x), round(other_y - y))):
+        return True
+    return False
+
+  def add(self, entity) -> None:
+    slots = []
+    for rect in rects_of(entity):
+      slot = self.__allocate()
+      box = tuple(rect)
+      cells = self.__cells_of(box)
+      self.__owners[slot] = entity
+      self.__now[slot] = self.__prev[slot] = box
+      self.__range[slot] = cells
+      self.__bounds[slot] = (rect.left, rect.top, rect.right - 1, rect.bottom - 1)
+      self.__insert(slot, entity.layer, cells)
+      slots.append(slot)
+    self.__layer[slots] = entity.layer
+    self.__wants[slots] = entity.mask
+    self.__head[slots] = slots[0]
+    self.__bodies[entity] = slots
+    for target in self.__layers(entity.mask):
+      targets = self.__target_layers.setdefault(entity.layer, [])
+      if target not in targets:
+        targets.append(target)
+
+  def remove(self, entity) -> None:
+    slots = self.__bodies.pop(entity, None)
+    if slots is not None:
+      for slot in slots:
+        self.__discard(slot, entity.layer, self.__range[slot].tolist())
+        self.__owners[slot] = None
+        self.__free.append(slot)
+    self.__dirty.pop(entity, None)
+    self.__moved.pop(entity, None)
+
+  def moved(self, entity) -> None:
+    if entity in self.__bodies:
+      self.__dirty[entity] = None
+
+  def __refresh(self) -> None:
+    rows = []
+    rects = []
+    resized = []
+    bodies = self.__bodies
+    for entity in self.__dirty:
+      slots = bodies[entity]
+      hitbox = entity.get_hitbox()
+      if type(hitbox) != list:
+        hitbox = [hitbox]
+      if len(hitbox) != len(slots):
+        resized.append(entity)
+        continue
+      rows += slots
+      rects += hitbox
+    self.__moved.update(self.__dirty)
+    self.__dirty.clear()
+    for entity in resized:
+      self.remove(entity)
+      self.add(entity)
+    if not rows:
+      return
+    if len(rows) < self.scalar_below:
+      c = self.__cell
+      now = []
+      bounds = []
+      cells = []
+      for rect, (px, py, pw, ph) in zip(rects, self.__prev[rows].tolist()):
+        x, y, w, h = box = tuple(rect)
+        now.append(box)
+        x0 = x if x < px else px
+        y0 = y if y < py else py
+        x1 = (x + w if x + w > px + pw else px + pw) - 1
+        y1 = (y + h if y + h > py + ph else py + ph) - 1
+        bounds.append((x0, y0, x1, y1))
+        cells.append([x0//c, y0//c, x1//c, y1//c])
+      old = self.__range[rows].tolist()
+      changed = [i for i in range(len(rows)) if cells[i] != old[i]]
+    else:
+      rows = np.array(rows)
+      now = np.fromiter(chain.from_iterable(rects), np.int64, 4*len(rects)).reshape(-1, 4)
+      prev = self.__prev.take(rows, axis=0)
+      bounds = np.concatenate((np.minimum(now[:, :2], prev[:, :2]), np.maximum(now[:, :2] + now[:, 2:], prev[:, :2] + prev[:, 2:]) - 1), axis=1)
+      cells = bounds//self.__cell
+      moved = (cells != self.__range.take(rows, axis=0)).any(axis=1)
+      changed = np.flatnonzero(moved).tolist()
+      old = dict(zip(changed, self.__range[rows[moved]].tolist()))
+      cells = dict(zip(changed, cells[moved].tolist()))
+      rows = rows.tolist()
+    self.__now[rows] = now
+    self.__bounds[rows] = bounds
+    for i in changed:
+      slot = rows[i]
+      layer = self.__owners[slot].layer
+      self.__discard(slot, layer, old[i])
+      self.__insert(slot, layer, cells[i])
+      self.__range[slot] = cells[i]
+    self.reinserted += len(changed)
+
+  def __layers(self, mask: int) -> list[int]:
+    layers = self.__masks.get(mask)
+    if layers is None:
+      layers = self.__masks[mask] = [1 << i for i in range(mask.bit_length()) if mask >> i & 1]
+    return layers
+
+  def query(self, rects: list[Rect], mask: int, exclude=None) -> list:
+    if self.__dirty:
+      self.__refresh()
+    found = {}
+    for rect in rects:
+      x0, y0, x1, y1 = self.__cells_of(rect)
+      for layer in self.__layers(mask):
+        grid = self.__grid.get(layer, {})
+        for x in range(x0, x1 + 1):
+          for y in range(y0, y1 + 1):
+            for slot in grid.get((x, y), ()):
+              owner = self.__owners[slot]
+              if owner is not exclude and owner not in found and rect.colliderect(self.__rect(self.__now, slot)):
+                found[owner] = None
+    return list(found)
+
+  def __pairs(self) -> tuple:
+    flat = []
+    offsets = {}
+    pairings = []
+    total = 0
+    for layer, targets in self.__target_layers.items():
+      grid = self.__grid.get(layer)
+      for target in targets:
+        other_grid = self.__grid.get(target)
+        if not grid or not other_grid:
+          continue
+        for cell in grid.keys() & other_grid.keys():
+          bucket, other = grid[cell], other_grid[cell]
+          start = offsets.get(id(bucket))
+          if start is None:
+            start = offsets[id(bucket)] = len(flat)
+            flat += bucket
+          other_start = offsets.get(id(other))
+          if other_start is None:
+            other_start = offsets[id(other)] = len(flat)
+            flat += other
+          pairings.append((start, len(bucket), other_start, len(other)) + cell)
+          total += len(bucket)*len(other)
+    return flat, pairings, total
+
+  def __scalar_contacts(self, flat: list, pairings: list) -> list[tuple]:
+    owners = self.__owners
+    candidates = {}
+    for start, n, other_start, m, x, y in pairings:
+      for i in flat[start:start + n]:
+        entity = owners[i]
+        for j in flat[other_start:other_start + m]:
+          other = owners[j]
+          if entity is not other and entity.mask & other.layer:
+            candidates[(i, j)] = None
+    slots = list({i for pair in candidates for i in pair})
+    prev = dict(zip(slots, self.__prev[slots].tolist()))
+    now = dict(zip(slots, self.__now[slots].tolist()))
+    best = {}
+    for i, j in candidates:
+      window = swept_overlap(Rect(prev[i]), Rect(now[i]), Rect(prev[j]), Rect(now[j]))
+      if window is not None:
+        best.setdefault((self.__bodies[owners[i]][0], owners[j].layer), []).append((window, i, j))
+    contacts = []
+    for key in sorted(best):
+      for (enter, leave), i, j in sorted(best[key], key=lambda hit: (hit[0][0], hit[2])):
+        if not self.pixel or self.__pixels_touch(i, j, enter, leave):
+          contacts.append((owners[i], owners[j]))
+          break
+    return contacts
+
+  def __batch_contacts(self, flat: list, pairings: list, total: int) -> list[tuple]:
+    flat = np.fromiter(flat, np.int64, len(flat))
+    a_start, a_len, b_start, b_len, x, y = np.fromiter(chain.from_iterable(pairings), np.int64, 6*len(pairings)).reshape(-1, 6).T
+    counts = a_len*b_len
+    pairing = np.repeat(np.arange(len(pairings)), counts)
+    local = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    width = b_len[pairing]
+    a = flat[a_start[pairing] + local//width]
+    b = flat[b_start[pairing] + local%width]
+    bounds, other_bounds = self.__bounds.take(a, axis=0), self.__bounds.take(b, axis=0)
+    low = np.maximum(bounds[:, :2], other_bounds[:, :2])
+    cell = low//self.__cell
+    keep = (low <= np.minimum(bounds[:, 2:], other_bounds[:, 2:])).all(axis=1) & (cell[:, 0] == x[pairing]) & (cell[:, 1] == y[pairing])
+    a, b = a[keep], b[keep]
+    keep = (self.__wants[a] & self.__layer[b] != 0) & (self.__head[a] != self.__head[b])
+    a, b = a[keep], b[keep]
+    enter, leave, valid = swept_windows(self.__prev.take(a, axis=0), self.__now.take(a, axis=0), self.__prev.take(b, axis=0), self.__now.take(b, axis=0))
+    hits = np.flatnonzero(valid)
+    a, b, enter, leave = a[hits], b[hits], enter[hits], leave[hits]
+    keys = self.__head[a] << 32 | self.__layer[b]
+    order = np.lexsort((b, enter, keys))
+    owners = self.__owners
+    if self.pixel:
+      contacts = []
+      done = set()
+      for h in order.tolist():
+        key = int(keys[h])
+        if key not in done and self.__pixels_touch(int(a[h]), int(b[h]), enter[h], leave[h]):
+          done.add(key)
+          contacts.append((owners[a[h]], owners[b[h]]))
+      return contacts
+    first, targets = first_hits(keys, b, order, order)
+    return [(owners[i], owners[j]) for i, j in zip((first >> 32).tolist(), targets.tolist())]
+
+  def __settle(self) -> None:
+    rows = []
+    for entity in self.__moved:
+      rows += self.__bodies[entity]
+    if rows:
+      self.__prev[rows] = self.__now[rows]
+    self.__dirty.update(self.__moved)
+    self.__moved.clear()
+
+  def collide(self) -> int:
+    if self.__dirty:
+      self.__refresh()
+    flat, pairings, total = self.__pairs()
+    dispatched = 0
+    if total:
+      contacts = self.__scalar_contacts(flat, pairings) if total < self.scalar_below else self.__batch_contacts(flat, pairings, total)
+      for entity, other in contacts:
+        entity.strike(other)
+        dispatched += 1
+    self.__settle()
+    return dispatched
+
+  def __contains__(self, entity) -> bool:
+    return entity in self.__bodies
+
+  def __len__(self) -> int:
+    return len(self.__bodies)
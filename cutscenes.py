@@ -6,31 +6,26 @@ from pygame_widgets.textbox import TextBox
 from collections import defaultdict
 import pygame_widgets
 import time as tm
-import json
 import glob
 from math import floor
 import numpy as np
-from pygame.font import *
+from assets import sprite_cache, sound_bank, font_cache
+from rng import visual_rng
+from text import text_renderer
 
 
 
 def typewriter_text(screen: Surface, text: str, size: int, c: tuple[int], rc: Rect) -> None:
-  font = Font('./fonts/DeterminationSansWebRegular.ttf', size=size)
-  surf = font.render(text, True, c, (0, 0, 0))
-  rec = surf.get_rect(center=rc.center)
   draw.rect(screen, (255, 255, 255), rc, 3, 6)
-  screen.blit(surf, rec)
+  text_renderer.draw(screen, text, './fonts/DeterminationSansWebRegular.ttf', size, c, rc.center, width=rc.width - size)
 
 def typewriter_text_no_rect(screen: Surface, text: str, size: int, c: tuple[int], rc: Rect) -> None:
-  font = Font('./fonts/DeterminationSansWebRegular.ttf', size=size)
-  surf = font.render(text, True, c, (0, 0, 0))
-  rec = surf.get_rect(center=rc.center)
-  screen.blit(surf, rec)
+  text_renderer.draw(screen, text, './fonts/DeterminationSansWebRegular.ttf', size, c, rc.center)
 
 class Background:
   def __init__(self, w: int, h: int, speed:int, filename: str):
     self.bg_speed = speed
-    self.__bg = transform.scale(image.load(filename).convert(), (w, h))
+    self.__bg = sprite_cache.get(filename, (w, h))
     self.pos = 0
     self.h = h
     self.w = w
@@ -111,24 +106,23 @@ class IntroCutscene(Cutscene):
     self.__flowey_topleft_y = self.__h//2 - self.__flowey_h//2
     self.__flowey_topleft_x = self.__w//2 - self.__flowey_w//2
     self.__sfx = {
-      'sonic': mixer.Sound('./Soundeffects/sonic-exe-laugh.mp3'),
-      'omega laugh': mixer.Sound('./Soundeffects/Omega_flowey_laugh.mp3'),
-      'flowey_typing_normal': mixer.Sound('./Soundeffects/Normal_flowey_talking.mp3'),
-      'flowey_typing_evil': mixer.Sound('./Soundeffects/Evil_flowey_talking.mp3'),
-      'flowey_one_letter':mixer.Sound('./Soundeffects/Flowey_one_letter.mp3'),
-      'savepoint': mixer.Sound('./Soundeffects/savepoint.mp3'),
-      'alarm': mixer.Sound('./Soundeffects/omega-flowey-alarm.mp3'),
-      'hal1':mixer.Sound('./Soundeffects/hal1.mp3'),
-      'chaos': mixer.Sound('./Soundeffects./Sound_of_chaos.mp3')
+      'sonic': sound_bank.get('./Soundeffects/sonic-exe-laugh.mp3'),
+      'omega laugh': sound_bank.get('./Soundeffects/Omega_flowey_laugh.mp3'),
+      'flowey_typing_normal': sound_bank.get('./Soundeffects/Normal_flowey_talking.mp3'),
+      'flowey_typing_evil': sound_bank.get('./Soundeffects/Evil_flowey_talking.mp3'),
+      'flowey_one_letter':sound_bank.get('./Soundeffects/Flowey_one_letter.mp3'),
+      'savepoint': sound_bank.get('./Soundeffects/savepoint.mp3', 0.1),
+      'alarm': sound_bank.get('./Soundeffects/omega-flowey-alarm.mp3'),
+      'hal1':sound_bank.get('./Soundeffects/hal1.mp3'),
+      'chaos': sound_bank.get('./Soundeffects./Sound_of_chaos.mp3')
     }
-    self.__set_sound()
-    self.__sprites = {k:transform.scale(image.load(v).convert(), (self.__flowey_w, self.__flowey_h)) for k, v in zip([i[10:-4] for i in glob.glob('./Sprites/*.png')], glob.glob('./Sprites/*.png')) if 'soul' not in k}
-    self.__souls = [transform.scale(image.load('./Sprites/teal_soul.png').convert_alpha(), (self.__w//55, self.__h//28)), 
-                    transform.scale(image.load('./Sprites/Yellow_soul.png').convert_alpha(), (self.__w//55, self.__h//28)), 
-                    transform.scale(image.load('./Sprites/Pink_soul.png').convert_alpha(), (self.__w//55, self.__h//28)),
-                    transform.scale(image.load('./Sprites/Orange_soul.png').convert_alpha(), (self.__w//55, self.__h//28)),
-                    transform.scale(image.load('./Sprites/Green_soul.png').convert_alpha(), (self.__w//55, self.__h//28)),
-                    transform.scale(image.load('./Sprites/Blue_soul.png').convert_alpha(), (self.__w//55, self.__h//28))]
+    self.__sprites = {k:sprite_cache.get(v, (self.__flowey_w, self.__flowey_h), colorkey=(0, 0, 0)) for k, v in zip([i[10:-4] for i in glob.glob('./Sprites/*.png')], glob.glob('./Sprites/*.png')) if 'soul' not in k}
+    self.__souls = [sprite_cache.get('./Sprites/teal_soul.png', (self.__w//55, self.__h//28), alpha=True, colorkey=(0, 0, 0)), 
+                    sprite_cache.get('./Sprites/Yellow_soul.png', (self.__w//55, self.__h//28), alpha=True, colorkey=(0, 0, 0)), 
+                    sprite_cache.get('./Sprites/Pink_soul.png', (self.__w//55, self.__h//28), alpha=True, colorkey=(0, 0, 0)),
+                    sprite_cache.get('./Sprites/Orange_soul.png', (self.__w//55, self.__h//28), alpha=True, colorkey=(0, 0, 0)),
+                    sprite_cache.get('./Sprites/Green_soul.png', (self.__w//55, self.__h//28), alpha=True, colorkey=(0, 0, 0)),
+                    sprite_cache.get('./Sprites/Blue_soul.png', (self.__w//55, self.__h//28), alpha=True, colorkey=(0, 0, 0))]
     self.__step_times = {
       0: 3*fps,
       1: 5.5*fps,
@@ -182,17 +176,10 @@ class IntroCutscene(Cutscene):
     self.__textbox = Rect((self.__w//2 -self.__textbox_w//2, self.__flowey_topleft_y+self.__flowey_h*1.5), (self.__textbox_w, self.__h//9))
     self.__sprite_update()
     
-  def __set_sound(self) -> None:
-    self.__sfx['flowey_typing_normal'].set_volume(0.2)
-    self.__sfx['flowey_typing_evil'].set_volume(0.2)
-    self.__sfx['flowey_one_letter'].set_volume(0.5)
-    self.__sfx['savepoint'].set_volume(0.1)
-    self.__sfx['omega laugh'].set_volume(0.1)
-    self.__sfx['omega laugh'].set_volume(0.1)
-    self.__sfx['chaos'].set_volume(0.7)
-    
   def __chaos_intensify(self) -> None:
-    self.__sfx['omega laugh'].set_volume(0.8)
+    playing = self.__sfx['omega laugh']
+    self.__sfx['omega laugh'] = sound_bank.get('./Soundeffects/Omega_flowey_laugh.mp3', 0.8)
+    playing.set_playing_volume(self.__sfx['omega laugh'].get_volume())
   
   def __sprite_update(self) -> None:
     for sprite in self.__sprites.values():
@@ -396,8 +383,8 @@ class IntroCutscene(Cutscene):
       offset_x = 0
       offset_y = 0
       if (self.__timer//5)%2 == 0 and self.__timer<=6*self.__fps:
-        offset_x = np.random.randint(-5, 5)
-        offset_y = np.random.randint(-5, 5)
+        offset_x = visual_rng.randint(-5, 5)
+        offset_y = visual_rng.randint(-5, 5)
       typewriter_text(self.__screen, self.__voicelines[self.__step][0:floor(self.__counter)], size=40, c=(255, 255, 255), rc=Rect((self.__w//2 -self.__textbox_w//2 + offset_x, self.__flowey_topleft_y+self.__flowey_h*1.5 + offset_y), (self.__textbox_w, self.__h//9)))
     
     if self.__step == 6:
@@ -432,8 +419,8 @@ class IntroCutscene(Cutscene):
       offset_x = 0
       offset_y = 0
       if (self.__timer//5)%2 == 0 and self.__timer<=5.3*self.__fps:
-        offset_x = np.random.randint(-5, 5)
-        offset_y = np.random.randint(-5, 5)
+        offset_x = visual_rng.randint(-5, 5)
+        offset_y = visual_rng.randint(-5, 5)
       typewriter_text(self.__screen, self.__voicelines[self.__step][0:floor(self.__counter)], size=40, c=(255, 255, 255), rc=Rect((self.__w//2 -self.__textbox_w//2 + offset_x, self.__flowey_topleft_y+self.__flowey_h*1.5 + offset_y), (self.__textbox_w, self.__h//9)))
     
     if self.__step == 8:
@@ -447,8 +434,8 @@ class IntroCutscene(Cutscene):
       offset_x = 0
       offset_y = 0
       if (self.__timer//5)%2 == 0 and self.__timer<6.8*self.__fps:
-        offset_x = np.random.randint(-5, 5)
-        offset_y = np.random.randint(-5, 5)
+        offset_x = visual_rng.randint(-5, 5)
+        offset_y = visual_rng.randint(-5, 5)
       typewriter_text(self.__screen, self.__voicelines[self.__step][0:floor(self.__counter)], size=40, c=(255, 255, 255), rc=Rect((self.__w//2 -self.__textbox_w//2 + offset_x, self.__flowey_topleft_y+self.__flowey_h*1.5 + offset_y), (self.__textbox_w, self.__h//9)))
       
     if self.__step == 9:
@@ -481,8 +468,8 @@ class IntroCutscene(Cutscene):
       offset_x = 0
       offset_y = 0
       if (self.__timer//5)%2 == 0 and self.__timer<=7*self.__fps:
-        offset_x = np.random.randint(-5, 5)
-        offset_y = np.random.randint(-5, 5)
+        offset_x = visual_rng.randint(-5, 5)
+        offset_y = visual_rng.randint(-5, 5)
       typewriter_text(self.__screen, self.__voicelines[self.__step][0:floor(self.__counter)], size=40, c=(255, 255, 255), rc=Rect((self.__w//2 -self.__textbox_w//2 + offset_x, self.__flowey_topleft_y+self.__flowey_h*1.5 + offset_y), (self.__textbox_w, self.__h//9)))
       
     if self.__step == 11:
@@ -514,8 +501,8 @@ class IntroCutscene(Cutscene):
       offset_x = 0
       offset_y = 0
       if (self.__timer//5)%2 == 0 and self.__timer<=7*self.__fps:
-        offset_x = np.random.randint(-5, 5)
-        offset_y = np.random.randint(-5, 5)
+        offset_x = visual_rng.randint(-5, 5)
+        offset_y = visual_rng.randint(-5, 5)
       typewriter_text(self.__screen, self.__voicelines[self.__step][0:floor(self.__counter)], size=40, c=(255, 255, 255), rc=Rect((self.__w//2 -self.__textbox_w//2 + offset_x, self.__flowey_topleft_y+self.__flowey_h*1.5 + offset_y), (self.__textbox_w, self.__h//9)))
     
     if self.__step == 13:
@@ -556,15 +543,15 @@ class IntroCutscene(Cutscene):
         if self.__timer == 2*self.__fps+1:
           self.__chaos_intensify()
         if self.__timer%10 == 0:
-          self.__screen.fill(self.__chaos_colors[np.random.choice(self.__chaos_choices)])
+          self.__screen.fill(self.__chaos_colors[visual_rng.choice(self.__chaos_choices)])
         if (self.__timer//4)%2 == 0 and self.__timer <= 5.7*self.__fps:
-          center_offset_x = np.random.randint(-12, 12)
-          center_offset_y = np.random.randint(-12, 12)
+          center_offset_x = visual_rng.randint(-12, 12)
+          center_offset_y = visual_rng.randint(-12, 12)
           self.__step_14_chaos(center_offset_x, center_offset_y)
           self.__screen.blit(self.__sprites['pumpkin_turning_7'], (self.__flowey_topleft_x + center_offset_x , self.__flowey_topleft_y+center_offset_y))
         elif (self.__timer//4)%2 == 1 and self.__timer <= 5.7*self.__fps:
-          center_offset_x = np.random.randint(-12, 12)
-          center_offset_y = np.random.randint(-12, 12)
+          center_offset_x = visual_rng.randint(-12, 12)
+          center_offset_y = visual_rng.randint(-12, 12)
           self.__step_14_chaos(center_offset_x, center_offset_y)
           self.__screen.blit(self.__sprites['pumpkin_turning_8'], (self.__flowey_topleft_x+center_offset_x, self.__flowey_topleft_y+center_offset_y))
         elif self.__timer > self.__fps*5.7:
@@ -589,8 +576,8 @@ class IntroCutscene(Cutscene):
         center_offset_x = 0
         center_offset_y = 0
         if (self.__timer//5)%2 == 0:
-          center_offset_x = np.random.randint(-8, 8)
-          center_offset_y = np.random.randint(-8, 8)
+          center_offset_x = visual_rng.randint(-8, 8)
+          center_offset_y = visual_rng.randint(-8, 8)
         typewriter_text(self.__screen, self.__voicelines[self.__step][0:floor(self.__counter)], size=70, c=(255, 255, 255), rc=Rect((self.__w//2 -self.__textbox_w//2 + center_offset_x, self.__h//2 - self.__h//6 + center_offset_y), (self.__textbox_w, self.__h//3)))
     
   def __del__(self) -> None:
@@ -605,7 +592,7 @@ class LostCutscene(Cutscene):
     self.__fps = fps
     self.__step = 0
     self.__textcounter = 0
-    self.__button = Button(self.__screen, self.__w//2 - self.__w//6, self.__h*0.6, self.__w//3, self.__h//4, inactiveColour=(255, 255, 255), hoverColour=(155, 0, 0), shadowDistance = 0.5, pressedColour=(255, 0, 0), radius=10, textHAlign ='centre', textVAlign = 'centre', font=font.Font('fonts/DeterminationMonoWebRegular.ttf', 60), text='QUIT', margin=10)
+    self.__button = Button(self.__screen, self.__w//2 - self.__w//6, self.__h*0.6, self.__w//3, self.__h//4, inactiveColour=(255, 255, 255), hoverColour=(155, 0, 0), shadowDistance = 0.5, pressedColour=(255, 0, 0), radius=10, textHAlign ='centre', textVAlign = 'centre', font=font_cache.get('fonts/DeterminationMonoWebRegular.ttf', 60), text='QUIT', margin=10)
     self.button_rect = Rect((self.__button.getX(), self.__button.getY()), (self.__button.getWidth(), self.__button.getHeight()))
     self.__button.hide()
     self.__x = w//2
@@ -618,24 +605,24 @@ class LostCutscene(Cutscene):
     self.done = False
     self.maxstep = 3
     self.__sprites = {
-      1: transform.scale(image.load('./Sprites/Base_Rocket.png').convert(), (self.__w//8, self.__h//4.5)),
-      2: transform.scale(image.load('./Sprites/Red_Heart.png').convert(), (self.__w//10, self.__w//10)),
-      3: transform.scale(image.load('./Sprites/Rocket_Defeat.png').convert(), (self.__w//10, self.__h//5)),
-      4: transform.scale(image.load('./Sprites/Heart_Cracked.png').convert(), (self.__w//10, self.__w//10)),
-      5: transform.scale(image.load('./Sprites/Cloud_forming.png').convert_alpha(), (self.__w//10, self.__w//10)),
-      6: transform.scale(image.load('./Sprites/Cloud_formed.png').convert(), (self.__w//10, self.__w//10)),
-      7: transform.scale(image.load('./Sprites/Cloud_formed1.png').convert(), (self.__w//10, self.__w//10)),
-      8: transform.scale(image.load('./Sprites/Skull_Forming.png').convert(), (self.__w//10, self.__w//10)),
-      9: transform.scale(image.load('./Sprites/Skull_Formed.png').convert(), (self.__w//10, self.__w//10)),
-      10: transform.scale(image.load('./Sprites/Cloud_dissolving.png').convert(), (self.__w//10, self.__w//10)),
-      11: transform.scale(image.load('./Sprites/Cloud_dissolved.png').convert(), (self.__w//10, self.__w//10)),
+      1: sprite_cache.get('./Sprites/Base_Rocket.png', (self.__w//8, self.__h//4.5), colorkey=(0, 0, 0)),
+      2: sprite_cache.get('./Sprites/Red_Heart.png', (self.__w//10, self.__w//10), colorkey=(0, 0, 0)),
+      3: sprite_cache.get('./Sprites/Rocket_Defeat.png', (self.__w//10, self.__h//5), colorkey=(0, 0, 0)),
+      4: sprite_cache.get('./Sprites/Heart_Cracked.png', (self.__w//10, self.__w//10), colorkey=(0, 0, 0)),
+      5: sprite_cache.get('./Sprites/Cloud_forming.png', (self.__w//10, self.__w//10), alpha=True, colorkey=(0, 0, 0)),
+      6: sprite_cache.get('./Sprites/Cloud_formed.png', (self.__w//10, self.__w//10), colorkey=(0, 0, 0)),
+      7: sprite_cache.get('./Sprites/Cloud_formed1.png', (self.__w//10, self.__w//10), colorkey=(0, 0, 0)),
+      8: sprite_cache.get('./Sprites/Skull_Forming.png', (self.__w//10, self.__w//10), colorkey=(0, 0, 0)),
+      9: sprite_cache.get('./Sprites/Skull_Formed.png', (self.__w//10, self.__w//10), colorkey=(0, 0, 0)),
+      10: sprite_cache.get('./Sprites/Cloud_dissolving.png', (self.__w//10, self.__w//10), colorkey=(0, 0, 0)),
+      11: sprite_cache.get('./Sprites/Cloud_dissolved.png', (self.__w//10, self.__w//10), colorkey=(0, 0, 0)),
     }
     self.__sounds = {
-      1: mixer.Sound('./Soundeffects/asgorevoice.mp3'),
-      2: mixer.Sound('./Soundeffects/undertale-soul-shatter.mp3'),
-      3: mixer.Sound('./Soundeffects/savepoint.mp3'),
-      4: mixer.Sound('./Soundeffects/Hover_Quit.mp3'),
-      5: mixer.Sound('./Soundeffects/Press.mp3'),
+      1: sound_bank.get('./Soundeffects/asgorevoice.mp3'),
+      2: sound_bank.get('./Soundeffects/undertale-soul-shatter.mp3'),
+      3: sound_bank.get('./Soundeffects/savepoint.mp3', 0.3),
+      4: sound_bank.get('./Soundeffects/Hover_Quit.mp3'),
+      5: sound_bank.get('./Soundeffects/Press.mp3'),
     }
     self.__lines = {
       'g': ' Game Over!',
@@ -652,16 +639,8 @@ class LostCutscene(Cutscene):
     }
     self.__go_textbox = Rect((self.__w//2 - w//10, 0), (w//5, h//4))
     self.__asgore_textbox = Rect((self.__w//2 - w//6, h//2-h//6), (w//3, h//3))
-    self.__set_sound()
     self.__strip_background()
 
-  def __set_sound(self) -> None:
-    self.__sounds[1].set_volume(0.2)
-    self.__sounds[2].set_volume(0.4)
-    self.__sounds[3].set_volume(0.3)
-    self.__sounds[4].set_volume(0.05)
-    self.__sounds[5].set_volume(0.1)
-
   def __strip_background(self) -> None:
     for i in self.__sprites.values():
       i.set_colorkey((0, 0, 0))
@@ -845,53 +824,53 @@ class WonCutscene(Cutscene):
       24: "Until next time."
     }
     self.__sfx = {
-      "Fire": mixer.Sound("./Soundeffects/FireBall.mp3"),
-      "GoodFlowey": mixer.Sound("./Soundeffects/Normal_flowey_talking.mp3"),
-      "ExoSlash": mixer.Sound("./Soundeffects/ExobladeBeamSlash.mp3"),
-      "Glasscrack": mixer.Sound("./Soundeffects/CryogenShieldBreak.mp3"),
-      "Glassbreak": mixer.Sound("./Soundeffects/CryogenDeath.mp3"),
-      "XerocSpawn": mixer.Sound("./Soundeffects/BossRushTerminusDeactivate.mp3"),
-      "XerocDespawn": mixer.Sound("./Soundeffects/BossRushVictory.mp3"),
-      "savepoint": mixer.Sound("./Soundeffects/savepoint.mp3"),
-      'hover': mixer.Sound("./Soundeffects/Hover_Quit.mp3"),
-      'press': mixer.Sound("./Soundeffects/Press.mp3"),
-      'serenity': mixer.Sound('./Soundeffects/Serenity.mp3'),
-      'asgore': mixer.Sound('./Soundeffects/asgorevoice.mp3'),
+      "Fire": sound_bank.get("./Soundeffects/FireBall.mp3"),
+      "GoodFlowey": sound_bank.get("./Soundeffects/Normal_flowey_talking.mp3"),
+      "ExoSlash": sound_bank.get("./Soundeffects/ExobladeBeamSlash.mp3"),
+      "Glasscrack": sound_bank.get("./Soundeffects/CryogenShieldBreak.mp3"),
+      "Glassbreak": sound_bank.get("./Soundeffects/CryogenDeath.mp3"),
+      "XerocSpawn": sound_bank.get("./Soundeffects/BossRushTerminusDeactivate.mp3"),
+      "XerocDespawn": sound_bank.get("./Soundeffects/BossRushVictory.mp3"),
+      "savepoint": sound_bank.get("./Soundeffects/savepoint.mp3"),
+      'hover': sound_bank.get("./Soundeffects/Hover_Quit.mp3"),
+      'press': sound_bank.get("./Soundeffects/Press.mp3"),
+      'serenity': sound_bank.get('./Soundeffects/Serenity.mp3'),
+      'asgore': sound_bank.get('./Soundeffects/asgorevoice.mp3'),
     }
     self.__sprites = {
-      "XerocPulse1": transform.scale(image.load('./Boss/Xeroc_cutscene_pulse1.png').convert_alpha(), (self.__w//3, self.__h//1.1)),
-      "XerocPulse2": transform.scale(image.load('./Boss/Xeroc_cutscene_pulse2.png').convert_alpha(), (self.__w//3, self.__h//1.1)),
-      "Rocket": transform.scale(image.load('./Sprites/Base_Rocket.png').convert_alpha(), (self.__w//13, self.__h//7)),
-      "XerocStep0Pulse1": transform.scale(image.load('./Boss/Xeroc_mid_pulse1.png').convert_alpha(), (self.__w//3, self.__h//1.1)),
-      "XerocStep0Pulse2": transform.scale(image.load('./Boss/Xeroc_mid_pulse2.png').convert_alpha(), (self.__w//3, self.__h//1.1)),
-      "BurnedSoul": transform.scale(image.load('./Sprites/burned_soul.png').convert_alpha(), (self.__w//55, self.__h//28)),
-      "BurnedSoulD1": transform.scale(image.load('./Sprites/burned_soul_death1.png').convert_alpha(), (self.__w//55, self.__h//28)),
-      "BurnedSoulD2": transform.scale(image.load('./Sprites/burned_soul_death2.png').convert_alpha(), (self.__w//55, self.__h//28)),
-      "BurnedSoulD3": transform.scale(image.load('./Sprites/burned_soul_death3.png').convert_alpha(), (self.__w//55, self.__h//28)),
-      "FloweyHappy1": transform.scale(image.load('./Sprites/Flowey_happy_0.png').convert_alpha(), (self.__w//6, self.__h//5)),
-      "FloweyHappy2": transform.scale(image.load('./Sprites/Flowey_happy_1.png').convert_alpha(), (self.__w//6, self.__h//5)),
-      "FloweyHappyR": transform.scale(image.load('./Sprites/Flowey_base_looking_around.png').convert_alpha(), (self.__w//6, self.__h//5)),
-      "FloweyHappyL": transform.scale(image.load('./Sprites/Flowey_base_looking_left.png').convert_alpha(), (self.__w//6, self.__h//5)),
-      "FloweyAfraid": transform.scale(image.load('./Sprites/Flowey_afraid.png').convert_alpha(), (self.__w//6, self.__h//5)),
-      "FloweyAfraidD1": transform.scale(image.load('./Sprites/Flowey_afraid_dying1.png').convert_alpha(), (self.__w//6, self.__h//5)),
-      "FloweyAfraidD2": transform.scale(image.load('./Sprites/Flowey_afraid_dying2.png').convert_alpha(), (self.__w//6, self.__h//5)),
-      "FloweyAfraidD3": transform.scale(image.load('./Sprites/Flowey_afraid_dying3.png').convert_alpha(), (self.__w//6, self.__h//5)),
-      "FloweyAfraidBurned": transform.scale(image.load('./Sprites/Flowey_afraid_burned.png').convert_alpha(), (self.__w//6, self.__h//5)),
-      "FloweyAfraidBurnedD1": transform.scale(image.load('./Sprites/Flowey_afraid_burned_dying1.png').convert_alpha(), (self.__w//6, self.__h//5)),
-      "FloweyAfraidBurnedD2": transform.scale(image.load('./Sprites/Flowey_afraid_burned_dying2.png').convert_alpha(), (self.__w//6, self.__h//5)),
-      "FloweyAfraidBurnedD3": transform.scale(image.load('./Sprites/Flowey_afraid_burned_dying3.png').convert_alpha(), (self.__w//6, self.__h//5)),
-      "Crack1": transform.scale(image.load('./Sprites/ScreenCrack1.png').convert_alpha(), (self.__w, self.__h)),
-      "Crack2": transform.scale(image.load('./Sprites/ScreenCrack2.png').convert_alpha(), (self.__w, self.__h)),
-      "Crack3": transform.scale(image.load('./Sprites/ScreenCrack3.png').convert_alpha(), (self.__w, self.__h)),
-      "Crack4": transform.scale(image.load('./Sprites/ScreenCrack4.png').convert_alpha(), (self.__w, self.__h)),
-      "RedHeart": transform.scale(image.load('./Sprites/Red_heart.png').convert_alpha(), (self.__w//12, self.__w//12)),
+      "XerocPulse1": sprite_cache.get('./Boss/Xeroc_cutscene_pulse1.png', (self.__w//3, self.__h//1.1), alpha=True, colorkey=(0, 0, 0)),
+      "XerocPulse2": sprite_cache.get('./Boss/Xeroc_cutscene_pulse2.png', (self.__w//3, self.__h//1.1), alpha=True, colorkey=(0, 0, 0)),
+      "Rocket": sprite_cache.get('./Sprites/Base_Rocket.png', (self.__w//13, self.__h//7), alpha=True, colorkey=(0, 0, 0)),
+      "XerocStep0Pulse1": sprite_cache.get('./Boss/Xeroc_mid_pulse1.png', (self.__w//3, self.__h//1.1), alpha=True, colorkey=(0, 0, 0)),
+      "XerocStep0Pulse2": sprite_cache.get('./Boss/Xeroc_mid_pulse2.png', (self.__w//3, self.__h//1.1), alpha=True, colorkey=(0, 0, 0)),
+      "BurnedSoul": sprite_cache.get('./Sprites/burned_soul.png', (self.__w//55, self.__h//28), alpha=True, colorkey=(0, 0, 0)),
+      "BurnedSoulD1": sprite_cache.get('./Sprites/burned_soul_death1.png', (self.__w//55, self.__h//28), alpha=True, colorkey=(0, 0, 0)),
+      "BurnedSoulD2": sprite_cache.get('./Sprites/burned_soul_death2.png', (self.__w//55, self.__h//28), alpha=True, colorkey=(0, 0, 0)),
+      "BurnedSoulD3": sprite_cache.get('./Sprites/burned_soul_death3.png', (self.__w//55, self.__h//28), alpha=True, colorkey=(0, 0, 0)),
+      "FloweyHappy1": sprite_cache.get('./Sprites/Flowey_happy_0.png', (self.__w//6, self.__h//5), alpha=True, colorkey=(0, 0, 0)),
+      "FloweyHappy2": sprite_cache.get('./Sprites/Flowey_happy_1.png', (self.__w//6, self.__h//5), alpha=True, colorkey=(0, 0, 0)),
+      "FloweyHappyR": sprite_cache.get('./Sprites/Flowey_base_looking_around.png', (self.__w//6, self.__h//5), alpha=True, colorkey=(0, 0, 0)),
+      "FloweyHappyL": sprite_cache.get('./Sprites/Flowey_base_looking_left.png', (self.__w//6, self.__h//5), alpha=True, colorkey=(0, 0, 0)),
+      "FloweyAfraid": sprite_cache.get('./Sprites/Flowey_afraid.png', (self.__w//6, self.__h//5), alpha=True, colorkey=(0, 0, 0)),
+      "FloweyAfraidD1": sprite_cache.get('./Sprites/Flowey_afraid_dying1.png', (self.__w//6, self.__h//5), alpha=True, colorkey=(0, 0, 0)),
+      "FloweyAfraidD2": sprite_cache.get('./Sprites/Flowey_afraid_dying2.png', (self.__w//6, self.__h//5), alpha=True, colorkey=(0, 0, 0)),
+      "FloweyAfraidD3": sprite_cache.get('./Sprites/Flowey_afraid_dying3.png', (self.__w//6, self.__h//5), alpha=True, colorkey=(0, 0, 0)),
+      "FloweyAfraidBurned": sprite_cache.get('./Sprites/Flowey_afraid_burned.png', (self.__w//6, self.__h//5), alpha=True, colorkey=(0, 0, 0)),
+      "FloweyAfraidBurnedD1": sprite_cache.get('./Sprites/Flowey_afraid_burned_dying1.png', (self.__w//6, self.__h//5), alpha=True, colorkey=(0, 0, 0)),
+      "FloweyAfraidBurnedD2": sprite_cache.get('./Sprites/Flowey_afraid_burned_dying2.png', (self.__w//6, self.__h//5), alpha=True, colorkey=(0, 0, 0)),
+      "FloweyAfraidBurnedD3": sprite_cache.get('./Sprites/Flowey_afraid_burned_dying3.png', (self.__w//6, self.__h//5), alpha=True, colorkey=(0, 0, 0)),
+      "Crack1": sprite_cache.get('./Sprites/ScreenCrack1.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      "Crack2": sprite_cache.get('./Sprites/ScreenCrack2.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      "Crack3": sprite_cache.get('./Sprites/ScreenCrack3.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      "Crack4": sprite_cache.get('./Sprites/ScreenCrack4.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      "RedHeart": sprite_cache.get('./Sprites/Red_heart.png', (self.__w//12, self.__w//12), alpha=True, colorkey=(0, 0, 0)),
     }
-    self.__souls = [transform.scale(image.load('./Sprites/teal_soul.png').convert_alpha(), (self.__w//55, self.__h//28)), 
-                    transform.scale(image.load('./Sprites/Yellow_soul.png').convert_alpha(), (self.__w//55, self.__h//28)), 
-                    transform.scale(image.load('./Sprites/Pink_soul.png').convert_alpha(), (self.__w//55, self.__h//28)),
-                    transform.scale(image.load('./Sprites/Orange_soul.png').convert_alpha(), (self.__w//55, self.__h//28)),
-                    transform.scale(image.load('./Sprites/Green_soul.png').convert_alpha(), (self.__w//55, self.__h//28)),
-                    transform.scale(image.load('./Sprites/Blue_soul.png').convert_alpha(), (self.__w//55, self.__h//28))]
+    self.__souls = [sprite_cache.get('./Sprites/teal_soul.png', (self.__w//55, self.__h//28), alpha=True, colorkey=(0, 0, 0)), 
+                    sprite_cache.get('./Sprites/Yellow_soul.png', (self.__w//55, self.__h//28), alpha=True, colorkey=(0, 0, 0)), 
+                    sprite_cache.get('./Sprites/Pink_soul.png', (self.__w//55, self.__h//28), alpha=True, colorkey=(0, 0, 0)),
+                    sprite_cache.get('./Sprites/Orange_soul.png', (self.__w//55, self.__h//28), alpha=True, colorkey=(0, 0, 0)),
+                    sprite_cache.get('./Sprites/Green_soul.png', (self.__w//55, self.__h//28), alpha=True, colorkey=(0, 0, 0)),
+                    sprite_cache.get('./Sprites/Blue_soul.png', (self.__w//55, self.__h//28), alpha=True, colorkey=(0, 0, 0))]
     self.__reglinespeed = 8/self.__fps
     self.__secretlinespeed = 8/self.__fps
     self.__spincounter = 0
@@ -940,12 +919,11 @@ class WonCutscene(Cutscene):
       
     }
     self.__go_textbox = Rect((self.__w//2 - w//10, 0), (w//5, h//4))
-    self.__button = Button(self.__screen, self.__w//2 - self.__w//6, self.__h*0.6, self.__w//3, self.__h//4, inactiveColour=(255, 255, 255), hoverColour=(155, 0, 0), shadowDistance = 0.5, pressedColour=(255, 0, 0), radius=10, textHAlign ='centre', textVAlign = 'centre', font=font.Font('fonts/DeterminationMonoWebRegular.ttf', 60), text='QUIT', margin=10)
+    self.__button = Button(self.__screen, self.__w//2 - self.__w//6, self.__h*0.6, self.__w//3, self.__h//4, inactiveColour=(255, 255, 255), hoverColour=(155, 0, 0), shadowDistance = 0.5, pressedColour=(255, 0, 0), radius=10, textHAlign ='centre', textVAlign = 'centre', font=font_cache.get('fonts/DeterminationMonoWebRegular.ttf', 60), text='QUIT', margin=10)
     self.button_rect = Rect((self.__button.getX(), self.__button.getY()), (self.__button.getWidth(), self.__button.getHeight()))
     self.__button.hide()
     self.__lyricstextbox = Rect((self.__w//2 - w//8, h//4), (w//4, h//4))
     self.__strip_background()
-    self.__regulate_sound()
   
   def __homogenic_step(self, soundname: str, lines: dict, steps: dict, spd: int) -> None:
     if self.__timer == 1:
@@ -1441,12 +1419,3 @@ class WonCutscene(Cutscene):
       
   def get_step(self) -> int:
     return self.__step
-  
-  def __regulate_sound(self) -> None:
-    for i in self.__sfx.values():
-      i.set_volume(0.2)
-    self.__sfx['hover'].set_volume(0.05)
-    self.__sfx['press'].set_volume(0.1)
-    self.__sfx['serenity'].set_volume(0.4)
-    self.__sfx['ExoSlash'].set_volume(0.4)
-    self.__sfx['Fire'].set_volume(0.5)
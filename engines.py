@@ -1,20 +1,28 @@
+from profiling import startup_profiler
+startup_profiler.track_imports()
 from pygame import *
-from widgets import Slider
+from widgets import Slider, FrameOverlay
 import abc
 from pygame_widgets.button import Button
-from pygame_widgets.textbox import TextBox
 from collections import defaultdict
 import pygame_widgets
 import time as tm
-from cutscenes import *
 import sys
+import zlib
 from entities import *
-import scipy.stats as sc
+from projectiles import ProjectileStore, FALLING_STAR, SHOOTING_STAR
+from collisions import CollisionWorld
+from rng import rng, spawn_rng
+from replay import ReplayWriter, ReplayReader
+from framestats import RingSampler
+from tracing import tracer
+from assets import sprite_cache, sound_bank, font_cache, AssetBundle, IncrementalLoader, PcmCache, asset_scope, release_assets, memory_report
+startup_profiler.milestone('imports')
 
 class Background:
   def __init__(self, w: int, h: int, speed:int, filename: str):
     self.bg_speed = speed
-    self.__bg = transform.scale(image.load(filename).convert(), (w, h))
+    self.__bg = sprite_cache.get(filename, (w, h))
     self.pos = 0
     self.h = h
     self.w = w
@@ -51,35 +59,48 @@ class Engine:
     pass
   
 class GameEngine(Engine):
-  def __init__(self, w: int, h: int, c: tuple[int], fps: int, screen: Surface, parent) ->None :
+  PHASE_HP = {1: 400, 2: 300, 3: 200, 4: 100}
+
+  def __init__(self, w: int, h: int, c: tuple[int], fps: int, screen: Surface, parent, batched: bool = False, pixel: bool = False, display_fps: int|None = None) ->None :
     self.c = c
     self.__w = w
     self.__h = h
     self.__screen = screen
     self.fps = fps
+    self.__step = 1/fps
+    self.__max_lag = 0.25
+    self.__display_fps = fps if display_fps is None else display_fps
+    self.__previous = {}
     self.__clock = time.Clock()
     self.__bg = Background(self.__w, self.__h, 2, 'BG.jpg')
     self.__lost = False
     self.__won = False
     self.__interrupted = False
     self.p = parent
+    self.projectiles = ProjectileStore(self.__w, self.__h, self, self.__screen) if batched else None
+    self.world = CollisionWorld(pixel=pixel)
     self.__player = Player(self.__w, self.__h, self, self.__screen)
     self.__boss = Boss(self.__w, self.__h, self, self.__screen)
+    self.world.add(self.__player)
+    self.world.add(self.__boss)
+    self.__pools = {
+      FallingStar: EntityPool(lambda: FallingStar(self.__w, self.__h, self, self.__screen), 16, self.world),
+      ShootingStar: EntityPool(lambda: ShootingStar(self.__w, self.__h, self, self.__screen), 16, self.world),
+      ShockerBreaker: EntityPool(lambda: ShockerBreaker(self.__w, self.__h, self, self.__screen), 12, self.world),
+      StarBomb: EntityPool(lambda: StarBomb(self.__w, self.__h, self, self.__screen), 1, self.world),
+    }
     self.__player_shots = self.__player.get_shots()
     self.__enemy_shots = []
     self.__shocker_breakers = []
-    self.__hover = mixer.Sound('./Soundeffects/Hover_Quit.mp3')
-    self.__press = mixer.Sound('./Soundeffects/Press.mp3')
-    self.__hover.set_volume(0.05)
-    self.__press.set_volume(0.1)
-    self.__pause_music = mixer.Sound('./Soundeffects/Their Fabricator.mp3')
-    self.__pause_music.set_volume(0.2)
+    self.__hover = sound_bank.get('./Soundeffects/Hover_Quit.mp3')
+    self.__press = sound_bank.get('./Soundeffects/Press.mp3')
+    self.__pause_music = sound_bank.get('./Soundeffects/Their Fabricator.mp3')
     self.__hovered_quit = False
     self.__hovered_resume = False
     self.__timer = 0
     self.__paused = False
-    self.__quit = Button(self.__screen, self.__w//2 - self.__w//6, self.__h*0.25, self.__w//3, self.__h*0.2, inactiveColour=(255, 255, 255), hoverColour=(155, 0, 0), shadowDistance = 0.5, pressedColour=(255, 0, 0), radius=10, textHAlign ='centre', textVAlign = 'centre', font=font.Font('fonts/DeterminationMonoWebRegular.ttf', 60), text='QUIT', margin=10)
-    self.__resume = Button(self.__screen, self.__w//2 - self.__w//6, self.__h*0.55, self.__w//3, self.__h*0.2, inactiveColour=(255, 255, 255), hoverColour=(0, 155, 0), shadowDistance = 0.5, pressedColour=(0, 255, 0), radius=10, textHAlign ='centre', textVAlign = 'centre', font=font.Font('fonts/DeterminationMonoWebRegular.ttf', 60), text='RESUME', margin=10)
+    self.__quit = Button(self.__screen, self.__w//2 - self.__w//6, self.__h*0.25, self.__w//3, self.__h*0.2, inactiveColour=(255, 255, 255), hoverColour=(155, 0, 0), shadowDistance = 0.5, pressedColour=(255, 0, 0), radius=10, textHAlign ='centre', textVAlign = 'centre', font=font_cache.get('fonts/DeterminationMonoWebRegular.ttf', 60), text='QUIT', margin=10)
+    self.__resume = Button(self.__screen, self.__w//2 - self.__w//6, self.__h*0.55, self.__w//3, self.__h*0.2, inactiveColour=(255, 255, 255), hoverColour=(0, 155, 0), shadowDistance = 0.5, pressedColour=(0, 255, 0), radius=10, textHAlign ='centre', textVAlign = 'centre', font=font_cache.get('fonts/DeterminationMonoWebRegular.ttf', 60), text='RESUME', margin=10)
     self.__quit.hide()
     self.__resume.hide()
     self.__quitrect = Rect((self.__quit.getX(), self.__quit.getY()), (self.__quit.getWidth(), self.__quit.getHeight()))
@@ -93,18 +114,20 @@ class GameEngine(Engine):
     self.__current_theme = 0
     self.__theme_started = False
     self.__player_dir = 0
+    self.__shoot = False
+    self.recorder = None
+    self.replay = None
+    self.sampler = None
+    self.__overlay = None
+    self.__hidden_sampler = None
     self.__star_falling_freq = 0.04
     self.__star_shooting_freq = 0
     self.__breaker_freq = 0
     self.__bomb_freq = 1_000_000*self.fps
-    self.__cell_size = 100
     self.__regular_star_limit = 8
     self.__Shocker_Breaker_limit = 3
     self.__bomb = None
     self.FRAMESKIP = fps//10 
-    self.current_stars = 0
-    self.current_ShockerBreakers = 0
-    self.current_bombs = 0
     self.bombspawned = False
     
 
@@ -123,6 +146,24 @@ class GameEngine(Engine):
     self.__resume.hide()
     self.__paused = False
   
+  @property
+  def current_stars(self) -> int:
+    stars = self.__pools[FallingStar].live + self.__pools[ShootingStar].live
+    if self.projectiles is not None:
+      stars += self.projectiles.live(FALLING_STAR) + self.projectiles.live(SHOOTING_STAR)
+    return stars
+
+  @property
+  def current_ShockerBreakers(self) -> int:
+    return self.__pools[ShockerBreaker].live
+
+  @property
+  def current_bombs(self) -> int:
+    return self.__pools[StarBomb].live
+
+  def __pool_of(self, entity: Entity) -> EntityPool:
+    return self.__pools[type(entity)]
+
   def get_player_coords(self) -> tuple[int]|list[int]:
     return self.__player.rect.topleft
     
@@ -135,7 +176,8 @@ class GameEngine(Engine):
   
   def __play_theme(self) -> None:
     if self.__current_theme < len(self.__music):
-      mixer.music.load(self.__music[self.__current_theme])
+      with tracer.span('mixer.music.load', 'audio', {'path': self.__music[self.__current_theme]}):
+        mixer.music.load(self.__music[self.__current_theme])
       mixer.music.set_volume(self.p._menu_engine.music_val)
       mixer.music.play()
   
@@ -158,51 +200,157 @@ class GameEngine(Engine):
   
   def run(self) -> None:
     self.__start_themes()
+    previous = tm.perf_counter()
+    lag = 0.0
     while not self.__lost and not self.__won and not self.__interrupted:
-      self.__check_event()
-      self.__logic()
-      self.__move()
-      self.__draw()
+      now = tm.perf_counter()
+      lag = min(lag + now - previous, self.__max_lag)
+      previous = now
+      lag = self.__frame(lag)
       self.__transition()
       self.__status_update()
 
+  def __frame(self, lag: float, alpha: float|None = None) -> float:
+    start = tm.perf_counter()
+    self.__phase('event', self.__check_event)
+    if self.__paused:
+      lag = 0.0
+    while lag >= self.__step and not self.__paused:
+      self.__tick()
+      lag -= self.__step
+    self.__phase('draw', self.__draw, lag/self.__step if alpha is None else alpha)
+    self.__phase('present', self.__present)
+    if self.sampler is not None:
+      self.sampler.frame()
+    tracer.complete('frame', 'frame', start, tm.perf_counter(), {'timer': self.__timer})
+    return lag
 
+  def __phase(self, name: str, method, *args) -> None:
+    if self.sampler is None and not tracer.enabled:
+      method(*args)
+    else:
+      start = tm.perf_counter()
+      method(*args)
+      end = tm.perf_counter()
+      if self.sampler is not None:
+        self.sampler.add(name, end - start)
+      tracer.complete(name, 'frame', start, end)
 
-  def __build_collision_grid(self):
-    grid = defaultdict(list)
-    
-    for shot in self.__player_shots:
-        cell_x = shot.rect.centerx // self.__cell_size
-        cell_y = shot.rect.centery // self.__cell_size
-        grid[(cell_x, cell_y)].append(shot)
-    
-    for enemy_shot in self.__enemy_shots:
-        cell_x = enemy_shot.rect.centerx // self.__cell_size
-        cell_y = enemy_shot.rect.centery // self.__cell_size
-        grid[(cell_x, cell_y)].append(enemy_shot)
-    return grid
-  
-  def __check_collisions_with_grid(self):
-    grid = self.__build_collision_grid()
-    
-    for (cell_x, cell_y), objects in grid.items():
-      nearby_good = []
-      nearby_evil = []
-      for dx in (-1, 0, 1):
-        for dy in (-1, 0, 1):
-          for obj in grid.get((cell_x + dx, cell_y + dy), []):
-            if obj.aff == 'good':
-              nearby_good.append(obj)
-            else:
-              nearby_evil.append(obj)
-      
-      for obj in objects:
-        if obj.aff == 'good':
-          for enemy in nearby_evil:
-            obj.collision(enemy)
-          obj.collision(self.__boss)
-        else:  
-          obj.collision(self.__player)
+  def __tick(self) -> None:
+    if self.replay is not None:
+      if self.replay.done:
+        self.__interrupted = True
+        return
+      self.__player_dir, self.__shoot = self.replay.read()
+    start = tm.perf_counter()
+    direction, shoot = self.__player_dir, self.__shoot
+    if shoot:
+      self.__shoot = False
+      self.__player.shoot()
+    self.__previous = {i: i.rect.center for i in self.__drawables()}
+    if self.__timer%self.FRAMESKIP == 0:
+      self.__phase('collide', self.__check_collisions)
+    self.__phase('logic', self.__logic)
+    self.__phase('move', self.__move)
+    if self.recorder is not None:
+      self.recorder.write(direction, shoot, self.state_hash() if self.recorder.hashed else None)
+    if self.replay is not None and self.replay.hashed:
+      self.replay.check(self.state_hash())
+    tracer.complete('tick', 'frame', start, tm.perf_counter())
+
+  def __check_outcome(self) -> None:
+    if not self.__player.get_state():
+      self.__lost = True
+    if not self.__boss.get_state():
+      self.__won = True
+
+  def control(self, direction: int, shoot: bool = False) -> None:
+    self.__player_dir = direction
+    self.__shoot = self.__shoot or shoot
+
+  def step(self) -> bool:
+    self.__tick()
+    self.__check_outcome()
+    return not (self.__lost or self.__won or self.__interrupted)
+
+  def frame(self) -> bool:
+    self.__frame(self.__step, 1.0)
+    return not (self.__lost or self.__won or self.__interrupted)
+
+  def toggle_overlay(self) -> None:
+    if self.__overlay is None:
+      self.__overlay = FrameOverlay(self.__screen, RingSampler(), font_cache.get('fonts/DeterminationMonoWebRegular.ttf', 22), budget_ms=1000/self.fps)
+    if self.sampler is self.__overlay.sampler:
+      self.sampler = self.__hidden_sampler
+      self.__hidden_sampler = None
+    else:
+      self.__hidden_sampler = self.sampler
+      self.sampler = self.__overlay.sampler
+
+  def start_phase(self, phase: int) -> None:
+    self.__boss.set_hp(self.PHASE_HP[phase])
+
+  def populate(self, kind: type, n: int) -> None:
+    if self.projectiles is not None:
+      store_kind = FALLING_STAR if kind is FallingStar else SHOOTING_STAR
+      missing = n - self.projectiles.live(store_kind)
+      if missing > 0:
+        if store_kind == FALLING_STAR:
+          self.projectiles.spawn_falling(missing)
+        else:
+          self.projectiles.spawn_shooting(self.get_player_coords(), missing)
+    else:
+      for i in range(n - self.__pools[kind].live):
+        self.__enemy_shots.append(self.__pools[kind].acquire())
+
+  def state_hash(self) -> int:
+    state = [self.__timer, self.__player.get_hp(), self.__boss.get_hp(), len(self.__enemy_shots)]
+    for entity in self.__drawables():
+      state.extend(entity.rect.topleft)
+    digest = zlib.crc32(repr(state).encode())
+    if self.projectiles is not None:
+      digest = self.projectiles.digest(digest)
+    return digest
+
+  def finish_replay(self) -> None:
+    if self.recorder is not None:
+      self.recorder.close()
+      if self.p.report:
+        print(f'[replay] recorded {self.recorder.ticks} ticks to {self.recorder.path}')
+    if self.replay is not None and self.p.report:
+      print(f'[replay] played {self.replay.position}/{self.replay.ticks} ticks, diverged at {self.replay.diverged}')
+
+  def status(self) -> dict:
+    return {
+      'timer': self.__timer,
+      'outcome': 'lost' if self.__lost else 'won' if self.__won else None,
+      'player_hp': self.__player.get_hp(),
+      'boss_hp': self.__boss.get_hp(),
+      'stars': self.current_stars,
+      'shots': self.__player.shotcount,
+    }
+
+  def __drawables(self) -> list:
+    drawables = [self.__boss, self.__player] + self.__player.get_shots() + self.__enemy_shots
+    if self.__bomb is not None:
+      drawables.append(self.__bomb)
+    return drawables
+
+  def __interpolate(self, alpha: float) -> list:
+    moved = []
+    for entity, (x, y) in self.__previous.items():
+      center = entity.rect.center
+      if center != (x, y):
+        moved.append((entity, center))
+        entity.rect.center = (x + (center[0] - x)*alpha, y + (center[1] - y)*alpha)
+    return moved
+
+
+
+  def __check_collisions(self) -> None:
+    if self.projectiles is not None:
+      self.projectiles.collide(self.__player, self.__boss)
+    self.world.collide()
           
   def __check_event(self) -> None:
     if not self.__paused:
@@ -210,8 +358,10 @@ class GameEngine(Engine):
       for ev in event.get():
         if ev.type == QUIT:
           self.__interrupted = True
-        if ev.type == KEYDOWN and ev.key == K_SPACE:
-          self.__player.shoot()
+        if ev.type == KEYDOWN and ev.key == K_SPACE and self.replay is None:
+          self.__shoot = True
+        elif ev.type == KEYDOWN and ev.key == K_F3:
+          self.toggle_overlay()
         elif ev.type == KEYDOWN and ev.key == K_ESCAPE:
           mixer.music.pause()
           self.__pause_music.play(-1)
@@ -219,24 +369,15 @@ class GameEngine(Engine):
           self.__resume.show()
           self.pause()
           
-      if self.__timer%self.FRAMESKIP == 0:    
-        self.__check_collisions_with_grid()
-        for i in self.__shocker_breakers:
-          i.collision(self.__player)
-        if not self.__bomb is None:
-          self.__bomb.collision(self.__player)
-        
-      if keys[K_a]:
-        self.__player_dir = -1
-      if keys[K_d]:
-        self.__player_dir = 1
-      if not (keys[K_a] or keys[K_d]):
-        self.__player_dir = 0
+      if self.replay is None:
+        if keys[K_a]:
+          self.__player_dir = -1
+        if keys[K_d]:
+          self.__player_dir = 1
+        if not (keys[K_a] or keys[K_d]):
+          self.__player_dir = 0
       
-      if not self.__player.get_state():
-        self.__lost = True
-      if not self.__boss.get_state():
-        self.__won = True
+      self.__check_outcome()
     else:
       mouse_pos = mouse.get_pos()
       events = event.get()
@@ -268,15 +409,22 @@ class GameEngine(Engine):
     if not self.__paused:
       self.__bg.update()
       self.__boss.move()
+      self.world.moved(self.__boss)
       self.__player.move(self.__player_dir)
+      self.world.moved(self.__player)
       if self.__player.shotcount > 0:
         for shot in self.__player_shots:
           shot.move()
+          self.world.moved(shot)
       if self.current_stars > 0:
         for enemy in self.__enemy_shots:
           enemy.move()
+          self.world.moved(enemy)
+      if self.projectiles is not None:
+        self.projectiles.move(self.__timer)
       if not self.__bomb is None:
         self.__bomb.move()
+        self.world.moved(self.__bomb)
   
   def __logic(self) -> None:
     if not self.__paused:
@@ -297,38 +445,53 @@ class GameEngine(Engine):
             i.logic()
       if not self.__bomb is None:
         self.__bomb.logic()
+      if self.projectiles is not None:
+        self.projectiles.logic(self.__timer)
         
       if (self.__timer//(self.fps//15))% 2 == 0:
-        val = np.random.random()
+        val = spawn_rng.random()
         if self.current_stars<self.__regular_star_limit:
           if self.__star_falling_freq >= val:
-            self.__enemy_shots.append(FallingStar(self.__w, self.__h, self, self.__screen))
+            tracer.instant('spawn FallingStar', 'spawn')
+            if self.projectiles is not None:
+              self.projectiles.spawn_falling()
+            else:
+              self.__enemy_shots.append(self.__pools[FallingStar].acquire())
           if self.__star_shooting_freq >= val:
-            self.__enemy_shots.append(ShootingStar(self.__w, self.__h, self, self.__screen))
+            tracer.instant('spawn ShootingStar', 'spawn')
+            if self.projectiles is not None:
+              self.projectiles.spawn_shooting(self.get_player_coords())
+            else:
+              self.__enemy_shots.append(self.__pools[ShootingStar].acquire())
         if self.current_ShockerBreakers<self.__Shocker_Breaker_limit:
           if self.__breaker_freq >= val:
+            tracer.instant('spawn ShockerBreaker', 'spawn', {'count': self.__Shocker_Breaker_limit})
             for i in range(self.__Shocker_Breaker_limit):
-              self.__shocker_breakers.append(ShockerBreaker(self.__w, self.__h, self, self.__screen))
+              self.__shocker_breakers.append(self.__pools[ShockerBreaker].acquire())
         if self.__bomb is None and self.__timer%self.__bomb_freq == 0 and self.__timer != 0:
           self.bombspawned = True
-          self.__bomb = StarBomb(self.__w, self.__h, self, self.__screen)
+          tracer.instant('spawn StarBomb', 'spawn')
+          self.__bomb = self.__pools[StarBomb].acquire()
           
       self.__boss.logic()
       self.__player.logic()
       self.__update_shots()
       if self.current_stars > 0:
-        self.__enemy_shots = [i for i in self.__enemy_shots if i.get_state()]
+        self.__enemy_shots = recycle(self.__enemy_shots, self.__pool_of)
       if self.current_ShockerBreakers > 0:
-        self.__shocker_breakers = [i for i in self.__shocker_breakers if i.get_state()]
+        self.__shocker_breakers = recycle(self.__shocker_breakers, self.__pool_of)
       if not self.__bomb is None:
         if not self.__bomb.get_state():
+          self.__pools[StarBomb].release(self.__bomb)
           self.__bomb = None
     
   
-  def __draw(self) -> None:
+  def __draw(self, alpha: float = 1.0) -> None:
     if not self.__paused:
-      self.__screen.blit(self.__bg.get_bg(), (0, self.__bg.pos))
-      self.__screen.blit(self.__bg.get_bg(), (0, self.__bg.pos-self.__h))
+      moved = self.__interpolate(alpha) if alpha < 1 else []
+      pos = (self.__bg.pos - self.__bg.bg_speed*(1 - alpha))%self.__h
+      self.__screen.blit(self.__bg.get_bg(), (0, pos))
+      self.__screen.blit(self.__bg.get_bg(), (0, pos-self.__h))
       self.__boss.draw()
       if self.current_stars > 0:
         for i in self.__enemy_shots:
@@ -336,20 +499,35 @@ class GameEngine(Engine):
       if self.__player.shotcount > 0:
         for i in self.__player_shots:
           i.draw()
+      if self.projectiles is not None:
+        self.projectiles.draw()
       if self.current_ShockerBreakers>0:
         for i in self.__shocker_breakers:
             i.draw()
       if not self.__bomb is None:
         self.__bomb.draw()
       self.__player.draw()
+      for entity, center in moved:
+        entity.rect.center = center
+      if self.__overlay is not None and self.sampler is self.__overlay.sampler:
+        self.__overlay.draw({
+          'stars': self.current_stars,
+          'breakers': self.current_ShockerBreakers,
+          'bombs': self.current_bombs,
+          'shots': self.__player.shotcount,
+        })
     else:
       self.__screen.fill((0, 0, 0))
       self.__quit.draw()
       self.__resume.draw()
+
+  def __present(self) -> None:
     display.flip()
-    self.__clock.tick(self.fps)
+    self.__clock.tick(self.__display_fps)
     
   def __status_update(self) -> str:
+    if self.__lost or self.__won or self.__interrupted:
+      self.finish_replay()
     if self.__lost:
       mixer.music.stop()
       mixer.music.unload()
@@ -386,9 +564,6 @@ class CutsceneEngine(Engine):
       self.__screen = screen
       self.fps = fps
       self.__clock = time.Clock()
-      self.__won = WonCutscene(self.__screen, self.__w, self.__h, self.fps, parent)
-      self.__lost = LostCutscene(self.__screen, self.__w, self.__h, self.fps)
-      self.__intro = IntroCutscene(self.__screen, self.__w, self.__h, self.fps)
       self.p = parent
       self.__scene = None
       self.__interrupted = False
@@ -396,7 +571,7 @@ class CutsceneEngine(Engine):
       
     def run(self, command: str) -> None:
       self.__run_cutscene(command=command)
-      while not self.__interrupted and not self.__current_cutscene.done:
+      while not self.__interrupted and self.__current_cutscene is not None:
         self.__check_event()
         self.__logic()
         self.__draw()
@@ -415,15 +590,28 @@ class CutsceneEngine(Engine):
             self.__current_cutscene.end()
     
     def __run_cutscene(self, command: str) -> None:
-      if command == 'cutscene_intro':
-        self.__scene = 'intro'
-        self.__current_cutscene = self.__intro
-      elif command == 'cutscene_lost':
-        self.__scene = 'lost'
-        self.__current_cutscene = self.__lost
-      elif command == 'cutscene_won':
-        self.__scene = 'won'
-        self.__current_cutscene = self.__won
+      from cutscenes import IntroCutscene, LostCutscene, WonCutscene
+      self.p.load(command)
+      before = sprite_cache.resident_bytes() + sound_bank.resident_bytes()
+      with asset_scope(command):
+        if command == 'cutscene_intro':
+          self.__scene = 'intro'
+          self.__current_cutscene = IntroCutscene(self.__screen, self.__w, self.__h, self.fps)
+        elif command == 'cutscene_lost':
+          self.__scene = 'lost'
+          self.__current_cutscene = LostCutscene(self.__screen, self.__w, self.__h, self.fps)
+        elif command == 'cutscene_won':
+          self.__scene = 'won'
+          self.__current_cutscene = WonCutscene(self.__screen, self.__w, self.__h, self.fps, self.p)
+      if self.p.report:
+        print(f'[assets] {command} loaded: {(sprite_cache.resident_bytes() + sound_bank.resident_bytes() - before)/2**20:.1f} MiB')
+    
+    def __unload_cutscene(self) -> None:
+      command = 'cutscene_' + self.__scene
+      self.__current_cutscene = None
+      freed = release_assets(command)
+      if self.p.report:
+        print(f'[assets] {command} released: {freed/2**20:.1f} MiB')
         
     def __draw(self) -> None:
       self.__current_cutscene.draw()
@@ -435,23 +623,22 @@ class CutsceneEngine(Engine):
       if self.__interrupted:
         self.p.state = 'over'
         self.p.execute()
-      if self.__current_cutscene.done and self.__scene == 'intro':
-        self.p.state = 'game'
-        self.p.execute()
-      if self.__current_cutscene.done and (self.__scene == 'won' or self.__scene == 'won'):
-        self.p.state = 'over'
-        self.p.execute()
+      if self.__current_cutscene.done:
+        self.__unload_cutscene()
+        if self.__scene == 'intro':
+          self.p.state = 'game'
+          self.p.execute()
+        elif self.__scene == 'won':
+          self.p.state = 'over'
+          self.p.execute()
 
 class MenuEngine(Engine):
   def __init__(self, w: int, h: int, c: tuple[int], fps: int, screen: Surface, parent) ->None :
     self.c = c
     self.music_val = 0.05
-    self.__hover_quit = mixer.Sound('./Soundeffects/Hover_Quit.mp3')
-    self.__hover_quit.set_volume(0.05)
-    self.__hover = mixer.Sound('./Soundeffects/Hover.mp3')
-    self.__hover.set_volume(0.08)
-    self.__press = mixer.Sound('./Soundeffects/Press.mp3')
-    self.__press.set_volume(0.1)
+    self.__hover_quit = sound_bank.get('./Soundeffects/Hover_Quit.mp3')
+    self.__hover = sound_bank.get('./Soundeffects/Hover.mp3')
+    self.__press = sound_bank.get('./Soundeffects/Press.mp3')
     self.__w = w
     self.__h = h
     self.__screen = screen
@@ -464,13 +651,13 @@ class MenuEngine(Engine):
     self.p = parent
     self.__hover_states = defaultdict(None)
     self.__buttons = [
-      Button(self.__screen, w//2-w//5, h//2-h//2.5, 2*w//5, 2*h//8, inactiveColour=(255, 255, 255), hoverColour=(0, 155, 0), shadowDistance = 0.5, pressedColour=(0, 255, 0), radius=10, textHAlign ='centre', textVAlign = 'centre', font=font.Font('fonts/DeterminationMonoWebRegular.ttf', 40), text='Begin Cutscene', margin=10, onClick = self.cutscene),
-      Button(self.__screen, w//2-w//5, h//2-h//2.5 + 30 + 2*h//8, 2*w//5, 2*h//8, inactiveColour=(255, 255, 255), hoverColour=(0, 155, 0), shadowDistance = 0.5, pressedColour=(0, 255, 0), radius=10, textHAlign ='centre', textVAlign = 'centre', font=font.Font('fonts/DeterminationMonoWebRegular.ttf', 40), text='Begin', margin=10, onClick = self.game),
-      Button(self.__screen, w//2-w//5, h//2-h//2.5 + 60 + 4*h//8, 2*w//5, 2*h//8, inactiveColour=(255, 255, 255), hoverColour=(155, 0, 0), shadowDistance = 0.5, pressedColour=(255, 0, 0), radius=10, textHAlign ='centre', textVAlign = 'centre', font=font.Font('fonts/DeterminationMonoWebRegular.ttf', 40), text='QUIT', margin=10, onClick = self.quit)
+      Button(self.__screen, w//2-w//5, h//2-h//2.5, 2*w//5, 2*h//8, inactiveColour=(255, 255, 255), hoverColour=(0, 155, 0), shadowDistance = 0.5, pressedColour=(0, 255, 0), radius=10, textHAlign ='centre', textVAlign = 'centre', font=font_cache.get('fonts/DeterminationMonoWebRegular.ttf', 40), text='Begin Cutscene', margin=10, onClick = self.cutscene),
+      Button(self.__screen, w//2-w//5, h//2-h//2.5 + 30 + 2*h//8, 2*w//5, 2*h//8, inactiveColour=(255, 255, 255), hoverColour=(0, 155, 0), shadowDistance = 0.5, pressedColour=(0, 255, 0), radius=10, textHAlign ='centre', textVAlign = 'centre', font=font_cache.get('fonts/DeterminationMonoWebRegular.ttf', 40), text='Begin', margin=10, onClick = self.game),
+      Button(self.__screen, w//2-w//5, h//2-h//2.5 + 60 + 4*h//8, 2*w//5, 2*h//8, inactiveColour=(255, 255, 255), hoverColour=(155, 0, 0), shadowDistance = 0.5, pressedColour=(255, 0, 0), radius=10, textHAlign ='centre', textVAlign = 'centre', font=font_cache.get('fonts/DeterminationMonoWebRegular.ttf', 40), text='QUIT', margin=10, onClick = self.quit)
       ]
     self.__button_rects = [Rect(button.getX(), button.getY(), button.getWidth(), button.getHeight()) for button in self.__buttons]
     self.__volume_slider = Slider(self.__w//9, h//2-h//2.5 + 30 + 2*h//8 +h//8, self.__w//6, self.__h//34, self.__screen, (50, 50, 50), (150, 0, 150), (0, 100, 167), (90, 0, 90), 2)
-    self.__music_icon = transform.scale(image.load('./Icon/Music Icon.png').convert(), (self.__w//12, 2*self.__h//25))  
+    self.__music_icon = sprite_cache.get('./Icon/Music Icon.png', (self.__w//12, 2*self.__h//25))  
     self.__slider_rect = self.__volume_slider.get_rect()
     self.__start_music()
     
@@ -509,6 +696,7 @@ class MenuEngine(Engine):
     while not self.__cutscene and not self.__interrupted and not self.__game:
       self.__check_event()
       self.__move()
+      self.p.loader.step()
       self.__draw()
       self.__status_update()
       
@@ -554,6 +742,11 @@ class MenuEngine(Engine):
       button.draw()
     self.__volume_slider.draw()
     display.flip()
+    if 'first menu frame' not in startup_profiler.milestones:
+      startup_profiler.milestone('first menu frame')
+      startup_profiler.stop_imports()
+      if self.p.report:
+        print(startup_profiler.report())
     self.__clock.tick(self.fps)
   
   def __status_update(self) -> str:
@@ -572,21 +765,64 @@ class MenuEngine(Engine):
       self.p.execute()
 
 class ControllerEngine:
-  def __init__(self, w: int, h: int, c: tuple[int], fps: int) ->None :
-    init()
-    self.__screen = display.set_mode((w, h), FULLSCREEN | SCALED)
-    self.__game_engine = GameEngine(w, h, c, fps, self.__screen, self)
-    self._menu_engine = MenuEngine(w, h, c, fps, self.__screen, self)
-    self.__cutscene_engine= CutsceneEngine(w, h, c, fps, self.__screen, self)
+  def __init__(self, w: int, h: int, c: tuple[int], fps: int, report: bool = False, load_budget_ms: float = 4.0, batched: bool = False, pixel: bool = False, display_fps: int|None = None, seed: int|None = None, record: str|None = None, replay: str|None = None, hashed: bool = False, trace: str|None = None) ->None :
+    start = tm.perf_counter()
+    if trace is not None:
+      tracer.start(trace)
+    self.report = report
+    self.__replay = ReplayReader(replay) if replay is not None else None
+    if self.__replay is not None:
+      seed, batched, pixel, fps = self.__replay.seed, self.__replay.batched, self.__replay.pixel, self.__replay.fps
+    self.seed = rng.seed(seed)
+    self.__record = record
+    self.__hashed = hashed
+    self.__batched = batched
+    self.__pixel = pixel
+    self.__display_fps = display_fps
+    self.__w = w
+    self.__h = h
+    self.__c = c
+    self.__fps = fps
+    with startup_profiler.section('engine', 'display'):
+      init()
+      self.__screen = display.set_mode((w, h), FULLSCREEN | SCALED)
+    sprite_cache.attach_bundle(AssetBundle('./.cache/sprites.bundle', (w, h)))
+    sound_bank.attach_cache(PcmCache('./.cache/pcm'))
+    self.loader = IncrementalLoader(sprite_cache, load_budget_ms)
+    self.loader.queue('game', 0)
+    self.loader.queue('cutscene_intro', 1)
+    self.__game_engine = None
+    with startup_profiler.section('engine', 'MenuEngine'):
+      self._menu_engine = MenuEngine(w, h, c, fps, self.__screen, self)
+    with startup_profiler.section('engine', 'CutsceneEngine'):
+      self.__cutscene_engine= CutsceneEngine(w, h, c, fps, self.__screen, self)
     mixer.set_num_channels(100)
     self._player_hp = 'TBD'
     self.state = 'menu'
+    if self.report:
+      print(f'[startup] {tm.perf_counter() - start:.3f} s seed={self.seed}', memory_report())
     
     
   
+  def load(self, owner: str) -> None:
+    ready = self.loader.progress(owner)
+    blocking = self.loader.flush(owner)
+    if self.report:
+      print(f'[loader] {owner}: {ready:.0%} preloaded, {blocking} loaded blocking')
+
   def execute(self) -> None:
+    tracer.instant(f'state {self.state}', 'engine', {'state': self.state})
     if self.state=='game':
-      self.__game_engine.run()
+      with asset_scope('game'):
+        if self.__game_engine is None:
+          self.load('game')
+          rng.seed(self.seed)
+          with startup_profiler.section('engine', 'GameEngine'):
+            self.__game_engine = GameEngine(self.__w, self.__h, self.__c, self.__fps, self.__screen, self, self.__batched, self.__pixel, self.__display_fps)
+          if self.__record is not None:
+            self.__game_engine.recorder = ReplayWriter(self.__record, self.seed, self.__fps, (self.__w, self.__h), self.__batched, self.__pixel, self.__hashed)
+          self.__game_engine.replay = self.__replay
+        self.__game_engine.run()
     elif self.state == 'menu':
       self._menu_engine.run()
     elif self.state == 'cutscene_intro':
@@ -596,9 +832,16 @@ class ControllerEngine:
     elif self.state == 'cutscene_won':
       self.__cutscene_engine.run('cutscene_won')
     elif self.state == 'over':
+      sprite_cache.save_bundle()
       quit()
       sys.exit()
  
      
-Game = ControllerEngine(1920, 1080, (0, 0, 0), 60)
-Game.execute()
\ No newline at end of file
+def option(name: str, default=None):
+  if name in sys.argv[:-1]:
+    return sys.argv[sys.argv.index(name) + 1]
+  return default
+
+if __name__ == '__main__':
+  Game = ControllerEngine(1920, 1080, (0, 0, 0), 60, report='--report' in sys.argv, batched='--batched' in sys.argv, pixel='--pixel' in sys.argv, display_fps=int(option('--fps', 60)), seed=None if option('--seed') is None else int(option('--seed')), record=option('--record'), replay=option('--replay'), hashed='--hash' in sys.argv, trace=option('--trace'))
+  Game.execute()
\ No newline at end of file
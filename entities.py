@@ -3,8 +3,11 @@ import abc
 from collections import defaultdict
 import time as tm
 import numpy as np
-import scipy.stats as sc
 from widgets import HealthBar, linear_coefficients
+from assets import sprite_cache, sound_bank
+from collisions import PLAYER, PLAYER_SHOT, STAR, HAZARD, BOSS
+from projectiles import SHOT
+from rng import spawn_rng, visual_rng, boss_rng
 
 
 class Entity(abc.ABC):
@@ -32,7 +35,52 @@ class Entity(abc.ABC):
   @abc.abstractmethod
   def strip_background():
     pass
+
+  @abc.abstractmethod
+  def reset():
+    pass
   
+def recycle(entities: list, pool_of) -> list:
+  alive = []
+  for i in entities:
+    if i.get_state():
+      alive.append(i)
+    else:
+      pool_of(i).release(i)
+  return alive
+
+class EntityPool:
+  def __init__(self, factory, size: int = 0, world=None) -> None:
+    self.__factory = factory
+    self.__world = world
+    self.__free = [factory() for i in range(size)]
+    self.live = 0
+    self.allocated = size
+
+  def acquire(self) -> Entity:
+    if self.__free:
+      entity = self.__free.pop()
+    else:
+      entity = self.__factory()
+      self.allocated += 1
+    entity.reset()
+    self.live += 1
+    if self.__world is not None:
+      self.__world.add(entity)
+    return entity
+
+  def release(self, entity: Entity) -> None:
+    self.live -= 1
+    if self.__world is not None:
+      self.__world.remove(entity)
+    self.__free.append(entity)
+
+  def recycle(self, entities: list) -> list:
+    return recycle(entities, lambda i: self)
+
+  def __len__(self) -> int:
+    return self.live
+
 class Shot(Entity):
   def __init__(self, w: int, h: int, parent, screen: Surface):
     self.__screen = screen
@@ -41,29 +89,31 @@ class Shot(Entity):
     self.__h = h//20
     self.__speed = 10
     self.__dmg = 2
-    self.__active = True
     self.__sprites = {
-      1: transform.scale(image.load('./Sprites/Shot.png').convert(), (self.__w, self.__h)),
-      2: transform.scale(image.load('./Sprites/ShotState2.png').convert(), (self.__w, self.__h)),
-      3: transform.scale(image.load('./Sprites/ShotState3.png').convert(), (self.__w, self.__h)),
-      4: transform.scale(image.load('./Sprites/ShotState4.png').convert(), (self.__w, self.__h))
+      1: sprite_cache.get('./Sprites/Shot.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      2: sprite_cache.get('./Sprites/ShotState2.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      3: sprite_cache.get('./Sprites/ShotState3.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      4: sprite_cache.get('./Sprites/ShotState4.png', (self.__w, self.__h), colorkey=(0, 0, 0))
     }
     self.strip_background()
-    self.__x, self.__y = parent.rect.midtop
+    self.layer = PLAYER_SHOT
+    self.mask = STAR | BOSS
+    self.reset()
+
+  def reset(self) -> None:
+    self.__active = True
+    self.__x, self.__y = self.__p.rect.midtop
     self.rect = self.__sprites[1].get_rect(midbottom = (self.__x, self.__y))
     self.__hit = False
     self.__hit_timer = 0
-    self.__add_shot()
-    self.aff = 'good'
     self.__hitbox = Rect((self.__x + self.__w//1.5, self.__y + self.__h//8), (self.__w - self.__w//1.5, self.__h-self.__h//8))
   
   def get_hitbox(self) -> Rect:
     return self.__hitbox
+
+  def get_mask(self) -> tuple[mask.Mask, Rect]:
+    return sprite_cache.mask(self.__sprites[1]), self.rect
   
-  def __add_shot(self) -> None:
-    self.__p.shotcount +=1
-  def __take_shot(self) -> None:
-    self.__p.shotcount -=1
   def strip_background(self):
     for i in self.__sprites.values():
       i.set_colorkey((0, 0, 0))
@@ -73,18 +123,15 @@ class Shot(Entity):
   
   def collision(self, other) -> None:
     if not self.__hit:
-      if type(other.get_hitbox())!=list:
-        if self.__hitbox.colliderect(other.get_hitbox()):
-          self.deal_dmg(other)
-          self.__hit = True
-          other.trigger_hurt()
-      elif type(other.get_hitbox())==list:
-        for i in other.get_hitbox():
-          if not self.__hit:
-            if self.__hitbox.colliderect(i):
-              self.deal_dmg(other)
-              self.__hit = True
-              other.trigger_hurt()
+      hitbox = other.get_hitbox()
+      if self.__hitbox.collidelist(hitbox if type(hitbox) == list else [hitbox]) != -1:
+        self.strike(other)
+
+  def strike(self, other) -> None:
+    if not self.__hit:
+      self.deal_dmg(other)
+      self.__hit = True
+      other.trigger_hurt()
 
   def logic(self) -> None:
     if self.__hit:
@@ -120,14 +167,10 @@ class Shot(Entity):
       self.__hitbox.midbottom = (self.__x-2, self.__y)
 
   
-  def __del__(self) -> None:
-    self.__take_shot()
-  
 class Player(Entity):
   
   def __init__(self, w: int, h: int, parent, screen: Surface) -> None:
     self.__max_hp = 250
-    self.__hp = 250
     self.__screen = screen
     self.__p = parent
     self.__shots = []
@@ -136,13 +179,11 @@ class Player(Entity):
     self.__w = w//13
     self.__h = h//7
     self.__speed = 10
-    self.__x = w//2
-    self.__y = h - self.__h
     self.__sprites = {
-      1: transform.scale(image.load('./Sprites/Base_Rocket.png').convert(), (self.__w, self.__h)),
-      2: transform.scale(image.load('./Sprites/Base_Rocket_fire.png').convert(), (self.__w, self.__h)),
-      3: transform.scale(image.load('./Sprites/Base_Rocket_shot.png').convert(), (self.__w, self.__h)),
-      4: transform.scale(image.load('./Sprites/Base_Rocket_shot_fire.png').convert(), (self.__w, self.__h)),
+      1: sprite_cache.get('./Sprites/Base_Rocket.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      2: sprite_cache.get('./Sprites/Base_Rocket_fire.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      3: sprite_cache.get('./Sprites/Base_Rocket_shot.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      4: sprite_cache.get('./Sprites/Base_Rocket_shot_fire.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
     }
     self.__hurt_sprites = {
       1: self.hurt_sprite(self.__sprites[1]),
@@ -151,42 +192,42 @@ class Player(Entity):
       4: self.hurt_sprite(self.__sprites[4]),
     }
     self.strip_background()
+    self.__hurt_CD = self.__p.fps//12
+    self.layer = PLAYER
+    self.mask = 0
+    self.reset()
+    self.__shot_pool = EntityPool(lambda: Shot(self.__parent_w, self.__parent_h, self, self.__screen), 8, self.__p.world)
+    self.__sounds = {
+      1: sound_bank.get('./Soundeffects/undertale-damage-taken.mp3'),
+      2: sound_bank.get('./Soundeffects/capper_shoot.mp3')
+    }
+    self.__healthbar= HealthBar(self.__w, self.__h//3, self.__screen, './Sprites/Red_heart.png', self.__h//3, self.__h//3)
+
+  def reset(self) -> None:
+    for i in self.__shots:
+      self.__shot_pool.release(i)
+    self.__shots = []
+    self.__hp = self.__max_hp
+    self.__x = self.__parent_w//2
+    self.__y = self.__parent_h - self.__h
     self.rect = self.__sprites[1].get_rect(topleft = (self.__x, self.__y))
     self.__shot = False
     self.__last_shot = None
     self.__shot_CD = self.__p.fps//3
     self.__animation_CD = self.__p.fps//6
-    self.__hurt_CD = self.__p.fps//12
     self.__hurt = False
-    self.aff = 'good'
-    self.shotcount = 0
     self.__alive = True
     self.__hitbox = Rect((self.__x + self.__w//1.65, self.__y + self.__h//4), (self.__w-self.__w//1.65, self.__h-self.__h//4))
-    self.__sounds = {
-      1: mixer.Sound('./Soundeffects/undertale-damage-taken.mp3'),
-      2: mixer.Sound('./Soundeffects/capper_shoot.mp3')
-    }
-    self.__regulate_sounds()
-    self.__healthbar= HealthBar(self.__w, self.__h//3, self.__screen, './Sprites/Red_heart.png', self.__h//3, self.__h//3)
 
   
   def get_hitbox(self) -> Rect:
     return self.__hitbox
-  
-  def __regulate_sounds(self) -> None:
-    self.__sounds[1].set_volume(0.08)
-    self.__sounds[2].set_volume(0.02)
+
+  def get_mask(self) -> tuple[mask.Mask, Rect]:
+    return sprite_cache.mask(self.__sprites[3 if self.__shot else 1]), self.rect
   
   def hurt_sprite(self, original: Surface) -> Surface:
-    sprite = original.copy()
-    pixel_array = surfarray.pixels3d(sprite)    
-    r, g, b = pixel_array[:,:,0], pixel_array[:,:,1], pixel_array[:,:,2]
-    brightness = (r + g + b) / 3
-    bright_mask = brightness > 50    
-    pixel_array[bright_mask, 0] = np.minimum(r[bright_mask] * 1.5, 255) 
-    pixel_array[bright_mask, 1] = g[bright_mask] * 0.5   
-    pixel_array[bright_mask, 2] = b[bright_mask] * 0.5     
-    return sprite
+    return sprite_cache.effect(original, 'tint', threshold=50, factors=(1.5, 0.5, 0.5))
     
   
   def strip_background(self) -> None:
@@ -205,18 +246,30 @@ class Player(Entity):
         self.__last_shot = self.__p.get_timer()
         self.__shot_CD = self.__p.fps//3
         self.__animation_CD = self.__p.fps//6
-        self.__shots.append(Shot(self.__parent_w, self.__parent_h, self, self.__screen))
+        self.__fire()
         self.__sounds[2].play()
     else:
       self.__shot = True
       self.__last_shot = self.__p.get_timer()
       self.__shot_CD = self.__p.fps//3
       self.__animation_CD = self.__p.fps//6
-      self.__shots.append(Shot(self.__parent_w, self.__parent_h, self, self.__screen))
+      self.__fire()
       self.__sounds[2].play()
   
+  def __fire(self) -> None:
+    if self.__p.projectiles is not None:
+      self.__p.projectiles.spawn_shot(self.rect.midtop)
+    else:
+      self.__shots.append(self.__shot_pool.acquire())
+
   def get_shots(self) -> np.ndarray:
     return self.__shots
+
+  @property
+  def shotcount(self) -> int:
+    if self.__p.projectiles is not None:
+      return self.__shot_pool.live + self.__p.projectiles.live(SHOT)
+    return self.__shot_pool.live
   
   def move(self, dir: int) -> None:
     self.__x += dir*self.__speed
@@ -252,7 +305,7 @@ class Player(Entity):
         self.__shot = False
         
     if self.shotcount > 0:
-      self.__shots = [i for i in self.__shots if i.get_state()]
+      self.__shots = self.__shot_pool.recycle(self.__shots)
     
     if self.__hp<=0:
       self.__alive = False
@@ -272,8 +325,8 @@ class Player(Entity):
         else:
           self.__screen.blit(self.__sprites[2], self.rect.topleft)
     else:
-      offset_x = np.random.choice([-10, -9, -8] + [10, 9, 8])
-      offset_y = np.random.choice([-10, -9, -8] + [10, 9, 8])
+      offset_x = visual_rng.choice([-10, -9, -8] + [10, 9, 8])
+      offset_y = visual_rng.choice([-10, -9, -8] + [10, 9, 8])
       if (self.__p.get_timer()//10)%2 == 0:
         if self.__shot is True:
           self.__screen.blit(self.__hurt_sprites[3], self.rect.topleft)
@@ -300,6 +353,9 @@ class Player(Entity):
   
   def check_hp(self) -> bool:
     return self.__hp == self.__max_hp
+
+  def get_hp(self) -> int|float:
+    return self.__hp
   
   def collision(self, other) -> None:
     '''Redundant for Player'''
@@ -313,51 +369,52 @@ class FallingStar(Entity):
     self.__parent_h = h
     self.__parent_w = w
     self.__p = parent
-    self.__origin = transform.scale(image.load('./Sprites/StarProjectile.png').convert(), (self.__w, self.__h)) 
-    self.__hurt_star_origin = transform.scale(image.load('./RRS/StarProjectileHurt.png').convert(), (self.__w, self.__h))
+    self.__origin = sprite_cache.get('./Sprites/StarProjectile.png', (self.__w, self.__h), colorkey=(0, 0, 0)) 
+    self.__hurt_star_origin = sprite_cache.get('./RRS/StarProjectileHurt.png', (self.__w, self.__h), colorkey=(0, 0, 0))
+    self.__dmg = 5
+    self.__speed = 4
+    self.__spin_speed = 12
+    self.__sheet = sprite_cache.rotations(self.__origin, self.__spin_speed)
+    self.__hurt_sheet = sprite_cache.rotations(self.__hurt_star_origin, self.__spin_speed)
+    self.layer = STAR
+    self.mask = PLAYER
+    self.__sounds = {
+      1: sound_bank.get('./Soundeffects/undertale-ding.mp3'),
+    }
+    self.strip_background()
+    self.reset()
+
+  def reset(self) -> None:
     self.__sprite = self.__origin
     self.__hurt_star = self.__hurt_star_origin
-    self.__dmg = 5
     self.__active = True
-    self.__speed = 4
     self.__hp = 6 
-    self.__x, self.__y = np.random.randint(0, w), np.random.randint(-self.__h-10, -self.__h)
+    self.__x, self.__y = spawn_rng.randint(0, self.__parent_w), spawn_rng.randint(-self.__h-10, -self.__h)
     self.rect = self.__sprite.get_rect(topleft = (self.__x, self.__y))
     self.__hit = False
     self.__hurt = False
     self.__hurt_CD = self.__p.fps//12
-    self.__spin_speed = 12
     self.__angle = 0
-    self.aff = 'evil'
     self.__hitbox = Rect((self.__x + self.__w//3.5, self.__y + self.__h//4), (self.__w-self.__w//3.5, self.__w-self.__w//3.5))
-    self.__sounds = {
-      1: mixer.Sound('./Soundeffects/undertale-ding.mp3'),
-    }
-    self.__regulate_sounds()
-    self.strip_background()
-    self.__add_star()
   
   def get_hitbox(self) -> Rect:
     return self.__hitbox
-  
-  def __add_star(self) -> None:
-    self.__p.current_stars +=1
-    
-  def __despawn_star(self) -> None:
-    self.__p.current_stars -=1
-  
-  def __regulate_sounds(self) -> None:
-    self.__sounds[1].set_volume(0.04)
+
+  def get_mask(self) -> tuple[mask.Mask, Rect]:
+    return sprite_cache.mask(self.__sprite), self.rect
   
   def deal_dmg(self, other: Player) -> None:
     other.take_dmg(self.__dmg)
   
   def collision(self, other: Player) -> None:
+    if self.__hitbox.colliderect(other.get_hitbox()):
+      self.strike(other)
+
+  def strike(self, other: Player) -> None:
     if not self.__hit:
-      if self.__hitbox.colliderect(other.get_hitbox()):
-        self.deal_dmg(other)
-        self.__hit = True
-        other.trigger_hurt()
+      self.deal_dmg(other)
+      self.__hit = True
+      other.trigger_hurt()
 
   def logic(self):
     if self.rect.topleft[1] > self.__parent_h:
@@ -389,8 +446,8 @@ class FallingStar(Entity):
   def move(self):
     if self.__p.get_timer()%3 == 0:
       self.__angle = (self.__angle + self.__spin_speed)
-      self.__sprite = transform.rotate(self.__origin, self.__angle)
-      self.__hurt_star = transform.rotate(self.__hurt_star_origin, self.__angle)
+      self.__sprite = self.__sheet[self.__angle]
+      self.__hurt_star = self.__hurt_sheet[self.__angle]
       self.rect = self.__sprite.get_rect(center=self.rect.center)   
     self.__y += self.__speed
     self.rect.center = (self.__x, self.__y)
@@ -407,9 +464,7 @@ class FallingStar(Entity):
     self.__hurt = True
     self.__sounds[1].play()
 
-  def __del__(self) -> None:
-    self.__despawn_star()
-    
+
 class ShootingStar(Entity):
   
   def __init__(self, w: int, h: int, parent, screen: Surface) -> None:
@@ -419,59 +474,62 @@ class ShootingStar(Entity):
     self.__parent_h = h
     self.__parent_w = w
     self.__p = parent
-    self.aff = 'evil'
+    self.layer = STAR
+    self.mask = PLAYER
     self.__origin = {
-      1: transform.scale(image.load('./RRS/StarProjectileR1.png').convert(), (self.__w, self.__h)),
-      2: transform.scale(image.load('./RRS/StarProjectileR2.png').convert(), (self.__w, self.__h)),
-      3: transform.scale(image.load('./RRS/StarProjectileR3.png').convert(), (self.__w, self.__h)),
-      4: transform.scale(image.load('./RRS/StarProjectileR4.png').convert(), (self.__w, self.__h)),
-      5: transform.scale(image.load('./RRS/StarProjectileR5.png').convert(), (self.__w, self.__h)),
-      6: transform.scale(image.load('./RRS/StarProjectileR6.png').convert(), (self.__w, self.__h)),
-      7: transform.scale(image.load('./RRS/StarProjectileR7.png').convert(), (self.__w, self.__h)),
-      8: transform.scale(image.load('./RRS/StarProjectileR8.png').convert(), (self.__w, self.__h)),
-      9: transform.scale(image.load('./RRS/StarProjectileR9.png').convert(), (self.__w, self.__h)),
-      10: transform.scale(image.load('./RRS/StarProjectileR10.png').convert(), (self.__w, self.__h)),
-      11: transform.scale(image.load('./RRS/StarProjectileR11.png').convert(), (self.__w, self.__h)),
-      12: transform.scale(image.load('./RRS/StarProjectileR12.png').convert(), (self.__w, self.__h)),
-      13: transform.scale(image.load('./RRS/StarProjectileR13.png').convert(), (self.__w, self.__h)),
-      14: transform.scale(image.load('./RRS/StarProjectileR14.png').convert(), (self.__w, self.__h)),
+      1: sprite_cache.get('./RRS/StarProjectileR1.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      2: sprite_cache.get('./RRS/StarProjectileR2.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      3: sprite_cache.get('./RRS/StarProjectileR3.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      4: sprite_cache.get('./RRS/StarProjectileR4.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      5: sprite_cache.get('./RRS/StarProjectileR5.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      6: sprite_cache.get('./RRS/StarProjectileR6.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      7: sprite_cache.get('./RRS/StarProjectileR7.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      8: sprite_cache.get('./RRS/StarProjectileR8.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      9: sprite_cache.get('./RRS/StarProjectileR9.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      10: sprite_cache.get('./RRS/StarProjectileR10.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      11: sprite_cache.get('./RRS/StarProjectileR11.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      12: sprite_cache.get('./RRS/StarProjectileR12.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      13: sprite_cache.get('./RRS/StarProjectileR13.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      14: sprite_cache.get('./RRS/StarProjectileR14.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
     }
     self.__origin_keys = list(self.__origin.keys())
-    self.__original = self.__origin[np.random.choice(self.__origin_keys)]
-    self.__sprite = self.__original
-    self.__dmg = 10
-    self.__active = True
-    self.__hp = np.inf
-    self.__x, self.__y = np.random.choice(np.arange(-self.__w - 30, -self.__w).tolist() + np.arange(self.__parent_w + self.__w, self.__parent_w + self.__w + 30).tolist()), np.random.randint(0, self.__parent_h//2)
-    self.rect = self.__sprite.get_rect(topleft = (self.__x, self.__y))
-    self.__hit = False
     self.__spin_speed = 19
+    self.__sheets = {k: sprite_cache.rotations(v, self.__spin_speed) for k, v in self.__origin.items()}
+    self.__starts = np.arange(-self.__w - 30, -self.__w).tolist() + np.arange(self.__parent_w + self.__w, self.__parent_w + self.__w + 30).tolist()
+    self.__dmg = 10
     self.FRAMESKIP = 4
-    self.__angle = 0
-    self.__intercept, self.__slope = linear_coefficients(self.__p.get_player_coords(), self.rect.topleft)
-    self.__hitbox = Rect((self.__x + self.__w//3.5, self.__y + self.__h//4), (self.__w-self.__w//3.5, self.__w-self.__w//3.5))
     self.__sounds = {
-      1: mixer.Sound('./Soundeffects/squeak.mp3'),
-      2: mixer.Sound('./Soundeffects/Mana_star.mp3')
+      1: sound_bank.get('./Soundeffects/squeak.mp3'),
+      2: sound_bank.get('./Soundeffects/Mana_star.mp3')
     }
-    self.__step = self.__step_setter()
     self.__tails = {
       1: 90,
       2: 60,
       3: 30,
     }
-    self.__regulate_sounds()
+    self.reset()
     self.strip_background()
-    self.__add_star()
+
+  def reset(self) -> None:
+    self.__original_key = spawn_rng.choice(self.__origin_keys)
+    self.__original = self.__origin[self.__original_key]
+    self.__sheet = self.__sheets[self.__original_key]
+    self.__sprite = self.__original
+    self.__active = True
+    self.__hp = np.inf
+    self.__x, self.__y = spawn_rng.choice(self.__starts), spawn_rng.randint(0, self.__parent_h//2)
+    self.rect = self.__sprite.get_rect(topleft = (self.__x, self.__y))
+    self.__hit = False
+    self.__angle = 0
+    self.__intercept, self.__slope = linear_coefficients(self.__p.get_player_coords(), self.rect.topleft)
+    self.__hitbox = Rect((self.__x + self.__w//3.5, self.__y + self.__h//4), (self.__w-self.__w//3.5, self.__w-self.__w//3.5))
+    self.__step = self.__step_setter()
   
   def get_hitbox(self) -> Rect:
     return self.__hitbox
-  
-  def __add_star(self) -> None:
-    self.__p.current_stars +=1
-    
-  def __despawn_star(self) -> None:
-    self.__p.current_stars -=1
+
+  def get_mask(self) -> tuple[mask.Mask, Rect]:
+    return sprite_cache.mask(self.__sprite), self.rect
   
   def __step_setter(self) -> int:
     if self.rect.centerx<self.__p.get_player_coords()[0]:
@@ -479,10 +537,6 @@ class ShootingStar(Entity):
     elif self.rect.centerx>self.__p.get_player_coords()[0]:
       return -6
     
-  def __regulate_sounds(self) -> None:
-    self.__sounds[1].set_volume(0.08)
-    self.__sounds[2].set_volume(0.01)
-  
   def __trail(self, original: Surface, alpha: int) -> Surface:
     sprite = original.copy()
     sprite.set_alpha(alpha)
@@ -494,11 +548,14 @@ class ShootingStar(Entity):
     return self.__intercept + self.__slope*x
   
   def collision(self, other) -> None:
+    if self.__hitbox.colliderect(other.get_hitbox()):
+      self.strike(other)
+
+  def strike(self, other) -> None:
     if not self.__hit:
-      if self.__hitbox.colliderect(other.get_hitbox()):
-        self.deal_dmg(other)
-        self.__hit = True
-        other.trigger_hurt()
+      self.deal_dmg(other)
+      self.__hit = True
+      other.trigger_hurt()
 
   def logic(self) -> None:
     if self.rect.topleft[1] > self.__parent_h:
@@ -525,10 +582,12 @@ class ShootingStar(Entity):
   
   def move(self) -> None:
     if (self.__p.get_timer()%(self.__p.fps//15)) == 0:
-      self.__original = self.__origin[(self.__p.get_timer()//(self.__p.fps//16))%14+1]
+      self.__original_key = (self.__p.get_timer()//(self.__p.fps//16))%14+1
+      self.__original = self.__origin[self.__original_key]
+      self.__sheet = self.__sheets[self.__original_key]
     if self.__p.get_timer()%self.FRAMESKIP == 0:
       self.__angle = (self.__angle + self.__spin_speed)
-      self.__sprite = transform.rotate(self.__original, self.__angle)
+      self.__sprite = self.__sheet[self.__angle]
       self.rect = self.__sprite.get_rect(center=self.rect.center)   
     self.__x += self.__step
     self.__y = self.__linear_function(self.__x)
@@ -548,71 +607,65 @@ class ShootingStar(Entity):
     
   def trigger_hurt(self) -> None:
     self.__sounds[1].play()
-    
-  def __del__(self) -> None:
-    self.__despawn_star()
 
 class ShockerBreaker(Entity):
   def __init__(self, w: int, h: int, parent, screen: Surface) -> None:
     self.__screen = screen
     self.__h = h
     self.__w = w//15
-    self.__sound_played = False
+    self.__parent_w = w
     self.__p = parent
-    self.__x = np.random.randint(0, w-self.__w)
     self.__y = 0
-    self.__active = True
-    self.__timer = 0
-    self.aff = 'evil'
-    self.__warning = transform.scale(image.load('./Sprites/Warning.png').convert(), (self.__w, self.__w))
+    self.layer = HAZARD
+    self.mask = PLAYER
+    self.__warning = sprite_cache.get('./Sprites/Warning.png', (self.__w, self.__w), colorkey=(0, 0, 0))
     self.__sprite = {
-      1:transform.scale(image.load('./ShockerBreaker/ShockerBreaker1.png').convert(), (self.__w, self.__h)),
-      2:transform.scale(image.load('./ShockerBreaker/ShockerBreaker9.png').convert(), (self.__w, self.__h)),
-      3:transform.scale(image.load('./ShockerBreaker/ShockerBreaker3.png').convert(), (self.__w, self.__h)),
-      4:transform.scale(image.load('./ShockerBreaker/ShockerBreaker11.png').convert(), (self.__w, self.__h)),
-      5:transform.scale(image.load('./ShockerBreaker/ShockerBreaker5.png').convert(), (self.__w, self.__h)),
-      6:transform.scale(image.load('./ShockerBreaker/ShockerBreaker13.png').convert(), (self.__w, self.__h)),
-      7:transform.scale(image.load('./ShockerBreaker/ShockerBreaker7.png').convert(), (self.__w, self.__h)),
-      8:transform.scale(image.load('./ShockerBreaker/ShockerBreaker8.png').convert(), (self.__w, self.__h)),
-      9:transform.scale(image.load('./ShockerBreaker/ShockerBreaker2.png').convert(), (self.__w, self.__h)),
-      10:transform.scale(image.load('./ShockerBreaker/ShockerBreaker10.png').convert(), (self.__w, self.__h)),
-      11:transform.scale(image.load('./ShockerBreaker/ShockerBreaker4.png').convert(), (self.__w, self.__h)),
-      12:transform.scale(image.load('./ShockerBreaker/ShockerBreaker12.png').convert(), (self.__w, self.__h)),
-      13:transform.scale(image.load('./ShockerBreaker/ShockerBreaker6.png').convert(), (self.__w, self.__h)),
-      14:transform.scale(image.load('./ShockerBreaker/ShockerBreaker14.png').convert(), (self.__w, self.__h)),
+      1:sprite_cache.get('./ShockerBreaker/ShockerBreaker1.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      2:sprite_cache.get('./ShockerBreaker/ShockerBreaker9.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      3:sprite_cache.get('./ShockerBreaker/ShockerBreaker3.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      4:sprite_cache.get('./ShockerBreaker/ShockerBreaker11.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      5:sprite_cache.get('./ShockerBreaker/ShockerBreaker5.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      6:sprite_cache.get('./ShockerBreaker/ShockerBreaker13.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      7:sprite_cache.get('./ShockerBreaker/ShockerBreaker7.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      8:sprite_cache.get('./ShockerBreaker/ShockerBreaker8.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      9:sprite_cache.get('./ShockerBreaker/ShockerBreaker2.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      10:sprite_cache.get('./ShockerBreaker/ShockerBreaker10.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      11:sprite_cache.get('./ShockerBreaker/ShockerBreaker4.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      12:sprite_cache.get('./ShockerBreaker/ShockerBreaker12.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      13:sprite_cache.get('./ShockerBreaker/ShockerBreaker6.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      14:sprite_cache.get('./ShockerBreaker/ShockerBreaker14.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
     }
-    self.__current = self.__sprite[np.random.choice(list(self.__sprite.keys()))]
     self.__sounds = {
-      1: mixer.Sound('./Soundeffects/Shocker Breaker.mp3'),
+      1: sound_bank.get('./Soundeffects/Shocker Breaker.mp3'),
     }
+    self.__dmg = 35
+    self.strip_background()
+    self.reset()
+
+  def reset(self) -> None:
+    self.__sound_played = False
+    self.__x = spawn_rng.randint(0, self.__parent_w-self.__w)
+    self.__active = True
+    self.__timer = 0
+    self.__current = self.__sprite[visual_rng.choice(list(self.__sprite.keys()))]
     self.rect = Rect((self.__x, self.__h - self.__w//4), (self.__w, 1))
     self.__truerect = self.__sprite[1].get_rect(topleft=(self.__x, self.__y))
-    self.__warning_rect = self.__warning.get_rect(topleft = (self.__x, h-self.__w))
-    self.__dmg = 35
+    self.__warning_rect = self.__warning.get_rect(topleft = (self.__x, self.__h-self.__w))
     self.__hit = False
-    self.__hitbox = Rect((self.__x + self.__w//11, self.__y + h*0.9), (self.__w-self.__w//9, h*0.05))
-    self.strip_background()
-    self.__regulate_sounds()
-    self.__add_breaker()
+    self.__hitbox = Rect((self.__x + self.__w//11, self.__y + self.__h*0.9), (self.__w-self.__w//9, self.__h*0.05))
   
   def get_hitbox(self) -> Rect:
     return self.__hitbox
   
-  def __add_breaker(self) -> None:
-    self.__p.current_ShockerBreakers +=1
-    
-  def __take_breaker(self) -> None:
-    self.__p.current_ShockerBreakers -=1
-  
-  def __regulate_sounds(self) -> None:
-    self.__sounds[1].set_volume(0.05)
-    
   def collision(self, other: Player) -> None:
+    if self.__hitbox.colliderect(other.get_hitbox()):
+      self.strike(other)
+
+  def strike(self, other: Player) -> None:
     if self.__timer> self.__p.fps and not self.__hit:
-      if self.__hitbox.colliderect(other.get_hitbox()):
-        self.deal_dmg(other)
-        self.__hit = True
-        other.trigger_hurt()
+      self.deal_dmg(other)
+      self.__hit = True
+      other.trigger_hurt()
 
   def logic(self) -> None:
     self.__timer+=1
@@ -649,9 +702,6 @@ class ShockerBreaker(Entity):
     for sprite in self.__sprite.values():
       sprite.set_colorkey((0, 0, 0))
     self.__warning.set_colorkey((0, 0, 0))
-      
-  def __del__(self) -> None:
-    self.__take_breaker()
 
 class StarBomb(Entity):
 
@@ -660,36 +710,26 @@ class StarBomb(Entity):
     self.__w = w//5
     self.__ph = h
     self.__h = w//5
+    self.__pw = w
     self.__p = parent
-    self.__x, self.__y = np.random.choice([-self.__w, self.__w+w]), np.random.randint(0, h//2)
-    self.__dest_x, self.__dest_y = np.random.randint(w//4, w*0.75), np.random.randint(h*0.75, h)
-    self.__intercept, self.__slope = linear_coefficients((self.__dest_x, self.__dest_y), (self.__x, self.__y))
-    self.__speed = self.__step_setter()
     self.__dmg = 75
-    self.__timer = 0
-    self.__active = True
     self.__origin = {
-      1: transform.scale(image.load('./StarBombs/StarBomb1.png').convert(), (self.__w, self.__h)),
-      2: transform.scale(image.load('./StarBombs/StarBomb2.png').convert(), (self.__w, self.__h)),
-      3: transform.scale(image.load('./StarBombs/StarBomb3.png').convert(), (self.__w, self.__h)),
-      4: transform.scale(image.load('./StarBombs/StarBomb4.png').convert(), (self.__w, self.__h)),
-      5: transform.scale(image.load('./StarBombs/StarBomb5.png').convert(), (self.__w, self.__h)),
-      6: transform.scale(image.load('./StarBombs/StarBomb6.png').convert(), (self.__w, self.__h)),
-      7: transform.scale(image.load('./StarBombs/StarBomb7.png').convert(), (self.__w, self.__h)),
-      8: transform.scale(image.load('./StarBombs/StarBomb8.png').convert(), (self.__w, self.__h)),
-      9: transform.scale(image.load('./StarBombs/StarBomb9.png').convert(), (self.__w, self.__h)),
-      10: transform.scale(image.load('./StarBombs/StarBomb10.png').convert(), (self.__w, self.__h)),
+      1: sprite_cache.get('./StarBombs/StarBomb1.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      2: sprite_cache.get('./StarBombs/StarBomb2.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      3: sprite_cache.get('./StarBombs/StarBomb3.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      4: sprite_cache.get('./StarBombs/StarBomb4.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      5: sprite_cache.get('./StarBombs/StarBomb5.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      6: sprite_cache.get('./StarBombs/StarBomb6.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      7: sprite_cache.get('./StarBombs/StarBomb7.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      8: sprite_cache.get('./StarBombs/StarBomb8.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      9: sprite_cache.get('./StarBombs/StarBomb9.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
+      10: sprite_cache.get('./StarBombs/StarBomb10.png', (self.__w, self.__h), colorkey=(0, 0, 0)),
     }
-    self.__sprite = self.__origin[1]
-    self.rect = self.__sprite.get_rect(topleft=(self.__x, self.__y))
-    self.__exp_center = self.rect.center
     self.__r = self.__w*1.5
-    self.__r_draw = 0
     self.__r_step = self.__r / (self.__p.fps*0.25)
-    self.__hit = False
     self.__sounds = {
-      1: mixer.Sound('./Soundeffects/asriels-star-blazing-summon.mp3'),
-      2: mixer.Sound('./Soundeffects/undertale-bomb-explosion.mp3')
+      1: sound_bank.get('./Soundeffects/asriels-star-blazing-summon.mp3'),
+      2: sound_bank.get('./Soundeffects/undertale-bomb-explosion.mp3')
     }
     self.__chaos_colors ={
       1:(79, 16, 9),
@@ -728,10 +768,27 @@ class StarBomb(Entity):
       2: 85,
       3: 55,
     }
-    self.__cur_color = self.__chaos_colors[1]
-    self.__add_bomb()
+    self.layer = HAZARD
+    self.mask = PLAYER
     self.strip_background()
-    self.regulate_sounds()
+    self.reset()
+
+  def reset(self) -> None:
+    w, h = self.__pw, self.__ph
+    self.__x, self.__y = spawn_rng.choice([-self.__w, self.__w+w]), spawn_rng.randint(0, h//2)
+    self.__dest_x, self.__dest_y = spawn_rng.randint(w//4, w*0.75), spawn_rng.randint(h*0.75, h)
+    self.__intercept, self.__slope = linear_coefficients((self.__dest_x, self.__dest_y), (self.__x, self.__y))
+    self.__speed = self.__step_setter()
+    self.__timer = 0
+    self.__active = True
+    self.__sprite = self.__origin[1]
+    self.rect = self.__sprite.get_rect(topleft=(self.__x, self.__y))
+    self.__exp_center = self.rect.center
+    self.__hitbox = Rect(0, 0, 2*self.__r, 2*self.__r)
+    self.__hitbox.center = self.__exp_center
+    self.__r_draw = 0
+    self.__hit = False
+    self.__cur_color = self.__chaos_colors[1]
 
   def __trail(self, original: Surface, alpha: int) -> Surface:
     sprite = original.copy()
@@ -739,25 +796,25 @@ class StarBomb(Entity):
     
     return sprite
   
-  def __add_bomb(self) -> None:
-    self.__p.current_bombs+=1
-
-  def __take_bomb(self) -> None:
-    self.__p.current_bombs-=1
-
   def __linear_function(self, x: int) -> int|float:
     return self.__intercept + self.__slope * x
   
   def __step_setter(self) -> int:
     if self.__x < self.__dest_x:
-      return np.random.choice([4, 3, 5])
+      return spawn_rng.choice([4, 3, 5])
     else:
-      return np.random.choice([-4, -3, -5])
+      return spawn_rng.choice([-4, -3, -5])
+
+  def get_hitbox(self) -> Rect:
+    return self.__hitbox
 
   def deal_dmg(self, other: Player) -> None:
     other.take_dmg(self.__dmg)
 
   def collision(self, other: Player) -> None:
+    self.strike(other)
+
+  def strike(self, other: Player) -> None:
     if self.__p.fps*4 <= self.__timer <= self.__p.fps*4.25 and not self.__hit:
       px = other.rect.centerx
       py = other.rect.centery
@@ -806,107 +863,106 @@ class StarBomb(Entity):
       self.__y = self.__linear_function(self.__x)
       self.rect.topleft = (self.__x, self.__y)
       self.__exp_center = self.rect.center
+      self.__hitbox.center = self.__exp_center
   
   def strip_background(self) -> None:
     for i in self.__origin.values():
       i.set_colorkey((0, 0, 0))
-  
-  def regulate_sounds(self) -> None:
-    self.__sounds[1].set_volume(0.05)
-    self.__sounds[2].set_volume(0.1)
-
-  def __del__(self) -> None:
-    self.__take_bomb()
 
 class Boss(Entity):
   
   def __init__(self, w: int, h: int, parent, screen: Surface) -> None:
-    self.__played1 = False
-    self.__played2 = False
-    self.__played3 = False
-    self.__phase = 1
     self.__maxhp = 400
-    self.__hp = 400
     self.__w = w//3
     self.__h = h//1.1
-    self.__x = w//2
-    self.__y = -80
+    self.__parent_w = w
     self.__winkCD = 18
     self.__hitCD = 10
-    self.__winktimer = 0
-    self.__hittimer = 0
-    self.__wink = False
-    self.__hit = False
     self.__p = parent
     self.__screen = screen
-    self.__alive = True
-    self.__dir = 1
-    self.__curkey = 1
     self.__stage1_keys = [1, 2, 3, 4, 5, 6, 7, 8]
     self.__stage123sprites_nothit = {
-      1: transform.scale(image.load('./Boss/Xeroc_bottomleft.png').convert_alpha(), (self.__w, self.__h)),
-      2: transform.scale(image.load('./Boss/Xeroc_topright.png').convert_alpha(), (self.__w, self.__h)),
-      3: transform.scale(image.load('./Boss/Xeroc_bottomright.png').convert_alpha(), (self.__w, self.__h)),
-      4: transform.scale(image.load('./Boss/Xeroc_midbottom.png').convert_alpha(), (self.__w, self.__h)),
-      5: transform.scale(image.load('./Boss/Xeroc_midleft.png').convert_alpha(), (self.__w, self.__h)),
-      6: transform.scale(image.load('./Boss/Xeroc_midright.png').convert_alpha(), (self.__w, self.__h)),
-      7: transform.scale(image.load('./Boss/Xeroc_midtop.png').convert_alpha(), (self.__w, self.__h)),
-      8: transform.scale(image.load('./Boss/Xeroc_topleft.png').convert_alpha(), (self.__w, self.__h)),
+      1: sprite_cache.get('./Boss/Xeroc_bottomleft.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      2: sprite_cache.get('./Boss/Xeroc_topright.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      3: sprite_cache.get('./Boss/Xeroc_bottomright.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      4: sprite_cache.get('./Boss/Xeroc_midbottom.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      5: sprite_cache.get('./Boss/Xeroc_midleft.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      6: sprite_cache.get('./Boss/Xeroc_midright.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      7: sprite_cache.get('./Boss/Xeroc_midtop.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      8: sprite_cache.get('./Boss/Xeroc_topleft.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
     }
     self.__stage123sprites_hit = {
-      1: transform.scale(image.load('./Boss/Xeroc_bottomleft_hit.png').convert_alpha(), (self.__w, self.__h)),
-      2: transform.scale(image.load('./Boss/Xeroc_topright_hit.png').convert_alpha(), (self.__w, self.__h)),
-      3: transform.scale(image.load('./Boss/Xeroc_bottomright_hit.png').convert_alpha(), (self.__w, self.__h)),
-      4: transform.scale(image.load('./Boss/Xeroc_midbottom_hit.png').convert_alpha(), (self.__w, self.__h)),
-      5: transform.scale(image.load('./Boss/Xeroc_midleft_hit.png').convert_alpha(), (self.__w, self.__h)),
-      6: transform.scale(image.load('./Boss/Xeroc_midright_hit.png').convert_alpha(), (self.__w, self.__h)),
-      7: transform.scale(image.load('./Boss/Xeroc_midtop_hit.png').convert_alpha(), (self.__w, self.__h)),
-      8: transform.scale(image.load('./Boss/Xeroc_topleft_hit.png').convert_alpha(), (self.__w, self.__h)),
+      1: sprite_cache.get('./Boss/Xeroc_bottomleft_hit.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      2: sprite_cache.get('./Boss/Xeroc_topright_hit.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      3: sprite_cache.get('./Boss/Xeroc_bottomright_hit.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      4: sprite_cache.get('./Boss/Xeroc_midbottom_hit.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      5: sprite_cache.get('./Boss/Xeroc_midleft_hit.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      6: sprite_cache.get('./Boss/Xeroc_midright_hit.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      7: sprite_cache.get('./Boss/Xeroc_midtop_hit.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      8: sprite_cache.get('./Boss/Xeroc_topleft_hit.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
     }
     self.__stage4_nowink_nohit = {
-      1: transform.scale(image.load('./Boss/Xeroc_mid_pulse1.png').convert_alpha(), (self.__w, self.__h)),
-      2: transform.scale(image.load('./Boss/Xeroc_mid_pulse2.png').convert_alpha(), (self.__w, self.__h)),
+      1: sprite_cache.get('./Boss/Xeroc_mid_pulse1.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      2: sprite_cache.get('./Boss/Xeroc_mid_pulse2.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
     }
     self.__stage4pulse1_nowink_hit = {
-      1: transform.scale(image.load('./Boss/Xeroc_mid_pulse1_hit.png').convert_alpha(), (self.__w, self.__h)),
+      1: sprite_cache.get('./Boss/Xeroc_mid_pulse1_hit.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
     }
     self.__stage4pulse2_nowink_hit = {
-      1: transform.scale(image.load('./Boss/Xeroc_mid_pulse2_hit.png').convert_alpha(), (self.__w, self.__h)),
+      1: sprite_cache.get('./Boss/Xeroc_mid_pulse2_hit.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
     }
     self.__stage4_pulse1_wink_nohit = {
-      1: transform.scale(image.load('./Boss/Xeroc_mid_pulse1_wink1.png').convert_alpha(), (self.__w, self.__h)),
-      2: transform.scale(image.load('./Boss/Xeroc_mid_pulse1_wink2.png').convert_alpha(), (self.__w, self.__h)),
-      3: transform.scale(image.load('./Boss/Xeroc_mid_pulse1_wink3.png').convert_alpha(), (self.__w, self.__h)),
+      1: sprite_cache.get('./Boss/Xeroc_mid_pulse1_wink1.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      2: sprite_cache.get('./Boss/Xeroc_mid_pulse1_wink2.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      3: sprite_cache.get('./Boss/Xeroc_mid_pulse1_wink3.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
     }
     self.__stage4_pulse2_wink_nohit = {
-      1: transform.scale(image.load('./Boss/Xeroc_mid_pulse2_wink1.png').convert_alpha(), (self.__w, self.__h)),
-      2: transform.scale(image.load('./Boss/Xeroc_mid_pulse2_wink2.png').convert_alpha(), (self.__w, self.__h)),
-      3: transform.scale(image.load('./Boss/Xeroc_mid_pulse2_wink3.png').convert_alpha(), (self.__w, self.__h)),
+      1: sprite_cache.get('./Boss/Xeroc_mid_pulse2_wink1.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      2: sprite_cache.get('./Boss/Xeroc_mid_pulse2_wink2.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      3: sprite_cache.get('./Boss/Xeroc_mid_pulse2_wink3.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
     }
     self.__stage4_pulse1_wink_hit = {
-      1: transform.scale(image.load('./Boss/Xeroc_mid_pulse1_hit_wink1.png').convert_alpha(), (self.__w, self.__h)),
-      2: transform.scale(image.load('./Boss/Xeroc_mid_pulse1_hit_wink2.png').convert_alpha(), (self.__w, self.__h)),
-      3: transform.scale(image.load('./Boss/Xeroc_mid_pulse1_hit_wink3.png').convert_alpha(), (self.__w, self.__h)),
+      1: sprite_cache.get('./Boss/Xeroc_mid_pulse1_hit_wink1.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      2: sprite_cache.get('./Boss/Xeroc_mid_pulse1_hit_wink2.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      3: sprite_cache.get('./Boss/Xeroc_mid_pulse1_hit_wink3.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
     }
     self.__stage4_pulse2_wink_hit = {
-      1: transform.scale(image.load('./Boss/Xeroc_mid_pulse2_hit_wink1.png').convert_alpha(), (self.__w, self.__h)),
-      2: transform.scale(image.load('./Boss/Xeroc_mid_pulse2_hit_wink2.png').convert_alpha(), (self.__w, self.__h)),
-      3: transform.scale(image.load('./Boss/Xeroc_mid_pulse2_hit_wink3.png').convert_alpha(), (self.__w, self.__h)),
+      1: sprite_cache.get('./Boss/Xeroc_mid_pulse2_hit_wink1.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      2: sprite_cache.get('./Boss/Xeroc_mid_pulse2_hit_wink2.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
+      3: sprite_cache.get('./Boss/Xeroc_mid_pulse2_hit_wink3.png', (self.__w, self.__h), alpha=True, colorkey=(0, 0, 0)),
     }
     self.__sounds = {
-      1: mixer.Sound('./Soundeffects/undertale-ding.mp3'),
-      2: mixer.Sound('./Soundeffects/EidolonWyrmRoar.mp3'),
-      3: mixer.Sound('./Soundeffects/Terraria_boss_summon.mp3'),
-      4: mixer.Sound('./Soundeffects/wall-of-flesh-terraria.mp3'),
+      1: sound_bank.get('./Soundeffects/undertale-ding.mp3'),
+      2: sound_bank.get('./Soundeffects/EidolonWyrmRoar.mp3'),
+      3: sound_bank.get('./Soundeffects/Terraria_boss_summon.mp3'),
+      4: sound_bank.get('./Soundeffects/wall-of-flesh-terraria.mp3'),
     }
+    self.reset()
+    self.__healthbar = HealthBar(self.__w//2, 80, self.__screen, './Boss/Xeroc_mid.png', 40, 80)
+    self.layer = BOSS
+    self.mask = 0
+    self.strip_background()
+
+  def reset(self) -> None:
+    self.__played1 = False
+    self.__played2 = False
+    self.__played3 = False
+    self.__phase = 1
+    self.__hp = self.__maxhp
+    self.__x = self.__parent_w//2
+    self.__y = -80
+    self.__winktimer = 0
+    self.__hittimer = 0
+    self.__wink = False
+    self.__hit = False
+    self.__alive = True
+    self.__dir = 1
+    self.__curkey = 1
     self.__sprite = self.__stage123sprites_nothit[1]
     self.rect = self.__sprite.get_rect(midtop = (self.__x, self.__y))
     self.__hitbox = Rect((self.__x - self.__w//3.6, self.__y + self.__h//2.5), (self.__w-self.__w//2.4, 100))
     self.__hitbox1 = Rect((self.__x - self.__w//2.25, self.__y + self.__h//3.5), (self.__w-self.__w//11, 40))
     self.__hitbox2 = Rect((self.__hitbox.centerx-self.__w//26, self.__hitbox.midbottom[1]), (38, 190))
-    self.__healthbar = HealthBar(self.__w//2, 80, self.__screen, './Boss/Xeroc_mid.png', 40, 80)
-    self.strip_background()
-    self.__regulate_sounds()
 
   def collision(self) -> None:
     '''Redundant for the Boss Class'''
@@ -914,6 +970,9 @@ class Boss(Entity):
 
   def get_hitbox(self) -> Rect:
     return [self.__hitbox, self.__hitbox1, self.__hitbox2]
+
+  def get_mask(self) -> tuple[mask.Mask, Rect]:
+    return sprite_cache.mask(self.__sprite), self.rect
   
   def logic(self) -> None:
     if self.__y == -80:
@@ -971,7 +1030,7 @@ class Boss(Entity):
           
     elif self.__phase < 4:
       if self.__p.get_timer()%(3*self.__p.fps) == 0:
-          self.__curkey = np.random.choice(self.__stage1_keys)
+          self.__curkey = boss_rng.choice(self.__stage1_keys)
       if not self.__hit:
           self.__sprite = self.__stage123sprites_nothit[self.__curkey]
       else:
@@ -1041,6 +1100,12 @@ class Boss(Entity):
   
   def take_dmg(self, dmg: int) -> None:
     self.__hp -=dmg
+
+  def get_hp(self) -> int|float:
+    return self.__hp
+
+  def set_hp(self, hp: int|float) -> None:
+    self.__hp = hp
   
   def trigger_hurt(self) -> None:
     self.__hit = True
@@ -1067,9 +1132,4 @@ class Boss(Entity):
     for i in self.__stage4_pulse2_wink_hit.values():
       i.set_colorkey((0, 0, 0))
 
-  def __regulate_sounds(self) -> None:
-    self.__sounds[1].set_volume(0.04)
-    self.__sounds[2].set_volume(0.2)
-    self.__sounds[3].set_volume(0.12)
-    self.__sounds[4].set_volume(0.12)
 # _______________________ THE END _________________________________#
\ No newline at end of file
@@ -0,0 +1,66 @@
+import time as tm
+from collections import defaultdict
+import numpy as np
+
+
+class FrameSampler:
+  PHASES = ('event', 'collide', 'logic', 'move', 'draw', 'present')
+
+  def __init__(self) -> None:
+    self.__current = defaultdict(float)
+    self.frames = []
+
+  def add(self, phase: str, seconds: float) -> None:
+    self.__current[phase] += seconds
+
+  def frame(self) -> None:
+    self.__current['frame'] = sum(self.__current.values())
+    self.frames.append(dict(self.__current))
+    self.__current.clear()
+
+  def samples(self, phase: str) -> np.ndarray:
+    return np.array([i.get(phase, 0.0) for i in self.frames])*1000
+
+  def summary(self) -> dict:
+    summary = {}
+    for phase in self.PHASES + ('frame',):
+      ms = self.samples(phase)
+      p50, p95, p99 = np.percentile(ms, (50, 95, 99)) if len(ms) else (0.0, 0.0, 0.0)
+      summary[phase] = {'mean': float(ms.mean()) if len(ms) else 0.0, 'p50': float(p50), 'p95': float(p95), 'p99': float(p99)}
+    return summary
+
+
+class RingSampler:
+  def __init__(self, size: int = 240, phases: tuple[str] = FrameSampler.PHASES) -> None:
+    self.phases = phases
+    self.size = size
+    self.__index = {phase: i for i, phase in enumerate(phases)}
+    self.__buffer = np.zeros((size, len(phases) + 1))
+    self.__current = [0.0]*len(phases)
+    self.__last = None
+    self.count = 0
+
+  def add(self, phase: str, seconds: float) -> None:
+    self.__current[self.__index[phase]] += seconds
+
+  def frame(self) -> None:
+    now = tm.perf_counter()
+    if self.__last is not None:
+      row = self.__buffer[self.count%self.size]
+      row[:-1] = self.__current
+      row[-1] = now - self.__last
+      self.count += 1
+    self.__last = now
+    self.__current = [0.0]*len(self.phases)
+
+  def history(self) -> np.ndarray:
+    if self.count < self.size:
+      return self.__buffer[:self.count]*1000
+    return np.roll(self.__buffer, -(self.count%self.size), axis=0)*1000
+
+  def means(self) -> dict:
+    history = self.history()
+    if not len(history):
+      return {}
+    means = history.mean(axis=0)
+    return dict(zip(self.phases + ('frame',), means.tolist()))
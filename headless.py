@@ -0,0 +1,147 @@
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+import argparse
+import json
+import time as tm
+from pygame import *
+from assets import sprite_cache, sound_bank, AssetBundle
+from engines import GameEngine
+from rng import rng
+from replay import ReplayWriter, ReplayReader
+from tracing import tracer
+from profiling import startup_profiler
+startup_profiler.stop_imports()
+
+
+class ScriptedInput:
+  def __init__(self, path: str) -> None:
+    self.__events = []
+    with open(path) as f:
+      for line in f:
+        line = line.split('#')[0].split()
+        if line:
+          self.__events.append((int(line[0]), int(line[1]), len(line) > 2 and line[2] == 'shoot'))
+    self.__events.sort()
+    self.__next = 0
+    self.__direction = 0
+
+  def __call__(self, engine: GameEngine, tick: int) -> tuple[int, bool]:
+    shoot = False
+    while self.__next < len(self.__events) and self.__events[self.__next][0] <= tick:
+      _, self.__direction, fire = self.__events[self.__next]
+      shoot = shoot or fire
+      self.__next += 1
+    return self.__direction, shoot
+
+
+class IdlePolicy:
+  def __call__(self, engine: GameEngine, tick: int) -> tuple[int, bool]:
+    return 0, False
+
+
+class SweepPolicy:
+  def __init__(self, w: int) -> None:
+    self.__w = w
+    self.__direction = 1
+
+  def __call__(self, engine: GameEngine, tick: int) -> tuple[int, bool]:
+    x = engine.get_player_coords()[0]
+    if x <= 0:
+      self.__direction = 1
+    elif x >= self.__w*0.9:
+      self.__direction = -1
+    return self.__direction, True
+
+
+class RandomPolicy:
+  def __init__(self, hold: int = 20) -> None:
+    self.__rng = rng.stream('policy')
+    self.__hold = hold
+    self.__direction = 0
+
+  def __call__(self, engine: GameEngine, tick: int) -> tuple[int, bool]:
+    if tick%self.__hold == 0:
+      self.__direction = self.__rng.randint(-1, 2)
+    return self.__direction, self.__rng.random() < 0.2
+
+
+POLICIES = {
+  'idle': lambda args: IdlePolicy(),
+  'sweep': lambda args: SweepPolicy(args.width),
+  'random': lambda args: RandomPolicy(),
+}
+
+
+def simulate(engine: GameEngine, policy, ticks: int) -> dict:
+  start = tm.perf_counter()
+  done = 0
+  while done < ticks:
+    engine.control(*policy(engine, done))
+    done += 1
+    if not engine.step():
+      break
+  elapsed = tm.perf_counter() - start
+  report = engine.status()
+  report.update({
+    'ticks': done,
+    'wall_s': round(elapsed, 3),
+    'sim_fps': round(done/elapsed, 1) if elapsed else None,
+    'realtime_x': round(done/engine.fps/elapsed, 2) if elapsed else None,
+  })
+  return report
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description='Run the boss fight without a window, audio or frame cap.')
+  parser.add_argument('--ticks', type=int, help='ticks to simulate (default: 3600, or the whole replay)')
+  parser.add_argument('--fps', type=int, default=60)
+  parser.add_argument('--width', type=int, default=1920)
+  parser.add_argument('--height', type=int, default=1080)
+  parser.add_argument('--seed', type=int, default=0)
+  parser.add_argument('--policy', choices=sorted(POLICIES), default='sweep')
+  parser.add_argument('--script', help='input script: one "<tick> <direction> [shoot]" per line')
+  parser.add_argument('--batched', action='store_true')
+  parser.add_argument('--pixel', action='store_true')
+  parser.add_argument('--record', metavar='PATH', help='write the inputs and seed to a replay log')
+  parser.add_argument('--replay', metavar='PATH', help='play back a replay log instead of a policy')
+  parser.add_argument('--hash', action='store_true', help='store a per-tick state hash when recording')
+  parser.add_argument('--trace', metavar='PATH', help='write a Chrome trace of frame phases and spawns')
+  parser.add_argument('--json', action='store_true')
+  args = parser.parse_args()
+  if args.trace:
+    tracer.start(args.trace)
+  replay = ReplayReader(args.replay) if args.replay else None
+  if replay is not None:
+    args.seed, args.fps, args.batched, args.pixel = replay.seed, replay.fps, replay.batched, replay.pixel
+    args.width, args.height = replay.size
+  if args.ticks is None:
+    args.ticks = replay.ticks if replay is not None else 60*60
+
+  init()
+  screen = display.set_mode((args.width, args.height))
+  sprite_cache.attach_bundle(AssetBundle('./.cache/sprites.bundle', (args.width, args.height)))
+  sound_bank.mute()
+  rng.seed(args.seed)
+  engine = GameEngine(args.width, args.height, (0, 0, 0), args.fps, screen, None, args.batched, args.pixel)
+  engine.replay = replay
+  if args.record:
+    engine.recorder = ReplayWriter(args.record, args.seed, args.fps, (args.width, args.height), args.batched, args.pixel, args.hash)
+  policy = ScriptedInput(args.script) if args.script else POLICIES[args.policy](args)
+  report = simulate(engine, policy, args.ticks)
+  report['seed'] = args.seed
+  if engine.recorder is not None:
+    engine.recorder.close()
+  if replay is not None:
+    report['replayed'] = replay.position
+    report['diverged'] = replay.diverged
+  sprite_cache.save_bundle()
+  tracer.stop()
+  if args.json:
+    print(json.dumps(report))
+  else:
+    for name, value in report.items():
+      print(f'{name:<12}{value}')
+
+
+if __name__ == '__main__':
+  main()
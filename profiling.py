@@ -0,0 +1,69 @@
+import builtins
+import contextlib
+import sys
+import time as tm
+from collections import defaultdict
+
+
+class StartupProfiler:
+  def __init__(self) -> None:
+    self.start = tm.perf_counter()
+    self.__timings = defaultdict(lambda: defaultdict(float))
+    self.__import = None
+    self.__stack = []
+    self.milestones = {}
+
+  def record(self, category: str, name: str, seconds: float) -> None:
+    self.__timings[category][name] += seconds
+
+  @contextlib.contextmanager
+  def section(self, category: str, name: str):
+    start = tm.perf_counter()
+    try:
+      yield
+    finally:
+      self.record(category, name, tm.perf_counter() - start)
+
+  def milestone(self, name: str) -> None:
+    if name not in self.milestones:
+      self.milestones[name] = tm.perf_counter() - self.start
+
+  def __timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+    if level or name in sys.modules:
+      return self.__import(name, globals, locals, fromlist, level)
+    self.__stack.append(0.0)
+    start = tm.perf_counter()
+    try:
+      return self.__import(name, globals, locals, fromlist, level)
+    finally:
+      elapsed = tm.perf_counter() - start
+      children = self.__stack.pop()
+      if self.__stack:
+        self.__stack[-1] += elapsed
+      self.record('import', name, elapsed - children)
+
+  def track_imports(self) -> None:
+    if self.__import is None:
+      self.__import = builtins.__import__
+      builtins.__import__ = self.__timed_import
+
+  def stop_imports(self) -> None:
+    if self.__import is not None:
+      builtins.__import__ = self.__import
+      self.__import = None
+
+  def timings(self, category: str) -> dict:
+    return dict(self.__timings[category])
+
+  def report(self, top: int = 10) -> str:
+    lines = []
+    for name, seconds in self.milestones.items():
+      lines.append(f'{name:<40}{seconds*1000:>9.1f} ms')
+    for category, timings in self.__timings.items():
+      lines.append(f'-- {category} ({sum(timings.values())*1000:.1f} ms)')
+      for name, seconds in sorted(timings.items(), key=lambda i: -i[1])[:top]:
+        lines.append(f'   {name:<37}{seconds*1000:>9.1f} ms')
+    return '\n'.join(lines)
+
+
+startup_profiler = StartupProfiler()
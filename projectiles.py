@@ -0,0 +1,279 @@
+from pygame import *
+import zlib
+import numpy as np
+from assets import sprite_cache, sound_bank
+from rng import spawn_rng, visual_rng
+
+SHOT = 0
+FALLING_STAR = 1
+SHOOTING_STAR = 2
+
+
+class ProjectileStore:
+  FIELDS = {
+    'kind': np.int8,
+    'x': np.float64,
+    'y': np.float64,
+    'step': np.float64,
+    'intercept': np.float64,
+    'slope': np.float64,
+    'hp': np.float64,
+    'timer': np.int32,
+    'angle': np.int32,
+    'variant': np.int16,
+    'hit': np.bool_,
+    'hurt': np.bool_,
+  }
+
+  def __init__(self, w: int, h: int, parent, screen: Surface, capacity: int = 1024) -> None:
+    self.__p = parent
+    self.__screen = screen
+    self.__parent_w = w
+    self.__parent_h = h
+    self.__arrays = {k: np.zeros(capacity, dtype=v) for k, v in self.FIELDS.items()}
+    self.count = 0
+    self.__live = np.zeros(3, dtype=np.int64)
+
+    self.__shot_w, self.__shot_h = w//30, h//20
+    self.__shot_speed = 10
+    self.__shot_dmg = 2
+    self.__shot_hitbox = (self.__shot_w - self.__shot_w//1.5, self.__shot_h - self.__shot_h//8)
+    self.__shot_sprites = [sprite_cache.get(i, (self.__shot_w, self.__shot_h), colorkey=(0, 0, 0)) for i in (
+      './Sprites/Shot.png',
+      './Sprites/ShotState2.png',
+      './Sprites/ShotState3.png',
+      './Sprites/ShotState4.png',
+    )]
+
+    self.__falling_w, self.__falling_h = w//22, h//12
+    self.__falling_speed = 4
+    self.__falling_spin = 12
+    self.__falling_dmg = 5
+    self.__falling_hitbox = self.__falling_w - self.__falling_w//3.5
+    self.__falling_frames = self.__frames(sprite_cache.get('./Sprites/StarProjectile.png', (self.__falling_w, self.__falling_h), colorkey=(0, 0, 0)), self.__falling_spin)
+    self.__falling_hurt_frames = self.__frames(sprite_cache.get('./RRS/StarProjectileHurt.png', (self.__falling_w, self.__falling_h), colorkey=(0, 0, 0)), self.__falling_spin)
+    self.__falling_half = np.array([i.get_size() for i in self.__falling_frames], dtype=np.float64)/2
+
+    self.__shooting_w, self.__shooting_h = w//21, h//11
+    self.__shooting_spin = 19
+    self.__shooting_dmg = 10
+    self.__shooting_hitbox = self.__shooting_w - self.__shooting_w//3.5
+    self.__shooting_frames = [self.__frames(sprite_cache.get(f'./RRS/StarProjectileR{i}.png', (self.__shooting_w, self.__shooting_h), colorkey=(0, 0, 0)), self.__shooting_spin) for i in range(1, 15)]
+    self.__shooting_half = np.array([i.get_size() for i in self.__shooting_frames[0]], dtype=np.float64)/2
+    self.__tails = ((8.5, 30), (5.5, 60), (2.5, 90))
+    self.__trails = {}
+
+    self.__sounds = {
+      'ding': sound_bank.get('./Soundeffects/undertale-ding.mp3'),
+      'squeak': sound_bank.get('./Soundeffects/squeak.mp3'),
+      'mana': sound_bank.get('./Soundeffects/Mana_star.mp3'),
+    }
+
+  def __frames(self, sprite: Surface, step: int) -> list[Surface]:
+    sheet = sprite_cache.rotations(sprite, step)
+    return [sheet[angle] for angle in range(0, 360 + 2*step, step)]
+
+  def __len__(self) -> int:
+    return self.count
+
+  def live(self, kind: int) -> int:
+    return int(self.__live[kind])
+
+  def digest(self, value: int = 0) -> int:
+    for k in ('kind', 'x', 'y', 'hp'):
+      value = zlib.crc32(self.__arrays[k][:self.count].tobytes(), value)
+    return value
+
+  def __reserve(self, kind: int, n: int) -> slice:
+    needed = self.count + n
+    capacity = len(self.__arrays['kind'])
+    if needed > capacity:
+      capacity = max(needed, 2*capacity)
+      for k, v in self.__arrays.items():
+        grown = np.zeros(capacity, dtype=v.dtype)
+        grown[:self.count] = v[:self.count]
+        self.__arrays[k] = grown
+    span = slice(self.count, needed)
+    for v in self.__arrays.values():
+      v[span] = 0
+    self.__arrays['kind'][span] = kind
+    self.count = needed
+    self.__live[kind] += n
+    return span
+
+  def spawn_shot(self, midtop: tuple[int]) -> None:
+    span = self.__reserve(SHOT, 1)
+    self.__arrays['x'][span], self.__arrays['y'][span] = midtop
+
+  def spawn_falling(self, n: int = 1) -> None:
+    span = self.__reserve(FALLING_STAR, n)
+    a = self.__arrays
+    a['x'][span] = spawn_rng.integers(0, self.__parent_w, n)
+    a['y'][span] = spawn_rng.integers(-self.__falling_h - 10, -self.__falling_h, n)
+    a['hp'][span] = 6
+    a['timer'][span] = self.__p.fps//12
+
+  def spawn_shooting(self, player_coords: tuple[int], n: int = 1) -> None:
+    span = self.__reserve(SHOOTING_STAR, n)
+    a = self.__arrays
+    w = self.__shooting_w
+    starts = np.concatenate((np.arange(-w - 30, -w), np.arange(self.__parent_w + w, self.__parent_w + w + 30)))
+    x = spawn_rng.choices(starts, n).astype(np.float64)
+    y = spawn_rng.integers(0, self.__parent_h//2, n).astype(np.float64)
+    px, py = player_coords
+    slope = (py - y)/(px - x)
+    a['x'][span] = x
+    a['y'][span] = y
+    a['slope'][span] = slope
+    a['intercept'][span] = py - slope*px
+    a['step'][span] = np.where(x + w/2 < px, 6, -6)
+    a['hp'][span] = np.inf
+    a['variant'][span] = visual_rng.integers(0, 14, n)
+
+  def __hitboxes(self, idx: np.ndarray) -> tuple[np.ndarray]:
+    a = self.__arrays
+    kind, x, y, angle = a['kind'][idx], a['x'][idx], a['y'][idx], a['angle'][idx]
+    half_w = np.where(kind == SHOT, self.__shot_hitbox[0]/2, np.where(kind == FALLING_STAR, self.__falling_hitbox/2, self.__shooting_hitbox/2))
+    half_h = np.where(kind == SHOT, self.__shot_hitbox[1]/2, half_w)
+    cx = np.where(kind == SHOT, x - 2, x)
+    cy = np.where(kind == SHOT, y - half_h, y)
+    shooting = kind == SHOOTING_STAR
+    if shooting.any():
+      half = self.__shooting_half[angle[shooting]//self.__shooting_spin]
+      cx[shooting] += half[:, 0]
+      cy[shooting] += half[:, 1]
+    return cx - half_w, cy - half_h, cx + half_w, cy + half_h
+
+  def collide(self, player, boss) -> None:
+    n = self.count
+    a = self.__arrays
+    kind, hit = a['kind'][:n], a['hit'][:n]
+    stars = np.flatnonzero(kind != SHOT)
+    shots = np.flatnonzero((kind == SHOT) & ~hit)
+    if shots.size and stars.size:
+      sx1, sy1, sx2, sy2 = self.__hitboxes(shots)
+      ex1, ey1, ex2, ey2 = self.__hitboxes(stars)
+      overlap = (sx1[:, None] < ex2) & (sx2[:, None] > ex1) & (sy1[:, None] < ey2) & (sy2[:, None] > ey1)
+      hits = overlap.any(axis=1)
+      if hits.any():
+        targets = stars[overlap.argmax(axis=1)[hits]]
+        hit[shots[hits]] = True
+        np.subtract.at(a['hp'], targets, self.__shot_dmg)
+        falling = targets[kind[targets] == FALLING_STAR]
+        a['hurt'][falling] = True
+        if falling.size:
+          self.__sounds['ding'].play()
+        if falling.size < targets.size:
+          self.__sounds['squeak'].play()
+        shots = shots[~hits]
+    if shots.size:
+      boxes = boss.get_hitbox()
+      boxes = boxes if type(boxes) == list else [boxes]
+      sx1, sy1, sx2, sy2 = self.__hitboxes(shots)
+      for i, x1, y1, x2, y2 in zip(shots.tolist(), sx1.tolist(), sy1.tolist(), sx2.tolist(), sy2.tolist()):
+        if Rect(x1, y1, x2 - x1, y2 - y1).collidelist(boxes) != -1:
+          boss.take_dmg(self.__shot_dmg)
+          hit[i] = True
+          boss.trigger_hurt()
+    enemies = np.flatnonzero((kind != SHOT) & ~hit)
+    if enemies.size:
+      box = player.get_hitbox()
+      ex1, ey1, ex2, ey2 = self.__hitboxes(enemies)
+      touching = enemies[(ex1 < box.right) & (ex2 > box.left) & (ey1 < box.bottom) & (ey2 > box.top)]
+      for i in touching.tolist():
+        player.take_dmg(self.__falling_dmg if kind[i] == FALLING_STAR else self.__shooting_dmg)
+        hit[i] = True
+        player.trigger_hurt()
+
+  def logic(self, timer: int) -> None:
+    n = self.count
+    a = self.__arrays
+    kind, y, hit, hurt, t, angle = a['kind'][:n], a['y'][:n], a['hit'][:n], a['hurt'][:n], a['timer'][:n], a['angle'][:n]
+    shots = kind == SHOT
+    falling = kind == FALLING_STAR
+    shooting = kind == SHOOTING_STAR
+
+    t[shots & hit] += 1
+    active = ~(shots & ((t > 9) | (y < -self.__shot_h - 5)))
+
+    top = y - self.__falling_half[angle//self.__falling_spin, 1]
+    active &= ~(falling & ((top > self.__parent_h) | (a['hp'][:n] <= 0)))
+    hurting = falling & hurt
+    cooling = hurting & (t > 0)
+    recovered = hurting & (t <= 0)
+    t[cooling] -= 1
+    hurt[recovered] = False
+    t[recovered] = self.__p.fps//12
+
+    active &= ~(shooting & (y > self.__parent_h))
+    angle[(kind != SHOT) & (angle >= 360)] = 0
+    if timer%(self.__p.fps//3) == 0 and self.__live[SHOOTING_STAR]:
+      self.__sounds['mana'].play()
+
+    if not active.all():
+      keep = np.flatnonzero(active)
+      for v in self.__arrays.values():
+        v[:keep.size] = v[keep]
+      self.count = keep.size
+      self.__live = np.bincount(a['kind'][:self.count], minlength=3)
+
+  def move(self, timer: int) -> None:
+    n = self.count
+    a = self.__arrays
+    kind, x, y, angle = a['kind'][:n], a['x'][:n], a['y'][:n], a['angle'][:n]
+    y[(kind == SHOT) & ~a['hit'][:n]] -= self.__shot_speed
+
+    falling = kind == FALLING_STAR
+    if timer%3 == 0:
+      angle[falling] += self.__falling_spin
+    y[falling] += self.__falling_speed
+
+    shooting = kind == SHOOTING_STAR
+    if timer%(self.__p.fps//15) == 0:
+      a['variant'][:n][shooting] = (timer//(self.__p.fps//16))%14
+    if timer%4 == 0:
+      angle[shooting] += self.__shooting_spin
+    x[shooting] += a['step'][:n][shooting]
+    y[shooting] = a['intercept'][:n][shooting] + a['slope'][:n][shooting]*x[shooting]
+
+  def __trail(self, variant: int, frame: int, alpha: int) -> Surface:
+    key = (variant, frame, alpha)
+    sprite = self.__trails.get(key)
+    if sprite is None:
+      sprite = self.__shooting_frames[variant][frame].copy()
+      sprite.set_colorkey(sprite.get_colorkey(), RLEACCEL)
+      sprite.set_alpha(alpha, RLEACCEL)
+      self.__trails[key] = sprite
+    return sprite
+
+  def draw(self) -> None:
+    n = self.count
+    a = self.__arrays
+    kind, x, y, angle = a['kind'][:n], a['x'][:n], a['y'][:n], a['angle'][:n]
+    blits = []
+
+    idx = np.flatnonzero(kind == FALLING_STAR)
+    if idx.size:
+      frame = angle[idx]//self.__falling_spin
+      half = self.__falling_half[frame]
+      for f, hurt, left, top in zip(frame.tolist(), a['hurt'][idx].tolist(), (x[idx] - half[:, 0]).tolist(), (y[idx] - half[:, 1]).tolist()):
+        blits.append(((self.__falling_hurt_frames if hurt else self.__falling_frames)[f], (left, top)))
+
+    idx = np.flatnonzero(kind == SHOOTING_STAR)
+    if idx.size:
+      frame = angle[idx]//self.__shooting_spin
+      for v, f, left, top, step, intercept, slope in zip(a['variant'][idx].tolist(), frame.tolist(), x[idx].tolist(), y[idx].tolist(), a['step'][idx].tolist(), a['intercept'][idx].tolist(), a['slope'][idx].tolist()):
+        for offset, alpha in self.__tails:
+          tx = left - step*offset
+          blits.append((self.__trail(v, f, alpha), (tx, intercept + slope*tx)))
+        blits.append((self.__shooting_frames[v][f], (left, top)))
+
+    idx = np.flatnonzero(kind == SHOT)
+    if idx.size:
+      for hit, t, sx, sy in zip(a['hit'][idx].tolist(), a['timer'][idx].tolist(), x[idx].tolist(), y[idx].tolist()):
+        if not hit:
+          blits.append((self.__shot_sprites[0], (sx - self.__shot_w//2, sy - self.__shot_h)))
+        elif t <= 9:
+          blits.append((self.__shot_sprites[1 + (t > 3) + (t > 6)], (sx, sy - self.__shot_h)))
+
+    self.__screen.blits(blits, doreturn=False)
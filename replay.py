@@ -0,0 +1,89 @@
+import struct
+import zlib
+import numpy as np
+
+MAGIC = b'AXRP'
+VERSION = 1
+HEADER = struct.Struct('<4sBBHHHIB')
+HASHED = 1
+BATCHED = 2
+PIXEL = 4
+
+
+def pack_input(direction: int, shoot: bool) -> int:
+  return (direction + 1) | (4 if shoot else 0)
+
+def unpack_input(value: int) -> tuple[int, bool]:
+  return (value & 3) - 1, bool(value & 4)
+
+
+class ReplayWriter:
+  def __init__(self, path: str, seed: int, fps: int, size: tuple[int], batched: bool = False, pixel: bool = False, hashed: bool = False) -> None:
+    self.path = path
+    self.seed = seed
+    self.fps = fps
+    self.size = size
+    self.hashed = hashed
+    self.__flags = (HASHED if hashed else 0) | (BATCHED if batched else 0) | (PIXEL if pixel else 0)
+    self.__inputs = bytearray()
+    self.__hashes = []
+    self.__closed = False
+
+  @property
+  def ticks(self) -> int:
+    return len(self.__inputs)
+
+  def write(self, direction: int, shoot: bool, digest: int|None = None) -> None:
+    self.__inputs.append(pack_input(direction, shoot))
+    if self.hashed:
+      self.__hashes.append(digest)
+
+  def close(self) -> None:
+    if self.__closed:
+      return
+    self.__closed = True
+    seed = self.seed.to_bytes((self.seed.bit_length() + 7)//8 or 1, 'little')
+    body = bytes(self.__inputs)
+    if self.hashed:
+      body += np.asarray(self.__hashes, dtype='<u4').tobytes()
+    with open(self.path, 'wb') as f:
+      f.write(HEADER.pack(MAGIC, VERSION, self.__flags, self.fps, *self.size, self.ticks, len(seed)))
+      f.write(seed)
+      f.write(zlib.compress(body, 9))
+
+
+class ReplayReader:
+  def __init__(self, path: str) -> None:
+    self.path = path
+    with open(path, 'rb') as f:
+      data = f.read()
+    magic, version, flags, self.fps, w, h, self.ticks, seed_len = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+      raise ValueError(f'{path} is not a version {VERSION} replay')
+    self.size = (w, h)
+    self.seed = int.from_bytes(data[HEADER.size:HEADER.size + seed_len], 'little')
+    self.hashed = bool(flags & HASHED)
+    self.batched = bool(flags & BATCHED)
+    self.pixel = bool(flags & PIXEL)
+    body = zlib.decompress(data[HEADER.size + seed_len:])
+    self.__inputs = body[:self.ticks]
+    self.__hashes = np.frombuffer(body[self.ticks:], dtype='<u4').tolist() if self.hashed else []
+    self.position = 0
+    self.diverged = None
+
+  @property
+  def done(self) -> bool:
+    return self.position >= self.ticks
+
+  def read(self) -> tuple[int, bool]:
+    value = self.__inputs[self.position]
+    self.position += 1
+    return unpack_input(value)
+
+  def check(self, digest: int) -> bool:
+    tick = self.position - 1
+    if self.__hashes[tick] == digest:
+      return True
+    if self.diverged is None:
+      self.diverged = tick
+    return False
@@ -0,0 +1,78 @@
+import zlib
+import numpy as np
+
+
+class Stream:
+  def __init__(self, name: str, block: int = 1024) -> None:
+    self.name = name
+    self.__block = block
+    self.__generator = None
+    self.__values = []
+    self.__drawn = 0
+
+  def reseed(self, seed: np.random.SeedSequence) -> None:
+    self.__generator = np.random.Generator(np.random.PCG64(seed))
+    self.__values = []
+    self.__drawn = 0
+
+  @property
+  def draws(self) -> int:
+    return self.__drawn - len(self.__values)
+
+  def random(self) -> float:
+    values = self.__values
+    if not values:
+      values = self.__values = self.__generator.random(self.__block).tolist()[::-1]
+      self.__drawn += self.__block
+    return values.pop()
+
+  def randint(self, low: int|float, high: int|float) -> int:
+    low = int(low)
+    return low + int(self.random()*(int(high) - low))
+
+  def choice(self, options: list|tuple):
+    return options[int(self.random()*len(options))]
+
+  def integers(self, low: int, high: int, n: int) -> np.ndarray:
+    self.__drawn += n
+    return self.__generator.integers(low, high, n)
+
+  def choices(self, options: list|tuple|np.ndarray, n: int) -> np.ndarray:
+    return np.asarray(options)[self.integers(0, len(options), n)]
+
+
+class RandomService:
+  def __init__(self, seed: int|None = None, block: int = 1024) -> None:
+    self.__block = block
+    self.__streams = {}
+    self.seed(seed)
+
+  def seed(self, seed: int|None = None) -> int:
+    self.__root = np.random.SeedSequence(seed)
+    for stream in self.__streams.values():
+      stream.reseed(self.__child(stream.name))
+    return self.__root.entropy
+
+  def __child(self, name: str) -> np.random.SeedSequence:
+    return np.random.SeedSequence(self.__root.entropy, spawn_key=(zlib.crc32(name.encode()),))
+
+  @property
+  def entropy(self) -> int:
+    return self.__root.entropy
+
+  def stream(self, name: str) -> Stream:
+    stream = self.__streams.get(name)
+    if stream is None:
+      stream = Stream(name, self.__block)
+      stream.reseed(self.__child(name))
+      self.__streams[name] = stream
+    return stream
+
+  def report(self) -> dict:
+    return {name: stream.draws for name, stream in self.__streams.items()}
+
+
+rng = RandomService()
+spawn_rng = rng.stream('spawning')
+visual_rng = rng.stream('visuals')
+boss_rng = rng.stream('boss')
@@ -0,0 +1,117 @@
+from pygame import *
+from assets import font_cache
+
+
+class Typewriter:
+  def __init__(self, typeface: font.Font, c: tuple[int], bg: tuple[int], width: int|None, slots: int = 4) -> None:
+    self.__font = typeface
+    self.__c = c
+    self.__bg = bg
+    self.__width = width
+    self.__slots = slots
+    self.__height = typeface.get_height()
+    self.__states = []
+    self.rasterized = 0
+
+  def __wrap(self, lines: list[str], new: str) -> list[str]:
+    lines = lines[:-1] + [lines[-1]]
+    for ch in new:
+      line = lines[-1] + ch
+      if self.__width is not None and ch != ' ' and len(line) > 1 and self.__font.size(line)[0] > self.__width:
+        space = line.rfind(' ')
+        if space > 0:
+          lines[-1], line = line[:space], line[space + 1:]
+        else:
+          line = ch
+        lines.append(line)
+      else:
+        lines[-1] = line
+    return lines
+
+  def __render(self, line: list, text: str) -> None:
+    shown, sprite, used = line
+    if text.startswith(shown):
+      new = text[len(shown):]
+    else:
+      new, used = text, 0
+      sprite.fill(self.__bg)
+    needed = self.__font.size(text)[0]
+    if needed > sprite.get_width():
+      grown = Surface((needed, self.__height))
+      grown.fill(self.__bg)
+      grown.blit(sprite, (0, 0), Rect(0, 0, used, self.__height))
+      sprite = grown
+    if new:
+      sprite.blit(self.__font.render(new, True, self.__c, self.__bg), (self.__font.size(text[:len(text) - len(new)])[0], 0))
+      self.rasterized += len(new)
+    line[:] = [text, sprite, needed]
+
+  def __new_line(self) -> list:
+    sprite = Surface((self.__width or 1, self.__height))
+    sprite.fill(self.__bg)
+    return ['', sprite, 0]
+
+  def __state_for(self, text: str) -> list:
+    best = None
+    for state in self.__states:
+      if text.startswith(state[0]) and (best is None or len(state[0]) > len(best[0])):
+        best = state
+    if best is None:
+      if len(self.__states) >= self.__slots:
+        self.__states.pop(0)
+      best = ['', [''], [self.__new_line()]]
+    else:
+      self.__states.remove(best)
+    self.__states.append(best)
+    return best
+
+  def layout(self, text: str) -> list[str]:
+    state = self.__state_for(text)
+    shown, lines, rendered = state
+    if text != shown:
+      keep = len(lines) - 1
+      lines = lines[:keep] + self.__wrap(lines[keep:], text[len(shown):])
+      for i in range(keep, len(lines)):
+        if i == len(rendered):
+          rendered.append(self.__new_line())
+        self.__render(rendered[i], lines[i])
+      state[0], state[1] = text, lines
+    return lines
+
+  def draw(self, screen: Surface, text: str, center: tuple[int]) -> None:
+    lines = self.layout(text)
+    rendered = self.__states[-1][2]
+    top = center[1] - self.__height*len(lines)/2
+    for i in range(len(lines)):
+      _, sprite, used = rendered[i]
+      rect = Rect(0, 0, used, self.__height)
+      rect.center = (center[0], top + self.__height*i + self.__height/2)
+      screen.blit(sprite, rect, Rect(0, 0, used, self.__height))
+
+
+class TextRenderer:
+  def __init__(self) -> None:
+    self.__typewriters = {}
+
+  def typewriter(self, file: str, size: int, c: tuple[int], bg: tuple[int] = (0, 0, 0), width: int|None = None) -> Typewriter:
+    key = (file, size, tuple(c), tuple(bg), None if width is None else int(width))
+    typewriter = self.__typewriters.get(key)
+    if typewriter is None:
+      typewriter = Typewriter(font_cache.get(file, size), c, bg, key[4])
+      self.__typewriters[key] = typewriter
+    return typewriter
+
+  def draw(self, screen: Surface, text: str, file: str, size: int, c: tuple[int], center: tuple[int], bg: tuple[int] = (0, 0, 0), width: int|None = None) -> None:
+    self.typewriter(file, size, c, bg, width).draw(screen, text, center)
+
+  def report(self) -> dict:
+    return {
+      'typewriters': len(self.__typewriters),
+      'rasterized_chars': sum(i.rasterized for i in self.__typewriters.values()),
+    }
+
+  def clear(self) -> None:
+    self.__typewriters.clear()
+
+
+text_renderer = TextRenderer()
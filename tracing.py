@@ -0,0 +1,93 @@
+import atexit
+import contextlib
+import json
+import os
+import threading
+import time as tm
+from collections import deque
+
+
+class Tracer:
+  def __init__(self, interval: float = 0.5) -> None:
+    self.enabled = False
+    self.written = 0
+    self.__interval = interval
+    self.__events = deque()
+    self.__origin = tm.perf_counter()
+    self.__pid = os.getpid()
+    self.__file = None
+    self.__thread = None
+    self.__stop = threading.Event()
+    self.__first = True
+
+  def start(self, path: str) -> None:
+    if self.enabled:
+      return
+    self.__file = open(path, 'w')
+    self.__file.write('[\n')
+    self.__first = True
+    self.__events.append(('M', 'process_name', '', 0.0, 0.0, {'name': 'AsteroidsEX'}, threading.get_ident()))
+    self.__events.append(('M', 'thread_name', '', 0.0, 0.0, {'name': 'main'}, threading.get_ident()))
+    self.__stop.clear()
+    self.enabled = True
+    self.__thread = threading.Thread(target=self.__run, name='trace-writer', daemon=True)
+    self.__thread.start()
+    atexit.register(self.stop)
+
+  def stop(self) -> None:
+    if not self.enabled:
+      return
+    self.enabled = False
+    self.__stop.set()
+    self.__thread.join()
+    self.__flush()
+    self.__file.write('\n]\n')
+    self.__file.close()
+
+  def complete(self, name: str, category: str, start: float, end: float, args: dict|None = None) -> None:
+    if self.enabled:
+      self.__events.append(('X', name, category, start, end - start, args, threading.get_ident()))
+
+  def instant(self, name: str, category: str, args: dict|None = None) -> None:
+    if self.enabled:
+      self.__events.append(('i', name, category, tm.perf_counter(), 0.0, args, threading.get_ident()))
+
+  @contextlib.contextmanager
+  def span(self, name: str, category: str, args: dict|None = None):
+    if not self.enabled:
+      yield
+      return
+    start = tm.perf_counter()
+    try:
+      yield
+    finally:
+      self.complete(name, category, start, tm.perf_counter(), args)
+
+  def __run(self) -> None:
+    while not self.__stop.wait(self.__interval):
+      self.__flush()
+
+  def __flush(self) -> None:
+    lines = []
+    events = self.__events
+    while events:
+      phase, name, category, start, duration, args, thread = events.popleft()
+      event = {'ph': phase, 'name': name, 'pid': self.__pid, 'tid': thread}
+      if phase != 'M':
+        event['cat'] = category
+        event['ts'] = round((start - self.__origin)*1e6, 3)
+      if phase == 'X':
+        event['dur'] = round(duration*1e6, 3)
+      elif phase == 'i':
+        event['s'] = 't'
+      if args:
+        event['args'] = args
+      lines.append(json.dumps(event))
+    if lines:
+      self.__file.write(('' if self.__first else ',\n') + ',\n'.join(lines))
+      self.__file.flush()
+      self.__first = False
+      self.written += len(lines)
+
+
+tracer = Tracer()
@@ -1,5 +1,6 @@
 from pygame import *
 import numpy as np
+from assets import sprite_cache
 
 def linear_coefficients(player_coords: tuple[int]|list[int], object_coords:tuple[int]|list[int]) -> np.ndarray:
   A = np.array([[1, player_coords[0]], [1, object_coords[0]]])
@@ -62,7 +63,7 @@ class HealthBar:
     self.__current_green_left_border = self.__w
     self.__icon_w = iconw
     self.__icon_h = iconh
-    self.__icon = transform.scale(image.load(icon).convert_alpha(), (self.__icon_w, self.__icon_h))
+    self.__icon = sprite_cache.get(icon, (self.__icon_w, self.__icon_h), alpha=True, colorkey=(0, 0, 0))
     self.__icon.set_colorkey((0, 0, 0))
     
   def update(self, percent: float) -> None:
@@ -81,5 +82,46 @@ class HealthBar:
       draw.rect(self.__screen, (0, 128, 0), Rect((0+10+self.__icon_w+offset_x, 0+10+offset_y), (self.__current_green_left_border, self.__h)), border_bottom_left_radius=5, border_top_left_radius=5)
       draw.rect(self.__screen, (64, 0, 0), Rect((0+10+self.__icon_w+self.__current_green_left_border+offset_x, 0+10+offset_y), (self.__w-self.__current_green_left_border, self.__h)), border_top_right_radius=5, border_bottom_right_radius=5)
     draw.rect(self.__screen, (255, 255, 255), Rect((0+10+self.__icon_w+offset_x, 0+10+offset_y), (self.__w, self.__h)), width=2, border_radius=5)
-  
-  
+
+
+class FrameOverlay:
+  def __init__(self, screen: Surface, sampler, font: font.Font, refresh: int = 15, budget_ms: float = 1000/60) -> None:
+    self.__screen = screen
+    self.sampler = sampler
+    self.__font = font
+    self.__refresh = refresh
+    self.__budget = budget_ms
+    self.__w = 360
+    self.__line = font.get_linesize()
+    self.__spark_h = 60
+    self.__lines = []
+    self.__panel = None
+    self.__drawn = 0
+
+  def __render(self, counts: dict) -> None:
+    means = self.sampler.means()
+    frame = means.get('frame', 0.0)
+    text = [f'frame {frame:6.2f} ms  {1000/frame if frame else 0:5.0f} fps']
+    text += [f'{phase:<8}{means.get(phase, 0.0):6.2f} ms' for phase in self.sampler.phases]
+    text += [f'{name:<16}{value}' for name, value in counts.items()]
+    self.__lines = [self.__font.render(i, True, (255, 255, 255)) for i in text]
+    self.__panel = Surface((self.__w, self.__line*len(text) + self.__spark_h + 20), SRCALPHA)
+    self.__panel.fill((0, 0, 0, 160))
+
+  def draw(self, counts: dict) -> None:
+    if self.__drawn%self.__refresh == 0 or self.__panel is None:
+      self.__render(counts)
+    self.__drawn += 1
+    x, y = self.__screen.get_width() - self.__w - 10, 10
+    self.__screen.blit(self.__panel, (x, y))
+    for i, line in enumerate(self.__lines):
+      self.__screen.blit(line, (x + 8, y + 4 + i*self.__line))
+    top = y + 10 + self.__line*len(self.__lines)
+    bottom = top + self.__spark_h
+    scale = self.__spark_h/(2*self.__budget)
+    draw.line(self.__screen, (255, 64, 64), (x + 8, bottom - self.__budget*scale), (x + self.__w - 8, bottom - self.__budget*scale))
+    history = self.sampler.history()[:, -1]
+    if len(history) > 1:
+      step = (self.__w - 16)/(self.sampler.size - 1)
+      points = [(x + 8 + i*step, bottom - min(ms, 2*self.__budget)*scale) for i, ms in enumerate(history.tolist())]
+      draw.lines(self.__screen, (64, 255, 64), False, points)